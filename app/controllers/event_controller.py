@@ -1,6 +1,8 @@
-from typing import List, Dict, Set
-from app.services.user_service import UserService
+from typing import List, Dict, Optional, Set, Tuple
+from datetime import date, datetime
+from app.models.event import Event, to_timestamp
 from app.services.event_service import EventService
+from app.services.metrics_service import Histogram, MetricsService
 
 class EventController:
     TIMEFRAME_HEADERS: Dict[str, str] = {
@@ -23,15 +25,23 @@ Available timeframes:
 !events this-month - Current month's events
 !events next-month - Next month's events"""
 
-    def __init__(self):
-        self.user_service = UserService()
+    def __init__(self, stage_seconds: Optional[Histogram] = None):
         self.event_service = EventService()
+        self.stage_seconds = stage_seconds or MetricsService().webhook_stage_seconds
+        # time_frame -> ((day, event data version), valid until timestamp, rendered response)
+        self._response_cache: Dict[str, Tuple[Tuple[date, int], float, str]] = {}
+
+    @staticmethod
+    def _status_boundary(events: List[Event], now: int) -> float:
+        """Returns the next time one of the events turns Ongoing or Finished"""
+        boundaries = [timestamp
+                      for event in events
+                      for timestamp in (event.start_timestamp, event.end_timestamp)
+                      if timestamp > now]
+        return min(boundaries, default=float('inf'))
 
     def list_events(self, args: List[str], wa_id: str, phone_number: str) -> str:
         """Lists events based on the specified timeframe"""
-        # Get the user by WhatsApp ID
-        user = self.user_service.get_user_by_wa_id(wa_id)
-
         # Parse timeframe argument if provided
         time_frame = args[0] if args else 'today'  # default to today's events
 
@@ -40,28 +50,46 @@ Available timeframes:
             return f"""❌ Invalid timeframe: {time_frame}
 {self.HELP_TEXT}"""
 
+        # Serve the rendered response from memory while the day, the stored
+        # events and the status of every listed event are unchanged
+        now = datetime.now()
+        now_timestamp = to_timestamp(now)
+        self.event_service.reload_if_changed()
+        cache_key = (now.date(), self.event_service.version)
+
+        cached = self._response_cache.get(time_frame)
+        if cached and cached[0] == cache_key and now_timestamp < cached[1]:
+            return cached[2]
+
+        response, events = self._render_events(time_frame)
+        self._response_cache[time_frame] = (cache_key, self._status_boundary(events, now_timestamp), response)
+        return response
+
+    def _render_events(self, time_frame: str) -> Tuple[str, List[Event]]:
+        """Renders the event list of a timeframe, returning the response and the listed events"""
         try:
             events = self.event_service.list_events(time_frame)
 
             if not events:
                 return f"""📅 No Events Found
 No events scheduled for the selected time frame.
-{self.HELP_TEXT}"""
+{self.HELP_TEXT}""", events
 
-            # Build response with header and events
-            response = f"{self.TIMEFRAME_HEADERS.get(time_frame)}\n"
+            with self.stage_seconds.time('render'):
+                # Build response with header and events
+                response = f"{self.TIMEFRAME_HEADERS.get(time_frame)}\n"
 
-            # Add events with emojis and formatting
-            for i, event in enumerate(events, 1):
-                response += f"\n{i}. {event.format_detailed()}"
+                # Add events with emojis and formatting
+                for i, event in enumerate(events, 1):
+                    response += f"\n{i}. {event.format_detailed()}"
 
-            # Add help text footer
-            response += f"\n{self.HELP_TEXT}"
+                # Add help text footer
+                response += f"\n{self.HELP_TEXT}"
 
-            return response
+            return response, events
 
         except ValueError as e:
             return f"""📅 No Events Found
 
 {str(e)}
-{self.HELP_TEXT}"""
\ No newline at end of file
+{self.HELP_TEXT}""", []
\ No newline at end of file
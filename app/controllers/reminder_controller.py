@@ -1,5 +1,6 @@
 # reminder_controller.py
-from typing import List
+from typing import List, Optional
+from app.models.request_context import RequestContext
 from app.services.validation_service import ValidationService
 from app.services.user_service import UserService
 
@@ -9,7 +10,8 @@ class ReminderController:
         self.validation_service = ValidationService()
         self.user_service = UserService()
 
-    def reminder(self, args: List[str], wa_id: str, phone_number: str) -> str:
+    def reminder(self, args: List[str], wa_id: str, phone_number: str,
+                 context: Optional[RequestContext] = None) -> str:
         """Handle reminder time setting"""
         if not args:
             return f"""⚠️ Missing Reminder Time
@@ -28,8 +30,8 @@ Valid times: 5, 10, or 15 minutes"""
 The reminder time must be either 5, 10, or 15 minutes.
 Example: !reminder 10"""
 
-        # Get user and update reminder
-        user = self.user_service.get_user_by_wa_id(wa_id)
+        # Get user (already resolved by the router) and update reminder
+        user = context.user if context else self.user_service.get_user_by_wa_id(wa_id)
         self.user_service.update_reminder(user.email, int(time_str))
 
         return f"""✅ Reminder Set Successfully
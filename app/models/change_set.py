@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import List
+from app.models.event import Event
+
+
+@dataclass
+class ChangeSet:
+    """Events touched by a single mutation, so storage can persist just those rows"""
+    added: List[Event] = field(default_factory=list)
+    updated: List[Event] = field(default_factory=list)
+    removed: List[Event] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
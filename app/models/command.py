@@ -1,10 +1,25 @@
-from typing import Callable
+import inspect
+from typing import Callable, Optional, Tuple
 
 
 class Command:
-    def __init__(self, name: str, handler: Callable, min_args: int, max_args: int, help_text: str):
+    def __init__(self, name: str, handler: Callable, min_args: int, max_args: int, help_text: str,
+                 rate_limit: Optional[Tuple[int, float]] = None):
         self.name = name
         self.handler = handler
         self.min_args = min_args
         self.max_args = max_args
-        self.help_text = help_text
\ No newline at end of file
+        self.help_text = help_text
+        self.rate_limit = rate_limit  # (max calls, per seconds) per sender, None for no extra limit
+        self.accepts_context = self._accepts_context(handler)
+
+    @staticmethod
+    def _accepts_context(handler: Callable) -> bool:
+        """Whether the handler takes the RequestContext as a `context` keyword argument"""
+        try:
+            parameters = inspect.signature(handler).parameters
+        except (TypeError, ValueError):
+            return False
+        return 'context' in parameters or any(
+            parameter.kind == inspect.Parameter.VAR_KEYWORD for parameter in parameters.values()
+        )
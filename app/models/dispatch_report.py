@@ -0,0 +1,41 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from app.models.reminder import Reminder
+
+
+@dataclass
+class DispatchResult:
+    reminder: Reminder
+    latency: float  # seconds from the start of the batch until the send finished
+    error: Optional[str] = None  # None when the reminder was sent
+
+    @property
+    def sent(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class DispatchReport:
+    results: List[DispatchResult] = field(default_factory=list)
+    groups: int = 0  # distinct (event, offset) messages rendered
+    elapsed: float = 0.0  # seconds for the whole batch
+
+    @property
+    def sent(self) -> int:
+        return sum(1 for result in self.results if result.sent)
+
+    @property
+    def failed(self) -> List[DispatchResult]:
+        """Results for reminders that could not be sent, with the reason"""
+        return [result for result in self.results if not result.sent]
+
+    @property
+    def throughput(self) -> float:
+        """Reminders sent per second"""
+        return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+    def latency_percentile(self, share: float) -> float:
+        latencies = sorted(result.latency for result in self.results)
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(len(latencies) * share))]
@@ -1,13 +1,59 @@
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import lru_cache
 import re
+import sys
 import uuid
 from typing import Literal
 
 SourceType = Literal["better-calendar", "google", "calendly"]
 
-@dataclass
+DATE_FORMAT = "%d.%m.%Y"
+TIME_FORMAT = "%H:%M"
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_timestamp(value: datetime) -> int:
+    """Converts a naive (wall clock) datetime to whole seconds since the epoch"""
+    return int((value - _EPOCH).total_seconds())
+
+
+@lru_cache(maxsize=8192)
+def _parse_date(date: str) -> int:
+    return to_timestamp(datetime.strptime(date, DATE_FORMAT))
+
+
+@lru_cache(maxsize=2048)
+def _parse_time(time: str) -> int:
+    parsed = datetime.strptime(time, TIME_FORMAT)
+    return parsed.hour * 3600 + parsed.minute * 60
+
+
+def parse_timestamp(date: str, time: str) -> int:
+    """
+    Parses a "%d.%m.%Y" date and "%H:%M" time pair into a wall clock timestamp
+
+    Dates and times repeat across events, so each distinct string is only parsed once.
+    """
+    if not isinstance(date, str) or not isinstance(time, str):
+        raise ValueError(f"Invalid date or time: {date} {time}")
+    return _parse_date(date) + _parse_time(time)
+
+
+def from_timestamp(timestamp: int) -> datetime:
+    """Converts a wall clock timestamp back to a naive datetime"""
+    return _EPOCH + timedelta(seconds=timestamp)
+
+
+@dataclass(slots=True)
 class Event:
+    """
+    A calendar event
+
+    The start and end are parsed once, when the event is created, into wall
+    clock timestamps. Treat the date and time fields as read-only; use
+    dataclasses.replace to change them.
+    """
     id: str  # Will be UUID
     name: str
     description: str
@@ -17,9 +63,22 @@ class Event:
     end_time: str
     source: SourceType
     source_id: str
+    start_timestamp: int = field(init=False, repr=False, compare=False)
+    end_timestamp: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Ensure ID is always a valid UUID"""
+        """Ensure ID is always a valid UUID and parse the start and end"""
+        self.start_timestamp = parse_timestamp(self.start_date, self.start_time)
+        self.end_timestamp = parse_timestamp(self.end_date, self.end_time)
+
+        # Dates, times and sources repeat across events; keep one copy of each
+        self.start_date = sys.intern(self.start_date)
+        self.start_time = sys.intern(self.start_time)
+        self.end_date = sys.intern(self.end_date)
+        self.end_time = sys.intern(self.end_time)
+        if isinstance(self.source, str):
+            self.source = sys.intern(self.source)
+
         if not self.id:
             self.id = str(uuid.uuid4())
         try:
@@ -33,11 +92,18 @@ class Event:
     def __str__(self) -> str:
         return f"{self.name} on {self.start_date} at {self.start_time}"
 
+    @property
+    def start(self) -> datetime:
+        return from_timestamp(self.start_timestamp)
+
+    @property
+    def end(self) -> datetime:
+        return from_timestamp(self.end_timestamp)
+
     @property
     def day_name(self) -> str:
         """Get the day name (Monday, Tuesday, etc.) from start_date"""
-        date_obj = datetime.strptime(self.start_date, "%d.%m.%Y")
-        return date_obj.strftime("%A")
+        return self.start.strftime("%A")
 
     @property
     def clean_description(self) -> str:
@@ -56,15 +122,11 @@ class Event:
 
     def get_status(self) -> str:
         """Returns the current status of the event"""
-        now = datetime.now()
-
-        # Convert event times to datetime objects
-        start_datetime = datetime.strptime(f"{self.start_date} {self.start_time}", "%d.%m.%Y %H:%M")
-        end_datetime = datetime.strptime(f"{self.end_date} {self.end_time}", "%d.%m.%Y %H:%M")
+        now = (datetime.now() - _EPOCH).total_seconds()
 
-        if now < start_datetime:
+        if now < self.start_timestamp:
             return "🔜 Upcoming"
-        elif start_datetime <= now <= end_datetime:
+        elif self.start_timestamp <= now <= self.end_timestamp:
             return "▶️ Ongoing"
         else:
             return "✅ Finished"
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from app.models.change_set import ChangeSet
+from app.models.event import Event
+
+
+@dataclass
+class ImportResult:
+    event: Event
+    error: Optional[str] = None  # None when the event was accepted
+
+    @property
+    def accepted(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class ImportReport:
+    results: List[ImportResult] = field(default_factory=list)
+    applied: ChangeSet = field(default_factory=ChangeSet)  # rows actually persisted
+    unchanged: int = 0  # incoming events identical to the stored ones
+
+    @property
+    def accepted(self) -> List[Event]:
+        """Events that were stored"""
+        return [result.event for result in self.results if result.accepted]
+
+    @property
+    def rejected(self) -> List[ImportResult]:
+        """Results for events that were skipped, with the reason"""
+        return [result for result in self.results if not result.accepted]
@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from typing import Literal, Optional
+import time
+import uuid
+
+DeliveryStatus = Literal["queued", "sending", "sent", "failed"]
+
+
+@dataclass
+class OutboundMessage:
+    to: str
+    body: str
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: DeliveryStatus = "queued"
+    error: Optional[str] = None
+    queued_at: float = field(default_factory=time.monotonic)
+    sent_at: Optional[float] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ("sent", "failed")
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from app.models.event import Event
+from app.models.user import User
+
+
+@dataclass
+class Reminder:
+    due_at: int  # wall clock timestamp, see app.models.event.to_timestamp
+    user: User
+    event: Event
+    offset: int  # minutes before the event starts
+
+    def render(self) -> str:
+        """Message text; the same for every user reminded of this event at this offset"""
+        return f"""⏰ Reminder: {self.event.name}
+
+Starts in {self.offset} minutes, at {self.event.start_time} till {self.event.end_time}."""
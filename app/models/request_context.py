@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from app.models.user import User
+
+
+@dataclass
+class RequestContext:
+    """Everything known about one incoming message, resolved once by the router"""
+    wa_id: str
+    phone_number: str
+    command: str = ''
+    args: List[str] = field(default_factory=list)
+    user: Optional[User] = None
@@ -9,7 +9,7 @@ from app.controllers.hello_controller import HelloController
 def configure_routes(router: RouterService):
     # Initialize controllers
     auth_controller = AuthController()
-    event_controller = EventController()
+    event_controller = EventController(router.stage_seconds)
     reminder_controller = ReminderController()
     hello_controller = HelloController()
 
@@ -19,7 +19,8 @@ def configure_routes(router: RouterService):
         auth_controller.register,
         min_args=1,
         max_args=1,
-        help_text="Register with email. Usage: !register <email>"
+        help_text="Register with email. Usage: !register <email>",
+        rate_limit=(3, 600)  # every call sends an email
     )
 
     router.register_command(
@@ -35,7 +36,8 @@ def configure_routes(router: RouterService):
         event_controller.list_events,
         min_args=0,
         max_args=1,
-        help_text="Get the list of today's events. Usage: !events"
+        help_text="Get the list of today's events. Usage: !events",
+        rate_limit=(10, 60)
     )
 
     router.register_command(
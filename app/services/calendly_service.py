@@ -1,12 +1,19 @@
 import os
 from datetime import datetime
 import requests
-from typing import List, Dict
+from typing import Iterator, List, Dict
 from app.models.event import Event
+from app.models.import_report import ImportReport
 from app.services.event_service import EventService
+from app.services.pagination import prefetch
+from app.services.sync_service import SyncService
+from app.services.sync_state_service import SyncStateService
 
 
 class CalendlyService:
+    PAGE_SIZE = 100  # Calendly's maximum page size
+    MAX_PAGES_IN_FLIGHT = 2
+
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.calendly.com/scheduled_events"
@@ -15,10 +22,14 @@ class CalendlyService:
             "Content-Type": "application/json"
         }
         self.event_service = EventService()
+        self.sync_service = SyncService(self.event_service)
+        self.sync_state = SyncStateService()
 
-    def fetch_events(self, start_date: str, end_date: str) -> List[Dict]:
+    def iter_event_pages(self, start_date: str, end_date: str) -> Iterator[List[Dict]]:
         """
-        Fetch events from Calendly within the specified date range
+        Fetch events from Calendly within the specified date range, one page at a time
+
+        Follows `pagination.next_page` until the last page.
 
         Args:
             start_date: ISO format date (YYYY-MM-DD)
@@ -34,23 +45,51 @@ class CalendlyService:
 
         user_uri = user_info_response.json()["resource"]["uri"]
 
+        url = self.base_url
         params = {
             "min_start_time": f"{start_date}T00:00:00Z",
             "max_start_time": f"{end_date}T23:59:59Z",
-            "status": "active",
-            "user": user_uri
+            "user": user_uri,
+            "count": self.PAGE_SIZE
         }
 
-        response = requests.get(
-            self.base_url,
-            headers=self.headers,
-            params=params
-        )
+        while url:
+            response = requests.get(
+                url,
+                headers=self.headers,
+                params=params
+            )
+
+            if response.status_code != 200:
+                raise Exception(f"Failed to fetch Calendly events: {response.text}")
+
+            data = response.json()
+            yield data.get("collection", [])
+
+            # next_page is a complete URL, including the query parameters
+            url = (data.get("pagination") or {}).get("next_page")
+            params = None
+
+    def iter_events(self, start_date: str, end_date: str) -> Iterator[Dict]:
+        """
+        Stream events from Calendly, fetching the next page while the current one is processed
+
+        Args:
+            start_date: ISO format date (YYYY-MM-DD)
+            end_date: ISO format date (YYYY-MM-DD)
+        """
+        for page in prefetch(self.iter_event_pages(start_date, end_date), self.MAX_PAGES_IN_FLIGHT):
+            yield from page
 
-        if response.status_code != 200:
-            raise Exception(f"Failed to fetch Calendly events: {response.text}")
+    def fetch_events(self, start_date: str, end_date: str) -> List[Dict]:
+        """
+        Fetch all events from Calendly within the specified date range
 
-        return response.json().get("collection", [])
+        Args:
+            start_date: ISO format date (YYYY-MM-DD)
+            end_date: ISO format date (YYYY-MM-DD)
+        """
+        return list(self.iter_events(start_date, end_date))
 
     def _transform_calendly_event(self, calendly_event: Dict) -> Event:
         """Transform Calendly event format to our Event model format"""
@@ -69,40 +108,68 @@ class CalendlyService:
             source_id=calendly_event["uri"].split('/')[-1]
         )
 
-    def sync_events(self, start_date: str, end_date: str) -> int:
+    @staticmethod
+    def _parse_timestamp(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+    def sync_events(self, start_date: str, end_date: str, full: bool = False) -> ImportReport:
         """
         Sync Calendly events to local storage
 
+        Events are matched on their Calendly URI, so only new, changed and
+        cancelled events are written. Calendly has no change feed, so the
+        window is still fetched, but events not updated since the stored
+        cursor (and already inside the previously synced window) are skipped
+        before any transformation or comparison.
+
         Args:
             start_date: Date in YYYY-MM-DD format
             end_date: Date in YYYY-MM-DD format
+            full: Ignore the stored cursor and compare every event
 
         Returns:
-            Number of events synced
+            ImportReport with the applied inserts, updates and deletions
         """
-        # Fetch events from Calendly
-        calendly_events = self.fetch_events(start_date, end_date)
-
-        # Transform to our Event format
-        events = [self._transform_calendly_event(event) for event in calendly_events]
-
-        # Get existing event IDs
-        existing_ids = {event.id for event in self.event_service.events}
-
-        # Add only new events
-        sync_count = 0
-        for event in events:
-            if event.id not in existing_ids:
-                try:
-                    self.event_service.add_event(event)
-                    sync_count += 1
-                except ValueError as e:
-                    print(f"Skipping event due to conflict: {event.name} - {str(e)}")
-
-        return sync_count
-
-
-def sync_calendly_events(api_key: str, start_date: str, end_date: str) -> str:
+        state = {} if full else self.sync_state.get("calendly")
+        updated_since = self._parse_timestamp(state["updated_since"]) if state.get("updated_since") else None
+        window_end = self._parse_timestamp(state["window_end"]) if state.get("window_end") else None
+        latest_update = updated_since
+
+        # Stream events from Calendly (active and canceled) straight into the sync plan
+        plan = self.sync_service.plan("calendly")
+        for calendly_event in self.iter_events(start_date, end_date):
+            updated_at = self._parse_timestamp(calendly_event["updated_at"]) if calendly_event.get("updated_at") else None
+            if updated_at and (latest_update is None or updated_at > latest_update):
+                latest_update = updated_at
+
+            # Skip events that did not change since the last run
+            if (updated_since and updated_at and updated_at <= updated_since
+                    and window_end and self._parse_timestamp(calendly_event["start_time"]) <= window_end):
+                continue
+
+            if calendly_event.get("status") == "canceled":
+                plan.cancel(calendly_event["uri"].split('/')[-1])
+            else:
+                plan.upsert(self._transform_calendly_event(calendly_event))
+
+        report = self.sync_service.apply(plan)
+        for result in report.rejected:
+            print(f"Skipping event due to conflict: {result.event.name} - {result.error}")
+
+        # Only move the cursor forward if everything was stored
+        if not report.rejected:
+            new_window_end = max(filter(None, [window_end, self._parse_timestamp(f"{end_date}T23:59:59Z")]))
+            self.sync_state.update(
+                "calendly",
+                updated_since=latest_update.isoformat() if latest_update else None,
+                window_end=new_window_end.isoformat(),
+                last_synced=datetime.now().isoformat()
+            )
+
+        return report
+
+
+def sync_calendly_events(api_key: str, start_date: str, end_date: str, full: bool = False) -> str:
     """
     Command-line function to sync Calendly events
 
@@ -110,10 +177,13 @@ def sync_calendly_events(api_key: str, start_date: str, end_date: str) -> str:
         api_key: Calendly API key
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format
+        full: Ignore the stored sync cursor
     """
     try:
         sync_service = CalendlyService(api_key)
-        events_synced = sync_service.sync_events(start_date, end_date)
-        return f"Successfully synced {events_synced} new events from Calendly"
+        report = sync_service.sync_events(start_date, end_date, full)
+        return (f"Successfully synced {len(report.applied.added)} new events from Calendly "
+                f"({len(report.applied.updated)} updated, {len(report.applied.removed)} removed, "
+                f"{report.unchanged} unchanged)")
     except Exception as e:
         return f"Error syncing events: {str(e)}"
\ No newline at end of file
@@ -0,0 +1,201 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+from app.models.event import Event
+
+try:
+    import numpy
+except ImportError:  # optional, only speeds up scans over overlapping (legacy) data
+    numpy = None
+
+# Event fields that repeat across events, stored as codes into the string table
+INTERNED_FIELDS = ('name', 'start_date', 'start_time', 'end_date', 'end_time', 'source')
+
+
+class StringTable:
+    """Interns values into integer codes, so each distinct value is stored once"""
+
+    def __init__(self):
+        self.values: List[Hashable] = []
+        self.codes: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def code(self, value: Hashable) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class ColumnarEventIndex:
+    """Column-oriented alternative to EventIndex, for calendars with very many events.
+
+    Rows are kept sorted by start. Start and end timestamps live in contiguous
+    ``array('q')`` (int64) columns, and every string field is stored as a code
+    into one shared StringTable, so repeated names, dates and sources cost a
+    single machine word per row. IDs, source IDs and descriptions, nearly
+    always unique per event, are kept in plain lists. Event objects are only
+    built for the rows a query returns, so every lookup hands out a fresh copy.
+
+    It answers the same queries as EventIndex: time ranges by binary search
+    over the start column, overlap counts from the separately sorted end
+    column. Scans over legacy overlapping data are vectorized with NumPy when
+    it is installed. Strings only removed rows used are dropped from the table
+    once they make up most of it.
+    """
+
+    def __init__(self, events: Optional[List[Event]] = None):
+        self._strings = StringTable()
+        self.rebuild(events or [])
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Event]:
+        return (self._materialize(row) for row in range(len(self._starts)))
+
+    @property
+    def events(self) -> List[Event]:
+        """All events sorted by start (built on every call)"""
+        return [self._materialize(row) for row in range(len(self._starts))]
+
+    def _materialize(self, row: int) -> Event:
+        # The row was validated when it was added, so skip Event.__init__ (and its parsing)
+        event = object.__new__(Event)
+        values = self._strings.values
+        for set_field, column in self._setters:
+            set_field(event, values[column[row]])
+        event.id = self._ids[row]
+        event.source_id = self._source_ids[row]
+        event.description = self._descriptions[row]
+        event.start_timestamp = self._starts[row]
+        event.end_timestamp = self._event_ends[row]
+        return event
+
+    def between(self, start: int, end: int) -> List[Event]:
+        """Events starting within [start, end), sorted by start"""
+        return [self._materialize(row)
+                for row in range(bisect_left(self._starts, start), bisect_left(self._starts, end))]
+
+    def rebuild(self, events: List[Event]) -> None:
+        """Replaces the indexed events"""
+        events = sorted(events, key=lambda event: event.start_timestamp)
+        self._strings = StringTable()
+        self._starts = array('q', (event.start_timestamp for event in events))
+        self._event_ends = array('q', (event.end_timestamp for event in events))  # parallel to _starts
+        self._ends = array('q', sorted(self._event_ends))  # sorted on its own
+        self._columns: Dict[str, array] = {
+            name: array('q', (self._strings.code(getattr(event, name)) for event in events))
+            for name in INTERNED_FIELDS
+        }
+        # Slot descriptors of the interned fields, paired with their columns
+        self._setters = [(getattr(Event, name).__set__, column) for name, column in self._columns.items()]
+        self._ids = [event.id for event in events]
+        self._source_ids = [event.source_id for event in events]
+        self._descriptions = [event.description for event in events]
+        self._start_by_id: Dict[str, int] = {}
+        self._by_source: Dict[Tuple[str, str], str] = {}
+        for event in events:
+            self._index_keys(event)
+
+    def add(self, event: Event) -> None:
+        """Indexes a single event"""
+        row = bisect_right(self._starts, event.start_timestamp)
+        self._starts.insert(row, event.start_timestamp)
+        self._event_ends.insert(row, event.end_timestamp)
+        self._ends.insert(bisect_right(self._ends, event.end_timestamp), event.end_timestamp)
+        for name, column in self._columns.items():
+            column.insert(row, self._strings.code(getattr(event, name)))
+        self._ids.insert(row, event.id)
+        self._source_ids.insert(row, event.source_id)
+        self._descriptions.insert(row, event.description)
+        self._index_keys(event)
+
+    def _index_keys(self, event: Event) -> None:
+        self._start_by_id[event.id] = event.start_timestamp
+        if event.source_id:
+            self._by_source.setdefault((event.source, event.source_id), event.id)
+
+    def _row(self, event_id: str) -> Optional[int]:
+        start = self._start_by_id.get(event_id)
+        if start is None:
+            return None
+        row = bisect_left(self._starts, start)
+        while row < len(self._starts) and self._starts[row] == start:
+            if self._ids[row] == event_id:
+                return row
+            row += 1
+        return None
+
+    def get(self, event_id: str) -> Optional[Event]:
+        """Returns the event with the given ID, if any"""
+        row = self._row(event_id)
+        return self._materialize(row) if row is not None else None
+
+    def get_by_source(self, source: str, source_id: str) -> Optional[Event]:
+        """Returns the event imported from the given source item, if any"""
+        event_id = self._by_source.get((source, source_id))
+        return self.get(event_id) if event_id is not None else None
+
+    def remove(self, event: Event) -> None:
+        """Drops an event from the index, if present"""
+        row = self._row(event.id)
+        if row is None:
+            return
+        source_key = (self._strings.values[self._columns['source'][row]], self._source_ids[row])
+        if self._by_source.get(source_key) == event.id:
+            del self._by_source[source_key]
+        del self._start_by_id[event.id]
+
+        end = self._event_ends[row]
+        del self._starts[row]
+        del self._event_ends[row]
+        del self._ends[bisect_left(self._ends, end)]
+        del self._ids[row]
+        del self._source_ids[row]
+        del self._descriptions[row]
+        for column in self._columns.values():
+            del column[row]
+        if len(self._strings) > 2 * len(INTERNED_FIELDS) * len(self._starts) + 1024:
+            self._compact_strings()
+
+    def _compact_strings(self) -> None:
+        # Every live row holds at most len(INTERNED_FIELDS) distinct strings, so most of the table is dead
+        strings = StringTable()
+        old_values = self._strings.values
+        for column in self._columns.values():
+            column[:] = array('q', (strings.code(old_values[code]) for code in column))
+        self._strings = strings
+
+    def count_overlapping(self, start: int, end: int) -> int:
+        """Number of indexed events overlapping the half-open range [start, end)"""
+        return bisect_left(self._starts, end) - bisect_right(self._ends, start)
+
+    def find_conflict(self, start: int, end: int) -> Optional[Event]:
+        """Returns the earliest-starting event overlapping [start, end), if any"""
+        if start < end:
+            if self.count_overlapping(start, end) <= 0:
+                return None
+
+            # Stored events never overlap each other (add_event rejects conflicts),
+            # so the only candidates are the event running at `start` and the
+            # first one starting after it.
+            row = bisect_right(self._starts, start)
+            if row > 0 and self._event_ends[row - 1] > start:
+                return self._materialize(row - 1)
+            if row < len(self._starts) and self._starts[row] < end:
+                return self._materialize(row)
+
+        # Zero-length ranges or legacy data with overlapping events: scan the rows starting before `end`
+        last = bisect_left(self._starts, end)
+        if numpy is not None and last:
+            ends = numpy.frombuffer(self._event_ends, dtype=numpy.int64, count=last)
+            hits = numpy.flatnonzero(ends > start)
+            return self._materialize(int(hits[0])) if len(hits) else None
+        for row in range(last):
+            if self._event_ends[row] > start:
+                return self._materialize(row)
+        return None
@@ -0,0 +1,113 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+# Progress of a message; Twilio's callbacks may arrive out of order, so a status never moves back
+STATUS_RANK = {
+    'accepted': 0,
+    'scheduled': 0,
+    'queued': 1,
+    'sending': 2,
+    'sent': 3,
+    'delivered': 4,
+    'read': 5,
+    # terminal
+    'undelivered': 6,
+    'failed': 6,
+    'canceled': 6,
+}
+
+
+class DeliveryStatusService:
+    """
+    Keeps the latest delivery status of outbound messages, keyed by Twilio SID
+
+    Statuses arrive through Twilio's status callbacks, in no guaranteed order;
+    updates that would move a message back (a late `sent` after `delivered`)
+    are ignored. The most recent `max_entries` messages are kept in memory; if
+    a file path is given, every update is also appended to it as one JSON line
+    and replayed on startup. Once the file holds twice as many lines as there
+    are kept messages, it is rewritten from memory.
+    """
+
+    def __init__(self, file_path: Optional[str] = None, max_entries: int = 10000):
+        self.file_path = file_path
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.statuses: 'OrderedDict[str, Dict]' = OrderedDict()
+        self.logged_lines = 0
+        if file_path:
+            self.load_statuses()
+
+    def load_statuses(self) -> None:
+        """Replays persisted status updates"""
+        try:
+            with open(self.file_path, 'r') as status_file:
+                for line in status_file:
+                    self.logged_lines += 1
+                    try:
+                        self._apply(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except FileNotFoundError:
+            pass
+        self._compact_if_needed()
+
+    @staticmethod
+    def _is_newer(entry: Dict, previous: Optional[Dict]) -> bool:
+        if previous is None:
+            return True
+        return STATUS_RANK.get(entry['status'], 0) >= STATUS_RANK.get(previous['status'], 0)
+
+    def _apply(self, entry: Dict) -> bool:
+        if not self._is_newer(entry, self.statuses.get(entry['sid'])):
+            return False
+        self.statuses.pop(entry['sid'], None)
+        self.statuses[entry['sid']] = entry
+        while len(self.statuses) > self.max_entries:
+            self.statuses.popitem(last=False)
+        return True
+
+    def _compact_if_needed(self) -> None:
+        if self.logged_lines <= 2 * max(len(self.statuses), 1024):
+            return
+        temp_path = f"{self.file_path}.tmp"
+        with open(temp_path, 'w') as status_file:
+            for entry in self.statuses.values():
+                status_file.write(json.dumps(entry) + "\n")
+        os.replace(temp_path, self.file_path)
+        self.logged_lines = len(self.statuses)
+
+    def record(self, sid: str, status: str, error_code: Optional[str] = None,
+               error_message: Optional[str] = None, to: Optional[str] = None) -> Dict:
+        """Stores the status for a message, unless a later one is already known; returns the current entry"""
+        with self.lock:
+            previous = self.statuses.get(sid)
+            entry = {
+                'sid': sid,
+                'status': status,
+                'to': to or (previous or {}).get('to'),
+                'error_code': error_code,
+                'error_message': error_message,
+                'updated_at': time.time()
+            }
+            if not self._apply(entry):
+                return previous
+            if self.file_path:
+                with open(self.file_path, 'a') as status_file:
+                    status_file.write(json.dumps(entry) + "\n")
+                self.logged_lines += 1
+                self._compact_if_needed()
+
+        if error_code:
+            logging.error("Message %s failed with error code %s: %s", sid, error_code, error_message)
+        return entry
+
+    def get_status(self, sid: str) -> Optional[Dict]:
+        """Returns the latest known status of a message, if any"""
+        with self.lock:
+            return self.statuses.get(sid)
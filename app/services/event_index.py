@@ -0,0 +1,134 @@
+import os
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterator, List, Optional, Tuple
+from app.models.event import Event
+
+
+class EventIndex:
+    """Sorted event store with an interval index, keyed on parsed timestamps.
+
+    Events are kept sorted by start timestamp, so a time range is answered by
+    two binary searches and a slice. Ends are additionally kept in their own
+    sorted array, which makes the number of events overlapping [start, end)
+    simply ``#(starts < end) - #(ends <= start)``.
+
+    Hash indices by id and by (source, source_id) are maintained alongside, so
+    point lookups are O(1). Events without a source_id are not source-indexed.
+    """
+
+    def __init__(self, events: Optional[List[Event]] = None):
+        self._starts: List[int] = []
+        self._events: List[Event] = []      # parallel to _starts
+        self._event_ends: List[int] = []    # parallel to _starts
+        self._ends: List[int] = []          # sorted on its own
+        self._by_id: Dict[str, Event] = {}
+        self._by_source: Dict[Tuple[str, str], Event] = {}
+        if events:
+            self.rebuild(events)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._events)
+
+    @property
+    def events(self) -> List[Event]:
+        """All events sorted by start (the live list - do not mutate)"""
+        return self._events
+
+    def between(self, start: int, end: int) -> List[Event]:
+        """Events starting within [start, end), sorted by start"""
+        return self._events[bisect_left(self._starts, start):bisect_left(self._starts, end)]
+
+    def rebuild(self, events: List[Event]) -> None:
+        """Replaces the indexed events, parsing each timestamp exactly once"""
+        entries = sorted(((e.start_timestamp, e.end_timestamp, e) for e in events),
+                         key=lambda entry: entry[0])
+        self._starts = [start for start, _, _ in entries]
+        self._event_ends = [end for _, end, _ in entries]
+        self._events = [event for _, _, event in entries]
+        self._ends = sorted(self._event_ends)
+        self._by_id = {}
+        self._by_source = {}
+        for event in self._events:
+            self._index_keys(event)
+
+    def add(self, event: Event) -> None:
+        """Indexes a single event"""
+        start = event.start_timestamp
+        end = event.end_timestamp
+        position = bisect_right(self._starts, start)
+        self._starts.insert(position, start)
+        self._event_ends.insert(position, end)
+        self._events.insert(position, event)
+        insort(self._ends, end)
+        self._index_keys(event)
+
+    def _index_keys(self, event: Event) -> None:
+        self._by_id[event.id] = event
+        if event.source_id:
+            self._by_source.setdefault((event.source, event.source_id), event)
+
+    def get(self, event_id: str) -> Optional[Event]:
+        """Returns the event with the given ID, if any"""
+        return self._by_id.get(event_id)
+
+    def get_by_source(self, source: str, source_id: str) -> Optional[Event]:
+        """Returns the event imported from the given source item, if any"""
+        return self._by_source.get((source, source_id))
+
+    def remove(self, event: Event) -> None:
+        """Drops an event from the index, if present"""
+        event = self._by_id.pop(event.id, None)
+        if event is None:
+            return
+        if self._by_source.get((event.source, event.source_id)) is event:
+            del self._by_source[(event.source, event.source_id)]
+
+        start = event.start_timestamp
+        position = bisect_left(self._starts, start)
+        while position < len(self._starts) and self._starts[position] == start:
+            if self._events[position] is event:
+                end = self._event_ends[position]
+                del self._starts[position]
+                del self._event_ends[position]
+                del self._events[position]
+                del self._ends[bisect_left(self._ends, end)]
+                return
+            position += 1
+
+    def count_overlapping(self, start: int, end: int) -> int:
+        """Number of indexed events overlapping the half-open range [start, end)"""
+        return bisect_left(self._starts, end) - bisect_right(self._ends, start)
+
+    def find_conflict(self, start: int, end: int) -> Optional[Event]:
+        """Returns the earliest-starting event overlapping [start, end), if any"""
+        if start < end:
+            if self.count_overlapping(start, end) <= 0:
+                return None
+
+            # Stored events never overlap each other (add_event rejects conflicts),
+            # so the only candidates are the event running at `start` and the
+            # first one starting after it.
+            position = bisect_right(self._starts, start)
+            if position > 0 and self._event_ends[position - 1] > start:
+                return self._events[position - 1]
+            if position < len(self._starts) and self._starts[position] < end:
+                return self._events[position]
+
+        # Zero-length ranges or legacy data with overlapping events: scan the prefix
+        for position, candidate_start in enumerate(self._starts):
+            if candidate_start >= end:
+                break
+            if self._event_ends[position] > start:
+                return self._events[position]
+        return None
+
+
+def create_event_index():
+    """Creates the event index selected by EVENT_INDEX (sorted or columnar)"""
+    if os.getenv('EVENT_INDEX', 'sorted').lower() == 'columnar':
+        from app.services.columnar_event_index import ColumnarEventIndex
+        return ColumnarEventIndex()
+    return EventIndex()
@@ -1,133 +1,217 @@
-from typing import List, Dict
-import json
-from datetime import datetime, timedelta
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
+from datetime import date, datetime, timedelta
+import threading
 import uuid
-from app.models.event import Event
+from app.models.change_set import ChangeSet
+from app.models.event import Event, to_timestamp
+from app.models.import_report import ImportReport, ImportResult
+from app.services.event_index import EventIndex, create_event_index
+from app.storage.base import EventStorage
+from app.storage.factory import create_event_storage
 
 
 class EventService:
-    def __init__(self, file_path='storage/events.json'):
+    def __init__(self, file_path='storage/events.json', storage: Optional[EventStorage] = None,
+                 index: Optional[EventIndex] = None):
         self.file_path = file_path
-        self.events: List[Event] = []
+        self.storage = storage or create_event_storage(file_path)
+        self.index = index if index is not None else create_event_index()
+        self.lock = threading.RLock()  # guards reloads and mutations of the index
+        self.listeners: List[Callable[[Optional[ChangeSet]], None]] = []
         self.load_events()
 
+    @property
+    def events(self) -> List[Event]:
+        """All events sorted by start date and time (a columnar index builds them all on every access)"""
+        return self.index.events
+
+    def iter_events(self) -> Iterator[Event]:
+        """Iterates over all events sorted by start, building them one at a time for columnar indexes"""
+        return iter(self.index)
+
+    @property
+    def version(self) -> int:
+        """Data version, bumped whenever events are loaded or saved"""
+        return self.storage.version
+
+    def add_listener(self, listener: Callable[[Optional[ChangeSet]], None]) -> None:
+        """
+        Registers a callback invoked after every save with the saved ChangeSet
+
+        After a (re)load, or a save without a change set, it is called with
+        None: any event may have changed.
+        """
+        self.listeners.append(listener)
+
+    def _notify(self, changes: Optional[ChangeSet]) -> None:
+        for listener in self.listeners:
+            listener(changes)
+
     def load_events(self) -> None:
-        """Loads events from JSON file into Event objects"""
-        try:
-            with open(self.file_path, 'r') as json_file:
-                events_data = json.load(json_file)
-                # Convert existing events to include new fields
-                for event_data in events_data:
-                    if 'source' not in event_data:
-                        event_data['source'] = 'better-calendar'
-                    if 'source_id' not in event_data:
-                        event_data['source_id'] = event_data.get('id', '')
-
-                self.events = [Event.from_dict(event_data) for event_data in events_data]
-                self.events = self._sort_events(self.events)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.events = []
-
-    def _sort_events(self, events: List[Event]) -> List[Event]:
-        """Sorts events by start_date and start_time in ascending order"""
-        return sorted(events,
-                      key=lambda e: (
-                          datetime.strptime(e.start_date, "%d.%m.%Y"),
-                          datetime.strptime(e.start_time, "%H:%M")
-                      ))
-
-    def save_events(self) -> None:
-        """Saves events to JSON file"""
-        with open(self.file_path, 'w') as json_file:
-            json.dump([event.to_dict() for event in self.events], json_file, indent=4)
+        """Loads events from storage into Event objects"""
+        self.index.rebuild(self.storage.load())
+        self._notify(None)
+
+    def reload_if_changed(self) -> None:
+        """Reloads events only if the storage changed since it was last read or written"""
+        with self.lock:
+            if self.storage.has_changed():
+                self.load_events()
+
+    def save_events(self, changes: Optional[ChangeSet] = None) -> None:
+        """Saves events to storage, writing only the given changes where the backend supports it"""
+        self.storage.save(self.index, changes)
+        self._notify(changes)
+
+    @staticmethod
+    def _timeframe_bounds(time_frame: str, now: datetime) -> Optional[Tuple[date, date]]:
+        """Returns the [first day, last day + 1) range of a time frame, None for 'all'"""
+        today = now.date()
+
+        if time_frame == 'today':
+            return today, today + timedelta(days=1)
+        elif time_frame == 'tomorrow':
+            return today + timedelta(days=1), today + timedelta(days=2)
+        elif time_frame == 'this-week':
+            start_of_week = today - timedelta(days=now.weekday())
+            return start_of_week, start_of_week + timedelta(days=7)
+        elif time_frame == 'next-week':
+            start_of_next_week = today + timedelta(days=7 - now.weekday())
+            return start_of_next_week, start_of_next_week + timedelta(days=7)
+        elif time_frame == 'this-month':
+            start_of_month = today.replace(day=1)
+            return start_of_month, (start_of_month + timedelta(days=32)).replace(day=1)
+        elif time_frame == 'next-month':
+            start_of_next_month = (today.replace(day=1) + timedelta(days=32)).replace(day=1)
+            return start_of_next_month, (start_of_next_month + timedelta(days=32)).replace(day=1)
+        return None  # 'all' timeframe
 
     def list_events(self, time_frame: str = 'all') -> List[Event]:
         """Returns sorted events within the specified time frame"""
-        self.load_events()
+        with self.lock:
+            self.reload_if_changed()
 
-        if not self.events:
-            raise ValueError("You have no upcoming events")
-
-        now = datetime.now()
-
-        def is_event_in_timeframe(event: Event) -> bool:
-            event_date = datetime.strptime(event.start_date, "%d.%m.%Y")
-
-            if time_frame == 'today':
-                return event_date.date() == now.date()
-            elif time_frame == 'tomorrow':
-                tomorrow = now.date() + timedelta(days=1)
-                return event_date.date() == tomorrow
-            elif time_frame == 'this-week':
-                start_of_week = now.date() - timedelta(days=now.weekday())
-                end_of_week = start_of_week + timedelta(days=6)
-                return start_of_week <= event_date.date() <= end_of_week
-            elif time_frame == 'next-week':
-                start_of_next_week = now.date() + timedelta(days=7 - now.weekday())
-                end_of_next_week = start_of_next_week + timedelta(days=6)
-                return start_of_next_week <= event_date.date() <= end_of_next_week
-            elif time_frame == 'this-month':
-                return (event_date.year == now.year and
-                        event_date.month == now.month)
-            elif time_frame == 'next-month':
-                if now.month == 12:
-                    next_month_year = now.year + 1
-                    next_month = 1
-                else:
-                    next_month_year = now.year
-                    next_month = now.month + 1
-                return (event_date.year == next_month_year and
-                        event_date.month == next_month)
-            return True  # 'all' timeframe
-
-        filtered_events = [event for event in self.events if is_event_in_timeframe(event)]
-        return self._sort_events(filtered_events)
+            if not len(self.index):
+                raise ValueError("You have no upcoming events")
 
-    def add_event(self, event: Event) -> None:
-        """Adds a new event to the list"""
-        # Ensure event has a UUID
-        if not event.id:
-            event.id = str(uuid.uuid4())
-
-        # Check for time conflicts
-        event_start = datetime.strptime(f"{event.start_date} {event.start_time}", "%d.%m.%Y %H:%M")
-        event_end = datetime.strptime(f"{event.end_date} {event.end_time}", "%d.%m.%Y %H:%M")
-
-        for existing_event in self.events:
-            existing_start = datetime.strptime(
-                f"{existing_event.start_date} {existing_event.start_time}",
-                "%d.%m.%Y %H:%M"
-            )
-            existing_end = datetime.strptime(
-                f"{existing_event.end_date} {existing_event.end_time}",
-                "%d.%m.%Y %H:%M"
+            bounds = self._timeframe_bounds(time_frame, datetime.now())
+            if bounds is None:
+                return list(self.index)
+
+            first_day, end_day = bounds
+            return self.index.between(
+                to_timestamp(datetime.combine(first_day, datetime.min.time())),
+                to_timestamp(datetime.combine(end_day, datetime.min.time()))
             )
 
-            if event_start < existing_end and event_end > existing_start:
-                raise ValueError(
-                    f"Time Conflict: {existing_event.name} on {existing_event.start_date} "
-                    f"at {existing_event.start_time} till {existing_event.end_time}"
-                )
+    def _check_conflict(self, event: Event) -> None:
+        """Raises a ValueError if the event overlaps an indexed event"""
+        existing_event = self.index.find_conflict(event.start_timestamp, event.end_timestamp)
+        if existing_event is not None:
+            raise ValueError(
+                f"Time Conflict: {existing_event.name} on {existing_event.start_date} "
+                f"at {existing_event.start_time} till {existing_event.end_time}"
+            )
 
-        self.events.append(event)
-        self.events = self._sort_events(self.events)
-        self.save_events()
+    def add_event(self, event: Event) -> None:
+        """Adds a new event to the list"""
+        with self.lock:
+            self.reload_if_changed()
+
+            # Ensure event has a UUID
+            if not event.id:
+                event.id = str(uuid.uuid4())
+
+            # Check for time conflicts
+            self._check_conflict(event)
+
+            self.index.add(event)
+            self.save_events(ChangeSet(added=[event]))
+
+    def add_events(self, events: List[Event]) -> ImportReport:
+        """
+        Adds a batch of events, saving only once
+
+        Every event is checked against the stored events and against the
+        events accepted earlier in the same batch. Conflicting events are
+        skipped instead of aborting the whole batch.
+
+        Returns:
+            ImportReport with one accepted/rejected result per event
+        """
+        return self.apply_changes(ChangeSet(added=list(events)))
+
+    def apply_changes(self, changes: ChangeSet) -> ImportReport:
+        """
+        Applies removals, updates and additions, then persists them in a single save
+
+        Updated events replace the stored event with the same ID. Added and
+        updated events that would cause a time conflict are rejected and
+        reported instead of aborting the whole change set.
+
+        Returns:
+            ImportReport with one result per added or updated event, and the
+            changes that were actually applied
+        """
+        with self.lock:
+            self.reload_if_changed()
+            report = ImportReport()
+            applied = report.applied
+
+            for event in changes.removed:
+                existing = self.index.get(event.id)
+                if existing is not None:
+                    self.index.remove(existing)
+                    applied.removed.append(existing)
+
+            for event in changes.updated + changes.added:
+                if not event.id:
+                    event.id = str(uuid.uuid4())
+
+                existing = self.index.get(event.id)
+                if existing is not None:
+                    self.index.remove(existing)
+                try:
+                    self._check_conflict(event)
+                except ValueError as e:
+                    if existing is not None:
+                        self.index.add(existing)
+                    report.results.append(ImportResult(event, str(e)))
+                    continue
+
+                self.index.add(event)
+                (applied.updated if existing is not None else applied.added).append(event)
+                report.results.append(ImportResult(event))
+
+            if applied:
+                self.save_events(applied)
+
+            return report
 
     def get_event_by_source_id(self, source: str, source_id: str) -> Event:
         """Gets an event by source and source_id"""
-        for event in self.events:
-            if event.source == source and event.source_id == source_id:
-                return event
-        raise ValueError("Event not found")
+        event = self.find_event_by_source_id(source, source_id)
+        if event is None:
+            raise ValueError("Event not found")
+        return event
+
+    def find_event_by_source_id(self, source: str, source_id: str) -> Optional[Event]:
+        """Returns the event imported from the given source item, or None"""
+        return self.index.get_by_source(source, source_id)
 
     def remove_event(self, event_id: str) -> None:
         """Removes an event by ID"""
-        self.events = [event for event in self.events if event.id != event_id]
-        self.save_events()
+        with self.lock:
+            self.reload_if_changed()
+            event = self.index.get(event_id)
+            if event is None:
+                return
+            self.index.remove(event)
+            self.save_events(ChangeSet(removed=[event]))
 
     def get_event_by_id(self, event_id: str) -> Event:
         """Gets an event by ID"""
-        for event in self.events:
-            if event.id == event_id:
-                return event
-        raise ValueError("Event not found")
\ No newline at end of file
+        event = self.index.get(event_id)
+        if event is None:
+            raise ValueError("Event not found")
+        return event
@@ -0,0 +1,44 @@
+import os
+from typing import Optional, Tuple
+
+Signature = Optional[Tuple[int, int, int, int]]
+
+_UNSET = object()
+
+
+class FileWatcher:
+    """Tracks whether a backing file changed since it was last read or written.
+
+    A file is considered changed when its (device, inode, size, mtime) signature
+    differs from the one recorded at the last sync, which catches in-place
+    writes as well as atomic replaces from other processes. Every sync bumps
+    ``version``, so callers can key caches on it.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.version = 0
+        self._signature = _UNSET
+
+    def signature(self) -> Signature:
+        """Returns the current signature of the file, None if it does not exist"""
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def has_changed(self) -> bool:
+        """Checks whether the file differs from the last synced state"""
+        return self.signature() != self._signature
+
+    def mark_synced(self, signature=_UNSET) -> None:
+        """
+        Records the file as in sync with memory and bumps the version
+
+        Args:
+            signature: Signature taken before reading the file. Defaults to the
+                current one, which is what a writer wants after saving.
+        """
+        self._signature = self.signature() if signature is _UNSET else signature
+        self.version += 1
@@ -2,19 +2,28 @@ from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
-from datetime import datetime
+from googleapiclient.errors import HttpError
+from datetime import date, datetime, timedelta
 import os.path
 import json
-from typing import List, Dict
+from typing import Iterator, List, Dict, Optional, Tuple
 from app.models.event import Event
+from app.models.import_report import ImportReport
 from app.services.event_service import EventService
+from app.services.pagination import prefetch
+from app.services.sync_service import SyncPlan, SyncService
+from app.services.sync_state_service import SyncStateService
 
 
 class GoogleCalendarService:
+    MAX_PAGES_IN_FLIGHT = 2
+
     def __init__(self, credentials_path: str = 'credentials.json'):
         self.SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
         self.credentials_path = credentials_path
         self.event_service = EventService()
+        self.sync_service = SyncService(self.event_service)
+        self.sync_state = SyncStateService()
 
     def get_calendar_service(self):
         """Get an authorized Calendar API service instance"""
@@ -37,70 +46,144 @@ class GoogleCalendarService:
 
         return build('calendar', 'v3', credentials=creds)
 
-    def sync_events(self, start_date: str, end_date: str) -> int:
+    def _transform_google_event(self, google_event: Dict) -> Event:
+        """Transform Google Calendar event format to our Event model format"""
+        start = google_event['start'].get('dateTime', google_event['start'].get('date'))
+        end = google_event['end'].get('dateTime', google_event['end'].get('date'))
+
+        start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
+        end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
+
+        return Event(
+            id='',
+            name=google_event['summary'],
+            description=google_event.get('description', 'No description provided'),
+            start_date=start_dt.strftime("%d.%m.%Y"),
+            start_time=start_dt.strftime("%H:%M"),
+            end_date=end_dt.strftime("%d.%m.%Y"),
+            end_time=end_dt.strftime("%H:%M"),
+            source="google",
+            source_id=google_event['id']
+        )
+
+    def iter_event_pages(self, service, start_date: str, end_date: str,
+                         sync_token: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Fetch events page by page, either the full window or the changes since sync_token
+
+        Follows `nextPageToken` until the last page, which carries `nextSyncToken`.
+        """
+        if sync_token:
+            params = {'syncToken': sync_token}
+        else:
+            params = {
+                'timeMin': f"{start_date}T00:00:00Z",
+                'timeMax': f"{end_date}T23:59:59Z",
+                'showDeleted': True
+            }
+
+        while True:
+            events_result = service.events().list(
+                calendarId='primary',
+                singleEvents=True,
+                **params
+            ).execute()
+            yield events_result
+
+            if not events_result.get('nextPageToken'):
+                return
+            params['pageToken'] = events_result['nextPageToken']
+
+    def _sync_pages(self, service, start_date: str, end_date: str, sync_token: Optional[str],
+                    plan: Optional[SyncPlan] = None) -> Tuple[SyncPlan, Optional[str]]:
+        """
+        Streams event pages into a sync plan, fetching the next page while the current one is processed
+
+        Returns:
+            Tuple of (plan, nextSyncToken); the given plan is extended if there is one
+        """
+        if plan is None:
+            plan = self.sync_service.plan("google")
+        next_sync_token = None
+        for page in prefetch(self.iter_event_pages(service, start_date, end_date, sync_token),
+                             self.MAX_PAGES_IN_FLIGHT):
+            for google_event in page.get('items', []):
+                if google_event.get('status') == 'cancelled':
+                    plan.cancel(google_event['id'])
+                    continue
+                try:
+                    plan.upsert(self._transform_google_event(google_event))
+                except (KeyError, ValueError) as e:
+                    print(f"Skipping event: {google_event.get('summary')} - {str(e)}")
+            next_sync_token = page.get('nextSyncToken', next_sync_token)
+
+        return plan, next_sync_token
+
+    def sync_events(self, start_date: str, end_date: str, full: bool = False) -> ImportReport:
         """
         Sync Google Calendar events to local storage
 
+        Events are matched on their Google event ID, so only new, changed and
+        cancelled events are written. After the first full sync, only the
+        changes since the stored sync token are fetched. When the requested
+        window reaches past the window synced so far (e.g. the CLI's default
+        "next 30 days" on a new day), only the added days are listed on top of
+        the incremental sync. A full resync happens only when the token is
+        invalidated by Google (410 Gone) or when `full` is set.
+
         Args:
             start_date: Date in YYYY-MM-DD format
             end_date: Date in YYYY-MM-DD format
+            full: Ignore the stored sync token
 
         Returns:
-            Number of events synced
+            ImportReport with the applied inserts, updates and deletions
         """
         service = self.get_calendar_service()
 
-        # Get events from Google Calendar
-        events_result = service.events().list(
-            calendarId='primary',
-            timeMin=f"{start_date}T00:00:00Z",
-            timeMax=f"{end_date}T23:59:59Z",
-            singleEvents=True,
-            orderBy='startTime'
-        ).execute()
-
-        events = events_result.get('items', [])
-
-        # Get existing event IDs
-        existing_ids = {event.id for event in self.event_service.events}
-
-        # Add only new events
-        sync_count = 0
-        for google_event in events:
-            if google_event['id'] not in existing_ids:
-                try:
-                    # Convert Google Calendar event to our format
-                    start = google_event['start'].get('dateTime', google_event['start'].get('date'))
-                    end = google_event['end'].get('dateTime', google_event['end'].get('date'))
-
-                    start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-
-                    event = Event(
-                        id='',
-                        name=google_event['summary'],
-                        description=google_event.get('description', 'No description provided'),
-                        start_date=start_dt.strftime("%d.%m.%Y"),
-                        start_time=start_dt.strftime("%H:%M"),
-                        end_date=end_dt.strftime("%d.%m.%Y"),
-                        end_time=end_dt.strftime("%H:%M"),
-                        source="google",
-                        source_id=google_event['id']
-                    )
-
-                    self.event_service.add_event(event)
-                    sync_count += 1
-                except ValueError as e:
-                    print(f"Skipping event due to conflict: {google_event.get('summary')} - {str(e)}")
-
-        return sync_count
-
-
-def sync_google_calendar(credentials_path: str, start_date: str, end_date: str) -> str:
+        state = self.sync_state.get("google")
+        sync_token = None if full else state.get('sync_token')
+        window_end = (state.get('window_end') or end_date) if sync_token else end_date
+
+        try:
+            plan, next_sync_token = self._sync_pages(service, start_date, end_date, sync_token)
+        except HttpError as e:
+            if not sync_token or e.resp.status != 410:
+                raise
+            # Sync token expired: discard the partial plan and start over with a full sync
+            sync_token = None
+            window_end = end_date
+            plan, next_sync_token = self._sync_pages(service, start_date, end_date, None)
+
+        if sync_token and end_date > window_end:
+            # Keep the token and list only the days added to the window since it was synced
+            tail_start = max(start_date, (date.fromisoformat(window_end) + timedelta(days=1)).isoformat())
+            self._sync_pages(service, tail_start, end_date, None, plan)
+            window_end = end_date
+
+        report = self.sync_service.apply(plan)
+        for result in report.rejected:
+            print(f"Skipping event due to conflict: {result.event.name} - {result.error}")
+
+        # Only move the cursor forward if everything was stored
+        if not report.rejected and next_sync_token:
+            self.sync_state.update(
+                "google",
+                sync_token=next_sync_token,
+                window_end=window_end,
+                last_synced=datetime.now().isoformat()
+            )
+
+        return report
+
+
+def sync_google_calendar(credentials_path: str, start_date: str, end_date: str, full: bool = False) -> str:
     """Command-line function to sync Google Calendar events"""
     try:
         sync_service = GoogleCalendarService(credentials_path)
-        events_synced = sync_service.sync_events(start_date, end_date)
-        return f"Successfully synced {events_synced} new events from Google Calendar"
+        report = sync_service.sync_events(start_date, end_date, full)
+        return (f"Successfully synced {len(report.applied.added)} new events from Google Calendar "
+                f"({len(report.applied.updated)} updated, {len(report.applied.removed)} removed, "
+                f"{report.unchanged} unchanged)")
     except Exception as e:
         return f"Error syncing events: {str(e)}"
\ No newline at end of file
@@ -0,0 +1,123 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+from app.storage.sqlite_storage import connect
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS webhook_deliveries (
+    message_sid TEXT PRIMARY KEY,
+    response TEXT,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_webhook_deliveries_expires_at ON webhook_deliveries (expires_at);
+"""
+
+
+class IdempotencyService:
+    """
+    Remembers which webhook deliveries were already handled, keyed by Twilio MessageSid
+
+    Twilio retries a webhook when it does not get a timely answer, so the same
+    message can arrive several times. The first delivery claims the SID with
+    `begin`; later deliveries get its recorded response instead of routing the
+    message (and replying) again.
+
+    Entries expire after `ttl` seconds and at most `max_entries` are kept in
+    memory. With a `db_path`, claims are also stored in SQLite, so duplicates
+    are recognised across worker processes and restarts. Give it a database
+    file of its own: every webhook writes to it, and a commit to the events and
+    users database makes their storages reload.
+    """
+
+    PURGE_INTERVAL = 60  # seconds between deleting expired rows from SQLite
+
+    def __init__(self, ttl: float = 3600, max_entries: int = 10000, db_path: Optional[str] = None,
+                 clock: Callable[[], float] = time.time):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.lock = threading.Lock()
+        # message_sid -> (expires_at, response); the response is None while the first delivery is handled
+        self.entries: 'OrderedDict[str, Tuple[float, Optional[str]]]' = OrderedDict()
+        self.connection = connect(db_path, SCHEMA) if db_path else None
+        self._purged_at = 0.0
+
+    def begin(self, message_sid: str) -> Tuple[bool, Optional[str]]:
+        """
+        Claims a delivery
+
+        Returns:
+            (True, None) if this is the first delivery and the caller should handle it,
+            (False, response) for a duplicate. The response is None while the
+            first delivery is still being handled.
+        """
+        now = self.clock()
+        with self.lock:
+            self._evict(now)
+            entry = self.entries.get(message_sid)
+            if entry is not None:
+                return False, entry[1]
+
+            if self.connection is not None:
+                claimed, response = self._claim_in_db(message_sid, now)
+                if not claimed:
+                    self._remember(message_sid, now, response)
+                    return False, response
+
+            self._remember(message_sid, now, None)
+            return True, None
+
+    def finish(self, message_sid: str, response: str) -> None:
+        """Records the response of a handled delivery, returned for its duplicates"""
+        now = self.clock()
+        with self.lock:
+            self._remember(message_sid, now, response)
+            if self.connection is not None:
+                self.connection.execute(
+                    "UPDATE webhook_deliveries SET response = ?, expires_at = ? WHERE message_sid = ?",
+                    (response, now + self.ttl, message_sid)
+                )
+
+    def _remember(self, message_sid: str, now: float, response: Optional[str]) -> None:
+        self.entries.pop(message_sid, None)
+        self.entries[message_sid] = (now + self.ttl, response)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _evict(self, now: float) -> None:
+        # Entries are kept in insertion order and share one TTL, so expired ones are at the front
+        while self.entries:
+            expires_at = next(iter(self.entries.values()))[0]
+            if expires_at > now:
+                break
+            self.entries.popitem(last=False)
+
+    def _claim_in_db(self, message_sid: str, now: float) -> Tuple[bool, Optional[str]]:
+        if now - self._purged_at >= self.PURGE_INTERVAL:
+            self.connection.execute("DELETE FROM webhook_deliveries WHERE expires_at <= ?", (now,))
+            self._purged_at = now
+
+        cursor = self.connection.execute(
+            "INSERT OR IGNORE INTO webhook_deliveries (message_sid, response, expires_at) VALUES (?, NULL, ?)",
+            (message_sid, now + self.ttl)
+        )
+        if cursor.rowcount == 1:
+            return True, None
+
+        # Take over an entry that expired but was not purged yet
+        cursor = self.connection.execute(
+            "UPDATE webhook_deliveries SET response = NULL, expires_at = ? WHERE message_sid = ? AND expires_at <= ?",
+            (now + self.ttl, message_sid, now)
+        )
+        if cursor.rowcount == 1:
+            return True, None
+
+        row = self.connection.execute(
+            "SELECT response FROM webhook_deliveries WHERE message_sid = ?", (message_sid,)
+        ).fetchone()
+        return False, row['response'] if row is not None else None
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
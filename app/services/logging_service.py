@@ -0,0 +1,114 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from datetime import datetime, timezone
+from typing import Optional
+
+# Logger for per-message Twilio delivery lines; these are sampled (see configure_logging)
+TWILIO_STATUS_LOGGER = 'app.twilio.status'
+
+# Attributes every LogRecord has; anything else was passed through `extra=` and is emitted as a field
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime', 'taskName'}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, including `extra=` fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """Lets through `rate` of the records of one logger (and its children); others pass untouched"""
+
+    def __init__(self, logger_name: str, rate: float):
+        super().__init__()
+        self.logger_name = logger_name
+        self.rate = min(max(rate, 0.0), 1.0)
+        self.lock = threading.Lock()
+        self.seen = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.name != self.logger_name and not record.name.startswith(self.logger_name + '.'):
+            return True
+        with self.lock:
+            self.seen += 1
+            # Deterministic: exactly floor(seen * rate) records have passed after `seen` records
+            return int(self.seen * self.rate) > int((self.seen - 1) * self.rate)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread
+
+    The stock handler formats every record before enqueueing it. The queue
+    stays in this process, so the record can be handed over as is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logging(name: str,
+                      log_dir: Optional[str] = None,
+                      level: Optional[str] = None,
+                      twilio_status_sample_rate: Optional[float] = None) -> logging.handlers.QueueListener:
+    """
+    Routes all logging through a queue to a daily rotating JSON log file
+
+    Request threads only put records on the queue; formatting and disk I/O
+    happen on the listener thread, which is stopped (and flushed) at exit.
+
+    Args:
+        name: Base name of the log file, e.g. 'app' writes logs/app.log
+        log_dir: Directory for log files (LOG_DIR, default 'logs')
+        level: Minimum log level (LOG_LEVEL, default INFO)
+        twilio_status_sample_rate: Share of Twilio delivery lines to keep (TWILIO_STATUS_LOG_SAMPLE_RATE, default 0.1)
+
+    Returns:
+        The started QueueListener
+    """
+    log_dir = log_dir or os.getenv('LOG_DIR', 'logs')
+    level = level or os.getenv('LOG_LEVEL', 'INFO')
+    if twilio_status_sample_rate is None:
+        twilio_status_sample_rate = float(os.getenv('TWILIO_STATUS_LOG_SAMPLE_RATE', '0.1'))
+
+    os.makedirs(log_dir, exist_ok=True)
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        os.path.join(log_dir, f"{name}.log"),
+        when='midnight',
+        backupCount=int(os.getenv('LOG_BACKUP_COUNT', '14')),
+        encoding='utf-8'
+    )
+    file_handler.setFormatter(JsonFormatter())
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    # Sample before enqueueing so dropped records cost nothing further
+    queue_handler.addFilter(SamplingFilter(TWILIO_STATUS_LOGGER, twilio_status_sample_rate))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level.upper())
+
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
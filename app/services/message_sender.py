@@ -0,0 +1,61 @@
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+from app.services.metrics_service import MetricsService
+
+
+class MessageSender:
+    """
+    Wraps a sender (e.g. TwilioService.send) with what every outbound message needs
+
+    The outbox (webhook replies) and the reminder dispatcher both send through
+    it. Each send is timed and counted by outcome in the given MetricsService;
+    messages that still fail after the sender's own retries are appended to a
+    dead-letter file, one JSON object per line, and the error is re-raised.
+    """
+
+    def __init__(self, sender: Callable[[str, str], Any], metrics: Optional[MetricsService] = None,
+                 dead_letter_path: Optional[str] = None):
+        """
+        Args:
+            sender: Callable delivering one message
+            metrics: Registry the send metrics are added to (a private one if None)
+            dead_letter_path: File permanently failed messages are appended to
+        """
+        self.sender = sender
+        self.dead_letter_path = dead_letter_path
+        self.lock = threading.Lock()
+        metrics = metrics or MetricsService()
+        self.send_seconds = metrics.histogram(
+            'message_send_seconds', 'Time spent sending one message, including retries')
+        self.messages = metrics.counter('messages_total', 'Messages handed to the sender, by outcome', ['outcome'])
+
+    def __call__(self, to: str, body: str) -> Any:
+        started = time.perf_counter()
+        try:
+            result = self.sender(to, body)
+        except Exception as e:
+            self.send_seconds.observe(time.perf_counter() - started)
+            self.messages.inc('failed')
+            self._dead_letter(to, body, str(e))
+            raise
+        self.send_seconds.observe(time.perf_counter() - started)
+        self.messages.inc('sent')
+        return result
+
+    def _dead_letter(self, to: str, body: str, error: str) -> None:
+        """Records a permanently failed message so it can be inspected or re-sent"""
+        logging.error("Dead-lettering message to %s: %s", to, error)
+        if not self.dead_letter_path:
+            return
+        entry = {
+            'to': to,
+            'body': body,
+            'error': error,
+            'failed_at': time.time()
+        }
+        with self.lock:
+            with open(self.dead_letter_path, 'a') as dead_letters:
+                dead_letters.write(json.dumps(entry) + "\n")
@@ -0,0 +1,122 @@
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional
+from app.models.outbound_message import OutboundMessage
+from app.services.metrics_service import MetricsService
+
+
+class OutboxService:
+    """
+    Delivers outbound messages in the background with bounded concurrency
+
+    Messages to the same recipient are delivered one after another in the
+    order they were queued (so multi-segment replies never interleave), while
+    different recipients are served in parallel by up to `max_workers` threads.
+    Queue depth, messages in flight and the time from queueing to delivery are
+    exported through the given MetricsService.
+    """
+
+    MAX_TRACKED_MESSAGES = 1000
+
+    def __init__(self, sender: Callable[[str, str], Any], max_workers: int = 4,
+                 metrics: Optional[MetricsService] = None):
+        """
+        Args:
+            sender: Callable delivering one message, e.g. a MessageSender
+            max_workers: Maximum number of messages being delivered at once
+            metrics: Registry the outbox metrics are added to (a private one if None)
+        """
+        self.sender = sender
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='outbox')
+        self.lock = threading.Lock()
+        self._pending: Dict[str, Deque[OutboundMessage]] = {}  # recipient -> queued messages
+        self._messages: 'OrderedDict[str, OutboundMessage]' = OrderedDict()
+        self._in_flight = 0
+        self._counters = {'queued': 0, 'sent': 0, 'failed': 0}
+
+        metrics = metrics or MetricsService()
+        self.delivery_seconds = metrics.histogram(
+            'outbox_delivery_seconds', 'Time from queueing a message to its delivery')
+        metrics.gauge('outbox_queue_depth', 'Messages waiting to be sent', self.pending_count)
+        metrics.gauge('outbox_in_flight', 'Messages currently being sent', lambda: self.stats()['in_flight'])
+
+    def enqueue(self, to: str, body: str) -> OutboundMessage:
+        """Queues a message for delivery and returns immediately"""
+        message = OutboundMessage(to=to, body=body)
+
+        with self.lock:
+            self._track(message)
+            self._counters['queued'] += 1
+            if to in self._pending:
+                # A worker is already draining this recipient's queue
+                self._pending[to].append(message)
+                return message
+            self._pending[to] = deque([message])
+
+        self.executor.submit(self._drain, to)
+        return message
+
+    def get_message(self, message_id: str) -> Optional[OutboundMessage]:
+        """Returns a tracked message by ID, if it was not evicted yet"""
+        with self.lock:
+            return self._messages.get(message_id)
+
+    def pending_count(self) -> int:
+        """Number of messages queued but not yet handed to the sender"""
+        with self.lock:
+            return sum(len(queue) for queue in self._pending.values())
+
+    def stats(self) -> Dict[str, float]:
+        """Queue depth and delivery counters"""
+        with self.lock:
+            return {
+                'queue_depth': sum(len(queue) for queue in self._pending.values()),
+                'in_flight': self._in_flight,
+                **self._counters
+            }
+
+    def _track(self, message: OutboundMessage) -> None:
+        self._messages[message.id] = message
+        while len(self._messages) > self.MAX_TRACKED_MESSAGES:
+            oldest_id, oldest = next(iter(self._messages.items()))
+            if not oldest.is_finished:
+                break
+            del self._messages[oldest_id]
+
+    def _drain(self, to: str) -> None:
+        """Delivers the queued messages of one recipient in order"""
+        while True:
+            with self.lock:
+                queue = self._pending[to]
+                if not queue:
+                    del self._pending[to]
+                    return
+                message = queue.popleft()
+                self._in_flight += 1
+
+            try:
+                self._deliver(message)
+            finally:
+                with self.lock:
+                    self._in_flight -= 1
+                    self._counters[message.status] += 1
+                if message.status == "sent":
+                    self.delivery_seconds.observe(message.sent_at - message.queued_at)
+
+    def _deliver(self, message: OutboundMessage) -> None:
+        message.status = "sending"
+        try:
+            self.sender(message.to, message.body)
+            message.status = "sent"
+        except Exception as e:
+            message.status = "failed"
+            message.error = str(e)
+            logging.error("Error delivering message %s to %s: %s", message.id, message.to, e)
+        message.sent_at = time.monotonic()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops accepting work, optionally waiting for queued messages to be delivered"""
+        self.executor.shutdown(wait=wait)
@@ -0,0 +1,52 @@
+import queue
+import threading
+from typing import Iterator, TypeVar
+
+T = TypeVar('T')
+
+_DONE = object()
+
+
+def prefetch(pages: Iterator[T], max_in_flight: int = 2) -> Iterator[T]:
+    """
+    Fetches pages in a background thread while the caller processes earlier ones
+
+    At most `max_in_flight` fetched pages wait in memory at any time, so memory
+    stays flat however many pages the source has. Exceptions raised while
+    fetching are re-raised in the caller. If the caller stops iterating early,
+    the fetching thread stops after its current page.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max_in_flight)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for page in pages:
+                if not put(page):
+                    return
+        except BaseException as e:
+            put(e)
+            return
+        put(_DONE)
+
+    worker = threading.Thread(target=produce, daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stopped.set()
@@ -0,0 +1,66 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app.models.dispatch_report import DispatchReport, DispatchResult
+from app.models.reminder import Reminder
+
+
+class ReminderDispatcher:
+    """
+    Sends a batch of due reminders in parallel
+
+    A cohort-wide event makes many reminders due at the same moment. They are
+    grouped by (event, offset), so each message text is rendered once, and
+    sent by up to `max_workers` threads at a time. The sender (e.g. a
+    MessageSender around TwilioService.send) keeps to the provider's rate
+    limit, retries, and records what failed for good.
+    """
+
+    def __init__(self, sender: Callable[[str, str], Any], max_workers: int = 16):
+        """
+        Args:
+            sender: Callable delivering one message, e.g. a MessageSender
+            max_workers: Maximum number of reminders being sent at once
+        """
+        self.sender = sender
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='reminders')
+
+    def dispatch(self, reminders: List[Reminder]) -> DispatchReport:
+        """Sends all reminders, waiting until each one was sent or failed"""
+        started = time.perf_counter()
+        groups: Dict[Tuple[str, int], List[Reminder]] = {}
+        for reminder in reminders:
+            groups.setdefault((reminder.event.id, reminder.offset), []).append(reminder)
+
+        futures = []
+        for group in groups.values():
+            body = group[0].render()
+            for reminder in group:
+                futures.append((reminder, self.executor.submit(self._send, reminder.user.phone_number, body, started)))
+
+        report = DispatchReport(groups=len(groups))
+        for reminder, future in futures:
+            latency, error = future.result()
+            report.results.append(DispatchResult(reminder, latency, error))
+            if error:
+                logging.error("Error sending reminder for %s to %s: %s", reminder.event.name, reminder.user.email, error)
+        report.elapsed = time.perf_counter() - started
+
+        logging.info(
+            "Sent %d/%d reminders (%d messages) in %.2fs: %.1f/s, p95 %.2fs, p99 %.2fs",
+            report.sent, len(report.results), report.groups, report.elapsed, report.throughput,
+            report.latency_percentile(0.95), report.latency_percentile(0.99)
+        )
+        return report
+
+    def _send(self, to: str, body: str, started: float) -> Tuple[float, Optional[str]]:
+        try:
+            self.sender(to, body)
+            error = None
+        except Exception as e:
+            error = str(e)
+        return time.perf_counter() - started, error
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.executor.shutdown(wait=wait)
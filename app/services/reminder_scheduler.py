@@ -0,0 +1,274 @@
+import heapq
+import itertools
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from app.models.change_set import ChangeSet
+from app.models.event import Event, to_timestamp
+from app.models.reminder import Reminder
+from app.models.user import User
+from app.services.event_service import EventService
+from app.services.user_service import UserService
+
+# (email, event id)
+ReminderKey = Tuple[str, str]
+# (email, event id, start timestamp, offset in minutes)
+SentKey = Tuple[str, str, int, int]
+
+
+def wall_clock() -> int:
+    return to_timestamp(datetime.now())
+
+
+class ReminderScheduler:
+    """
+    Sends every registered user a reminder `User.reminder` minutes before each event
+
+    Pending reminders live in a min-heap ordered by due time, so scheduling
+    and popping are O(log n). Rescheduled or cancelled reminders are marked
+    invalid and skipped when they reach the top (lazy deletion).
+
+    The heap is kept up to date incrementally through the listeners of the
+    given EventService and UserService: only the reminders of changed events
+    or users are touched. The worker thread sleeps until the next reminder is
+    due; at most every `poll_interval` seconds it also checks (cheaply, via the
+    storage change detection) whether another process changed the data.
+
+    Reminders handed to `dispatch` are remembered until their event starts,
+    so later changes that keep the event's start and the user's offset (a
+    resynced description, a new phone number) do not send them again. With a
+    `sent_path` they are also persisted, so a restarted worker does not resend
+    the reminders that were already due.
+    """
+
+    def __init__(self, event_service: EventService, user_service: UserService,
+                 dispatch: Callable[[List[Reminder]], None],
+                 poll_interval: Optional[float] = None,
+                 clock: Callable[[], float] = wall_clock,
+                 sent_path: Optional[str] = None):
+        """
+        Args:
+            event_service: Source of the events to remind about
+            user_service: Source of the users and their reminder settings
+            dispatch: Called from the worker with all reminders that became due together
+            poll_interval: Max seconds between checks for changes made by other processes
+            clock: Current wall clock timestamp
+            sent_path: JSON file keeping the sent reminders between runs (in memory only if None)
+        """
+        self.event_service = event_service
+        self.user_service = user_service
+        self.dispatch = dispatch
+        self.poll_interval = poll_interval if poll_interval is not None else \
+            float(os.getenv('REMINDER_POLL_INTERVAL', '60'))
+        self.clock = clock
+        self.sent_path = sent_path
+        self.condition = threading.Condition()
+        self._heap: List[list] = []  # [due_at, sequence, key, valid]
+        self._entries: Dict[ReminderKey, list] = {}
+        self._sequence = itertools.count()
+        self._events: Dict[str, Tuple[int, Event]] = {}  # event id -> (start timestamp, event), upcoming only
+        self._users: Dict[str, Tuple[int, User]] = {}  # email -> (offset in minutes, user), reminders enabled only
+        self._sent: Set[SentKey] = set()  # popped reminders of events yet to start
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+        self._load_sent()
+        self.sync_users(None)
+        self.sync_events(None)
+        event_service.add_listener(self.sync_events)
+        user_service.add_listener(self.sync_users)
+
+    def __len__(self) -> int:
+        """Number of pending reminders"""
+        with self.condition:
+            return len(self._entries)
+
+    def next_due(self) -> Optional[float]:
+        """Due time of the earliest pending reminder, if any"""
+        with self.condition:
+            self._drop_invalid()
+            return self._heap[0][0] if self._heap else None
+
+    # Keeping the heap up to date
+
+    def sync_events(self, changes: Optional[ChangeSet]) -> None:
+        """Reschedules the reminders of changed events; None compares all events to the scheduled ones"""
+        now = self.clock()
+        with self.condition:
+            if changes is None:
+                current = {event.id: event for event in self.event_service.iter_events()}
+                removed = [event_id for event_id in self._events if event_id not in current]
+                changed = []
+                for event_id, event in current.items():
+                    known = self._events.get(event_id)
+                    if known is not None and known[1] == event:
+                        self._events[event_id] = (known[0], event)  # reloaded, but unchanged
+                    else:
+                        changed.append(event)
+            else:
+                removed = [event.id for event in changes.removed]
+                changed = changes.updated + changes.added
+
+            for event_id in removed:
+                self._unschedule_event(event_id)
+            for event in changed:
+                self._unschedule_event(event.id)
+                start = event.start_timestamp
+                if start > now:
+                    self._events[event.id] = (start, event)
+                    for offset, user in self._users.values():
+                        self._schedule(user, event, start, offset, now)
+            self._forget_sent(now)
+            self._compact()
+            self.condition.notify()
+
+    def sync_users(self, changed: Optional[List[User]]) -> None:
+        """Reschedules the reminders of changed users; None compares all users to the scheduled ones"""
+        now = self.clock()
+        with self.condition:
+            if changed is None:
+                current = {user.email: user for user in self.user_service.get_all_users()}
+                for email in [email for email in self._users if email not in current]:
+                    self._unschedule_user(email)
+                changed = list(current.values())
+
+            for user in changed:
+                offset = user.reminder if user.reminder and user.is_registered else None
+                known = self._users.get(user.email)
+                if known is not None and known[0] == offset and known[1].phone_number == user.phone_number:
+                    self._users[user.email] = (offset, user)  # reloaded, but reminders unchanged
+                    continue
+                self._unschedule_user(user.email)
+                if offset is None:
+                    continue
+                self._users[user.email] = (offset, user)
+                for start, event in self._events.values():
+                    self._schedule(user, event, start, offset, now)
+            self._forget_sent(now)
+            self._compact()
+            self.condition.notify()
+
+    def _schedule(self, user: User, event: Event, start: int, offset: int, now: float) -> None:
+        # Started events get no reminder; late ones for events yet to start are due right away
+        if start <= now or (user.email, event.id, start, offset) in self._sent:
+            return
+        entry = [start - offset * 60, next(self._sequence), (user.email, event.id), True]
+        self._entries[entry[2]] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _unschedule_event(self, event_id: str) -> None:
+        if self._events.pop(event_id, None) is None:
+            return
+        for email in self._users:
+            entry = self._entries.pop((email, event_id), None)
+            if entry is not None:
+                entry[-1] = False
+
+    def _unschedule_user(self, email: str) -> None:
+        if self._users.pop(email, None) is None:
+            return
+        for event_id in self._events:
+            entry = self._entries.pop((email, event_id), None)
+            if entry is not None:
+                entry[-1] = False
+
+    def _forget_sent(self, now: float) -> None:
+        # Started events are never scheduled again, so their sent reminders need no tracking
+        if any(key[2] <= now for key in self._sent):
+            self._sent = {key for key in self._sent if key[2] > now}
+            self._save_sent()
+
+    def _load_sent(self) -> None:
+        if self.sent_path is None:
+            return
+        try:
+            with open(self.sent_path, 'r') as json_file:
+                self._sent = {tuple(key) for key in json.load(json_file)}
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, ValueError, TypeError) as e:
+            logging.error("Ignoring unreadable sent reminders in %s: %s", self.sent_path, e)
+
+    def _save_sent(self) -> None:
+        # Replaces the file atomically, like the sync state
+        if self.sent_path is None:
+            return
+        temp_path = f"{self.sent_path}.tmp"
+        with open(temp_path, 'w') as json_file:
+            json.dump(sorted(self._sent), json_file)
+        os.replace(temp_path, self.sent_path)
+
+    def _compact(self) -> None:
+        # Cancelled entries stay in the heap until popped; rebuild once they dominate it
+        if len(self._heap) > 2 * len(self._entries) + 1024:
+            self._heap = [entry for entry in self._heap if entry[-1]]
+            heapq.heapify(self._heap)
+
+    def _drop_invalid(self) -> None:
+        while self._heap and not self._heap[0][-1]:
+            heapq.heappop(self._heap)
+
+    def pop_due(self, now: Optional[float] = None) -> List[Reminder]:
+        """Removes and returns all reminders due at `now` (default: the clock)"""
+        now = self.clock() if now is None else now
+        due = []
+        with self.condition:
+            while self._heap and (not self._heap[0][-1] or self._heap[0][0] <= now):
+                due_at, _, key, valid = heapq.heappop(self._heap)
+                if not valid:
+                    continue
+                del self._entries[key]
+                email, event_id = key
+                offset, user = self._users[email]
+                start, event = self._events[event_id]
+                self._sent.add((email, event_id, start, offset))
+                due.append(Reminder(due_at, user, event, offset))
+            if due:
+                # Before dispatching: a crash may lose a reminder, but a restart never repeats one
+                self._save_sent()
+        return due
+
+    # Worker
+
+    def start(self) -> None:
+        """Runs the worker in a background thread"""
+        self._stopped = False
+        self._thread = threading.Thread(target=self.run, name='reminder-scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the worker"""
+        with self.condition:
+            self._stopped = True
+            self.condition.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def run(self) -> None:
+        """Dispatches reminders as they become due, until stopped"""
+        while True:
+            # Picks up changes written by other processes (e.g. the import CLIs)
+            self.event_service.reload_if_changed()
+            self.user_service.reload_if_changed()
+
+            due = self.pop_due()
+            if due:
+                try:
+                    self.dispatch(due)
+                except Exception as e:
+                    logging.error("Error dispatching %d reminders: %s", len(due), e)
+                continue
+
+            with self.condition:
+                if self._stopped:
+                    return
+                self._drop_invalid()
+                timeout = self.poll_interval
+                if self._heap:
+                    timeout = min(timeout, max(0.0, self._heap[0][0] - self.clock()))
+                self.condition.wait(timeout)
+                if self._stopped:
+                    return
@@ -1,16 +1,38 @@
-from typing import Dict, List, Callable, Tuple
+from typing import Dict, List, Callable, Optional, Tuple
 import logging
+import os
 
 from app.models.command import Command
+from app.models.request_context import RequestContext
+from app.services.metrics_service import MetricsService
+from app.services.throttling import SlidingWindowLimiter
 from app.services.user_service import UserService
 
 class RouterService:
-    def __init__(self):
+    RATE_LIMITED_REPLY = """⏳ Slow Down
+
+You are sending messages too quickly. Please wait a minute and try again."""
+
+    def __init__(self, metrics: Optional[MetricsService] = None):
         self.commands: Dict[str, Command] = {}
         self._register_commands()
         self.public_commands = ["!help", "!register", "!validate"]
         self.user_service = UserService()
 
+        # Flood protection per sender, over all messages and per command
+        self.rate_limiter = SlidingWindowLimiter()
+        self.rate_limit = (
+            int(os.getenv('ROUTER_RATE_LIMIT', '20')),
+            float(os.getenv('ROUTER_RATE_WINDOW', '60'))
+        )
+
+        self.metrics = metrics or MetricsService()
+        self.stage_seconds = self.metrics.webhook_stage_seconds
+        self.handler_seconds = self.metrics.histogram(
+            'command_handler_seconds', 'Time spent executing a command handler', ['command'])
+        self.outcomes = self.metrics.counter(
+            'router_outcomes_total', 'Routed messages by outcome', ['outcome'])
+
     def _register_commands(self):
         """Register all available commands"""
         self.register_command(
@@ -21,9 +43,19 @@ class RouterService:
             help_text="Show available commands"
         )
 
-    def register_command(self, name: str, handler: Callable, min_args: int, max_args: int, help_text: str):
-        """Register a new command"""
-        self.commands[name] = Command(name, handler, min_args, max_args, help_text)
+    def register_command(self, name: str, handler: Callable, min_args: int, max_args: int, help_text: str,
+                         rate_limit: Optional[Tuple[int, float]] = None):
+        """
+        Register a new command
+
+        Handlers are called as handler(args, wa_id, phone_number). Handlers that
+        also accept a `context` keyword argument receive the RequestContext,
+        including the already resolved user.
+
+        `rate_limit` is an optional (max calls, per seconds) limit per sender for
+        this command, on top of the router-wide limit.
+        """
+        self.commands[name] = Command(name, handler, min_args, max_args, help_text, rate_limit)
 
     def parse_message(self, message: str) -> Tuple[str, List[str]]:
         """Parse message into command and arguments"""
@@ -35,23 +67,58 @@ class RouterService:
         args = parts[1:]
         return command, args
 
+    def _check_rate_limit(self, sender: str, command: str) -> Optional[str]:
+        """Returns the reply for a throttled sender (empty for no reply), or None if the message may be routed"""
+        limits = [('*', self.rate_limit)]
+        cmd = self.commands.get(command)
+        if cmd is not None and cmd.rate_limit is not None:
+            limits.append((command, cmd.rate_limit))
+
+        for bucket, (limit, window) in limits:
+            rejected = self.rate_limiter.check((sender, bucket), limit, window)
+            if rejected:
+                self.outcomes.inc('rate_limited')
+                # Tell the sender once, then stay silent until they slow down
+                return self.RATE_LIMITED_REPLY if rejected == 1 else ""
+        return None
+
     def route(self, message: str, wa_id: str, phone_number: str) -> str:
         """Route the message to appropriate handler"""
-        command, args = self.parse_message(message)
+        with self.stage_seconds.time('parse'):
+            command, args = self.parse_message(message)
+
+        # Throttle floods before touching any storage
+        throttled_reply = self._check_rate_limit(wa_id or phone_number, command)
+        if throttled_reply is not None:
+            logging.info("Rate limited %s for command %s", wa_id or phone_number, command)
+            return throttled_reply
 
         # Log the routing attempt
-        logging.info(f"Routing command: {command} with args: {args}")
+        logging.info("Routing command: %s with args: %s", command, args)
+
+        # Resolve the user once for the whole request
+        with self.stage_seconds.time('user_resolution'):
+            user = self.user_service.get_user_by_wa_id(wa_id) if wa_id else None
+        context = RequestContext(
+            wa_id=wa_id,
+            phone_number=phone_number,
+            command=command,
+            args=args,
+            user=user
+        )
 
         # If no command or unrecognized command, show help
         if not command or command not in self.commands:
+            self.outcomes.inc('unknown_command')
             return f"""❓ Unknown Command
 
-{self._handle_help([], wa_id, phone_number)}"""
+{self._handle_help([], wa_id, phone_number, context=context)}"""
 
         cmd = self.commands[command]
 
         # Validate number of arguments
         if len(args) < cmd.min_args:
+            self.outcomes.inc('missing_arguments')
             return f"""⚠️ Missing Information
 
 The command {command} requires more information.
@@ -60,6 +127,7 @@ The command {command} requires more information.
 Type !help for more details."""
 
         if len(args) > cmd.max_args:
+            self.outcomes.inc('too_many_arguments')
             return f"""⚠️ Too Much Information
 
 The command {command} was given too many arguments.
@@ -68,8 +136,8 @@ The command {command} was given too many arguments.
 Type !help for more details."""
 
         # Check if the command requires registration
-        user = self.user_service.get_user_by_wa_id(wa_id)
-        if command not in self.public_commands and user is None:
+        if command not in self.public_commands and context.user is None:
+            self.outcomes.inc('registration_required')
             return f"""🔒 Registration Required
 
 This command is only available for registered users.
@@ -81,15 +149,26 @@ To register:
 
         # Execute the command
         try:
-            return cmd.handler(args, wa_id, phone_number)
+            with self.handler_seconds.time(command):
+                if cmd.accepts_context:
+                    response = cmd.handler(args, wa_id, phone_number, context=context)
+                else:
+                    response = cmd.handler(args, wa_id, phone_number)
+            self.outcomes.inc('ok')
+            return response
         except Exception as e:
-            logging.error(f"Error executing command {command}: {str(e)}")
+            self.outcomes.inc('handler_error')
+            logging.error("Error executing command %s: %s", command, e)
             return str(e)
 
-    def _handle_help(self, args: List[str], wa_id: str, phone_number: str) -> str:
+    def _handle_help(self, args: List[str], wa_id: str, phone_number: str,
+                     context: Optional[RequestContext] = None) -> str:
         """Handle !help command"""
         # Check if user is registered to show appropriate help
-        user = self.user_service.get_user_by_wa_id(wa_id) if wa_id else None
+        if context is not None:
+            user = context.user
+        else:
+            user = self.user_service.get_user_by_wa_id(wa_id) if wa_id else None
 
         response = """📱 Better Calendar Commands
 
@@ -0,0 +1,95 @@
+from typing import Dict, Iterable
+from app.models.change_set import ChangeSet
+from app.models.event import Event
+from app.models.import_report import ImportReport
+from app.services.event_service import EventService
+
+
+class SyncPlan:
+    """
+    Minimal change set for one source, built item by item
+
+    Incoming events are matched to stored events on (source, source_id):
+    unknown items become inserts, items whose content differs become updates
+    (keeping the stored event ID), identical items are dropped. Cancelled
+    upstream items become deletions.
+    """
+
+    def __init__(self, event_service: EventService, source: str):
+        self.event_service = event_service
+        self.source = source
+        self.unchanged = 0
+        self._added: Dict[str, Event] = {}
+        self._updated: Dict[str, Event] = {}
+        self._removed: Dict[str, Event] = {}
+
+    @staticmethod
+    def _content(event: Event) -> dict:
+        content = event.to_dict()
+        del content['id']
+        return content
+
+    def upsert(self, event: Event) -> None:
+        """Plans an insert or update for an event coming from the source"""
+        self._removed.pop(event.source_id, None)
+        existing = self.event_service.find_event_by_source_id(self.source, event.source_id)
+
+        if existing is None:
+            self._added[event.source_id] = event
+        elif self._content(existing) != self._content(event):
+            event.id = existing.id
+            self._updated[event.source_id] = event
+        else:
+            self._updated.pop(event.source_id, None)
+            self.unchanged += 1
+
+    def cancel(self, source_id: str) -> None:
+        """Plans the deletion of an event cancelled at the source"""
+        self._added.pop(source_id, None)
+        self._updated.pop(source_id, None)
+        existing = self.event_service.find_event_by_source_id(self.source, source_id)
+        if existing is not None:
+            self._removed[source_id] = existing
+
+    @property
+    def changes(self) -> ChangeSet:
+        return ChangeSet(
+            added=list(self._added.values()),
+            updated=list(self._updated.values()),
+            removed=list(self._removed.values())
+        )
+
+
+class SyncService:
+    def __init__(self, event_service: EventService):
+        self.event_service = event_service
+
+    def plan(self, source: str) -> SyncPlan:
+        """Starts a new sync plan for the given source"""
+        self.event_service.reload_if_changed()
+        return SyncPlan(self.event_service, source)
+
+    def apply(self, plan: SyncPlan) -> ImportReport:
+        """Persists the planned changes in one save; nothing is written if nothing changed"""
+        report = self.event_service.apply_changes(plan.changes)
+        report.unchanged = plan.unchanged
+        return report
+
+    def sync(self, source: str, events: Iterable[Event], cancelled_ids: Iterable[str] = ()) -> ImportReport:
+        """
+        Syncs events from a source into local storage
+
+        Args:
+            source: Source the events come from (e.g. "google", "calendly")
+            events: Current events at the source
+            cancelled_ids: source_ids of events cancelled at the source
+
+        Returns:
+            ImportReport with the applied inserts, updates and deletions
+        """
+        plan = self.plan(source)
+        for event in events:
+            plan.upsert(event)
+        for source_id in cancelled_ids:
+            plan.cancel(source_id)
+        return self.apply(plan)
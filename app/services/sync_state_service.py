@@ -0,0 +1,41 @@
+import json
+import os
+from typing import Dict
+
+
+class SyncStateService:
+    """Persists per-source sync cursors (sync tokens, last-updated timestamps) between runs"""
+
+    def __init__(self, file_path: str = 'storage/sync_state.json'):
+        self.file_path = file_path
+        self.state: Dict[str, dict] = {}
+        self.load_state()
+
+    def load_state(self) -> None:
+        """Loads the sync state from the JSON file"""
+        try:
+            with open(self.file_path, 'r') as json_file:
+                self.state = json.load(json_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.state = {}
+
+    def save_state(self) -> None:
+        """Saves the sync state, replacing the file atomically"""
+        temp_path = f"{self.file_path}.tmp"
+        with open(temp_path, 'w') as json_file:
+            json.dump(self.state, json_file, indent=4)
+        os.replace(temp_path, self.file_path)
+
+    def get(self, source: str) -> dict:
+        """Returns the stored cursor for a source (empty if it was never synced)"""
+        return dict(self.state.get(source, {}))
+
+    def update(self, source: str, **values) -> None:
+        """Stores new cursor values for a source"""
+        self.state[source] = {**self.state.get(source, {}), **values}
+        self.save_state()
+
+    def reset(self, source: str) -> None:
+        """Forgets the cursor of a source, forcing a full resync"""
+        if self.state.pop(source, None) is not None:
+            self.save_state()
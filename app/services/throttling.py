@@ -0,0 +1,111 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Hashable, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how often an action may happen
+
+    Tokens refill at `rate` per second up to `capacity`. `acquire` reserves a
+    token and sleeps until it is available, so concurrent callers are spread
+    out evenly instead of all failing at once.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.clock = clock
+        self.sleep = sleep
+        self.lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Takes a token if one is available right now"""
+        with self.lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def acquire(self) -> float:
+        """Takes a token, waiting for it if necessary. Returns the seconds waited."""
+        with self.lock:
+            self._refill()
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            self.sleep(wait)
+        return wait
+
+
+class SlidingWindowLimiter:
+    """
+    Thread-safe per-key sliding-window limiter, e.g. keyed on the sender
+
+    A key may make at most `limit` calls within any `window` seconds; each key
+    keeps the timestamps of its recent calls. Keys that have been idle for
+    longer than the longest window seen are evicted, and at most `max_keys`
+    keys are tracked, so memory stays bounded.
+    """
+
+    def __init__(self, max_keys: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self.lock = threading.Lock()
+        # key -> (timestamps of allowed calls, calls rejected in a row), least recently used first
+        self._windows: 'OrderedDict[Hashable, list]' = OrderedDict()
+        self._longest_window = 0.0
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def check(self, key: Hashable, limit: int, window: float) -> int:
+        """
+        Records a call for `key` if it is within the limit
+
+        Returns:
+            0 if the call is allowed, otherwise the number of calls rejected
+            in a row (1 for the first rejected call)
+        """
+        now = self.clock()
+        with self.lock:
+            self._longest_window = max(self._longest_window, window)
+            self._evict(now)
+
+            entry = self._windows.get(key)
+            if entry is None:
+                entry = self._windows[key] = [deque(), 0]
+            else:
+                self._windows.move_to_end(key)
+            calls = entry[0]
+
+            while calls and calls[0] <= now - window:
+                calls.popleft()
+            if len(calls) >= limit:
+                entry[1] += 1
+                return entry[1]
+
+            calls.append(now)
+            entry[1] = 0
+            return 0
+
+    def _evict(self, now: float) -> None:
+        while self._windows:
+            key, (calls, _) = next(iter(self._windows.items()))
+            idle = not calls or calls[-1] <= now - self._longest_window
+            if not idle and len(self._windows) < self.max_keys:
+                break
+            del self._windows[key]
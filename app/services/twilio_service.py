@@ -1,16 +1,39 @@
+import random
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from requests.adapters import HTTPAdapter
+from twilio.base.exceptions import TwilioRestException
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
 from dotenv import load_dotenv
 import os
 import logging
 from twilio.rest.api.v2010.account.message import MessageInstance
+from app.services.delivery_status_service import DeliveryStatusService
+from app.services.logging_service import TWILIO_STATUS_LOGGER
+from app.services.metrics_service import MetricsService
+from app.services.throttling import TokenBucket
+
+status_log = logging.getLogger(TWILIO_STATUS_LOGGER)
 
 
 class TwilioService:
     MESSAGE_LIMIT = 1500  # Twilio's character limit per message
 
-    def __init__(self):
+    # Default throughput per sender: WhatsApp senders allow 80 messages per
+    # second, SMS long codes 1. Override with TWILIO_MESSAGES_PER_SECOND.
+    WHATSAPP_MESSAGES_PER_SECOND = 80
+    SMS_MESSAGES_PER_SECOND = 1
+
+    SEGMENT_PREFIX_LENGTH = len("(99/99) ")
+
+    MAX_RETRIES = 4
+    RETRY_BASE_DELAY = 0.5  # seconds, doubled on every retry
+    RETRY_MAX_DELAY = 8.0
+
+    def __init__(self, client: Optional[Client] = None, delivery_status: Optional[DeliveryStatusService] = None,
+                 metrics: Optional[MetricsService] = None):
         load_dotenv()
         self.account_sid = os.getenv('TWILIO_ACCOUNT_SID')
         self.auth_token = os.getenv('TWILIO_AUTH_TOKEN')
@@ -23,64 +46,107 @@ class TwilioService:
                 "TWILIO_AUTH_TOKEN, and TWILIO_PHONE_NUMBER are set in your .env file"
             )
 
+        # Twilio reports delivery progress to this URL instead of us polling for it
+        base_url = os.getenv('BASE_URL')
+        self.status_callback_url = os.getenv(
+            'TWILIO_STATUS_CALLBACK_URL',
+            f"{base_url.rstrip('/')}/twilio/status" if base_url else None
+        )
+        self.delivery_status = delivery_status or DeliveryStatusService(os.getenv('TWILIO_STATUS_LOG'))
+
+        # Stay within the sender's throughput limit
+        default_rate = (self.WHATSAPP_MESSAGES_PER_SECOND if self.sender_number.startswith('whatsapp:')
+                        else self.SMS_MESSAGES_PER_SECOND)
+        self.rate_limiter = TokenBucket(float(os.getenv('TWILIO_MESSAGES_PER_SECOND', default_rate)))
+
+        # API calls, exported on /metrics when a shared registry is given
+        metrics = metrics or MetricsService()
+        self.requests = metrics.counter('twilio_requests_total', 'Message create calls made to Twilio')
+        self.retries = metrics.counter('twilio_retries_total', 'Twilio calls retried after a 429 or 5xx')
+        self.failures = metrics.counter('twilio_failures_total', 'Messages Twilio did not accept, after retries')
+        self.throttled_seconds = metrics.counter(
+            'twilio_throttled_seconds_total', 'Time spent waiting for the sender rate limit')
+        self.request_seconds = metrics.histogram('twilio_request_seconds', 'Duration of a single Twilio API call')
+
+        # Segments of one reply are sent concurrently, over one pooled keep-alive session
+        self.segment_workers = int(os.getenv('TWILIO_SEGMENT_WORKERS', '5'))
+        self.segment_executor = ThreadPoolExecutor(max_workers=self.segment_workers,
+                                                   thread_name_prefix='twilio-segment')
+
         # Initialize Twilio client
-        self.client = Client(self.account_sid, self.auth_token)
+        self.client = client or Client(self.account_sid, self.auth_token, http_client=self._create_http_client())
+
+    def _create_http_client(self) -> TwilioHttpClient:
+        """HTTP client reusing one connection pool (keep-alive) for all API calls"""
+        http_client = TwilioHttpClient(pool_connections=True)
+        # Enough pooled connections for every concurrently sending thread
+        http_client.session.mount('https://', HTTPAdapter(pool_maxsize=max(10, self.segment_workers * 4)))
+        return http_client
 
     def _segment_message(self, message_text: str) -> List[str]:
-        """Split message into segments if it exceeds the character limit"""
+        """Split message into numbered segments if it exceeds the character limit"""
         if len(message_text) <= self.MESSAGE_LIMIT:
             return [message_text]
 
+        # Leave room for the "(i/n) " sequence number
+        limit = self.MESSAGE_LIMIT - self.SEGMENT_PREFIX_LENGTH
         segments = []
         remaining_text = message_text
 
         while remaining_text:
             # Find the last space within the limit to avoid breaking words
-            if len(remaining_text) > self.MESSAGE_LIMIT:
-                split_index = remaining_text.rfind(' ', 0, self.MESSAGE_LIMIT)
-                if split_index == -1:  # No space found, force split at limit
-                    split_index = self.MESSAGE_LIMIT
+            if len(remaining_text) > limit:
+                split_index = remaining_text.rfind(' ', 0, limit)
+                if split_index <= 0:  # No space found, force split at limit
+                    split_index = limit
             else:
                 split_index = len(remaining_text)
 
-            # Add segment number if there are multiple segments
-            segment = remaining_text[:split_index]
-            if len(message_text) > self.MESSAGE_LIMIT:
-                segments.append(f"({len(segments) + 1}/{(len(message_text) - 1) // self.MESSAGE_LIMIT + 1}) {segment}")
-            else:
-                segments.append(segment)
+            segments.append(remaining_text[:split_index])
 
             # Update remaining text
             remaining_text = remaining_text[split_index:].strip()
 
-        return segments
+        # Number the segments, so they can be read in order even if they arrive out of order
+        return [f"({number}/{len(segments)}) {segment}" for number, segment in enumerate(segments, 1)]
+
+    @staticmethod
+    def _is_retryable(error: TwilioRestException) -> bool:
+        """Rate limiting (429) and server errors (5xx) are worth retrying"""
+        return error.status == 429 or (error.status or 0) >= 500
+
+    def _create_message(self, **params) -> MessageInstance:
+        """Create a message within the rate limit, retrying 429/5xx with jittered exponential backoff"""
+        for attempt in range(self.MAX_RETRIES + 1):
+            self.throttled_seconds.inc(amount=self.rate_limiter.acquire())
+            self.requests.inc()
+            try:
+                with self.request_seconds.time():
+                    return self.client.messages.create(**params)
+            except TwilioRestException as e:
+                error = e
+
+            if not self._is_retryable(error) or attempt == self.MAX_RETRIES:
+                self.failures.inc()
+                raise error
+            delay = random.uniform(0, min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt))
+            logging.warning("Twilio returned %s, retrying in %.2fs (attempt %d)", error.status, delay, attempt + 1)
+            self.retries.inc()
+            time.sleep(delay)
 
     def _send_single_message(self, to: str, message_text: str) -> MessageInstance:
-        """Send a single message and track its status"""
-        logging.info(f"Attempting to send message to {to}")
-        logging.info(f"Using sender number: {self.sender_number}")
-
-        message = self.client.messages.create(
-            to=to,
-            from_=self.sender_number,
-            body=message_text
-        )
+        """Send a single message; its delivery status arrives through the status callback"""
+        status_log.info("Attempting to send message to %s from %s", to, self.sender_number)
 
-        logging.info(f"Message sent. SID: {message.sid}")
-        logging.info(f"Initial status: {message.status}")
+        params = {}
+        if self.status_callback_url:
+            params['status_callback'] = self.status_callback_url
 
-        # Track message status for a few seconds
-        for _ in range(5):  # Check status 5 times
-            updated_message = self.client.messages(message.sid).fetch()
-            logging.info(f"Updated status: {updated_message.status}")
+        message = self._create_message(to=to, from_=self.sender_number, body=message_text, **params)
 
-            if updated_message.status == 'delivered':
-                break
-            if updated_message.error_code:
-                logging.error(f"Error code: {updated_message.error_code}")
-                logging.error(f"Error message: {updated_message.error_message}")
-                break
-            time.sleep(2)  # Wait 2 seconds between checks
+        status_log.info("Message sent. SID: %s, initial status: %s", message.sid, message.status)
+        # A callback may already have reported a later status; record() then keeps that one
+        self.delivery_status.record(message.sid, message.status, to=to)
 
         return message
 
@@ -88,24 +154,23 @@ class TwilioService:
         """
         Send message, automatically splitting into segments if needed
 
+        Segments are sent concurrently; each carries its sequence number.
+
         Args:
             to: Recipient phone number
             message_text: Message content
 
         Returns:
-            List of MessageInstance objects (one per segment)
+            List of MessageInstance objects (one per segment, in segment order)
         """
         try:
-            messages = []
             segments = self._segment_message(message_text)
+            if len(segments) == 1:
+                return [self._send_single_message(to, segments[0])]
 
-            for segment in segments:
-                message = self._send_single_message(to, segment)
-                messages.append(message)
-                if len(segments) > 1:
-                    time.sleep(1)  # Brief pause between segments
-
-            return messages
+            futures = [self.segment_executor.submit(self._send_single_message, to, segment)
+                       for segment in segments]
+            return [future.result() for future in futures]
         except Exception as e:
-            logging.error(f"Error sending message: {str(e)}")
-            raise
\ No newline at end of file
+            logging.error("Error sending message: %s", e)
+            raise
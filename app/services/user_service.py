@@ -1,36 +1,55 @@
-import json
 import re
-from typing import List, Optional, Dict
+import threading
+from typing import Callable, List, Optional, Dict
 from app.models.user import User
+from app.storage.base import UserStorage
+from app.storage.factory import create_user_storage
 
 class UserService:
-    def __init__(self, file_path = 'storage/users.json'):
-        """Initializes the UserService with users from a JSON file."""
+    def __init__(self, file_path = 'storage/users.json', storage: Optional[UserStorage] = None):
+        """Initializes the UserService with users from the configured storage."""
         self.json_file = file_path
+        self.storage = storage or create_user_storage(file_path)
         self.users: Dict[str, User] = {}  # email -> User mapping
+        self.users_by_wa_id: Dict[str, User] = {}  # wa_id -> User mapping
+        self.lock = threading.RLock()  # guards reloads and mutations of the mappings
+        self.listeners: List[Callable[[Optional[List[User]]], None]] = []
         self.load_users_from_json()
 
+    @property
+    def version(self) -> int:
+        """Data version, bumped whenever users are loaded or saved."""
+        return self.storage.version
+
+    def add_listener(self, listener: Callable[[Optional[List[User]]], None]) -> None:
+        """Registers a callback invoked after every save with the changed users (None after a reload: all of them)."""
+        self.listeners.append(listener)
+
+    def _notify(self, changed: Optional[List[User]]) -> None:
+        for listener in self.listeners:
+            listener(changed)
+
     def load_users_from_json(self) -> None:
-        """Loads users from the JSON file containing an array of user objects."""
-        try:
-            with open(self.json_file, 'r') as file:
-                user_list = json.load(file)  # Directly loads the array
-                for user_data in user_list:
-                    user = User.from_dict(user_data)
-                    self.users[user.email] = user
-        except FileNotFoundError:
-            raise ValueError(f"Error: The file '{self.json_file}' was not found.")
-        except json.JSONDecodeError:
-            raise ValueError(f"Error: The file '{self.json_file}' is not a valid JSON.")
-
-    def save_users(self) -> None:
-        """Saves users as an array to the JSON file."""
-        with open(self.json_file, 'w') as file:
-            json.dump(
-                [user.to_dict() for user in self.users.values()],
-                file,
-                indent=4
-            )
+        """Loads users from storage (the JSON file by default)."""
+        # Build the mappings first and swap them in whole: lookups read them without the lock
+        users = {user.email: user for user in self.storage.load()}
+        users_by_wa_id: Dict[str, User] = {}
+        for user in users.values():
+            if user.wa_id:
+                users_by_wa_id.setdefault(user.wa_id, user)
+        self.users, self.users_by_wa_id = users, users_by_wa_id
+        self._notify(None)
+
+    def reload_if_changed(self) -> None:
+        """Reloads users only if the storage changed since it was last read or written."""
+        with self.lock:
+            if self.storage.has_changed():
+                self.load_users_from_json()
+
+    def save_users(self, changed: Optional[List[User]] = None) -> None:
+        """Saves users to storage, writing only the changed users where the backend supports it."""
+        self.storage.save(list(self.users.values()), changed)
+        self._notify(changed)
 
     def get_user_by_email(self, email: str) -> User:
         """Returns the user with the given email or raises ValueError."""
@@ -40,17 +59,19 @@ class UserService:
 
     def get_user_by_wa_id(self, wa_id: str) -> Optional[User]:
         """Returns the user with the given WhatsApp ID or None."""
-        self.load_users_from_json()
-        for user in self.users.values():
-            if user.wa_id == wa_id:
-                return user
-        return None
+        self.reload_if_changed()
+        return self.users_by_wa_id.get(wa_id)
 
     def link_whatsapp(self, email: str, wa_id: str, phone_number: str) -> None:
         """Links WhatsApp information to a user account."""
-        user = self.get_user_by_email(email)
-        self.users[email].update_whatsapp_info(phone_number, wa_id)
-        self.save_users()
+        with self.lock:
+            user = self.get_user_by_email(email)
+            if user.wa_id and self.users_by_wa_id.get(user.wa_id) is user:
+                del self.users_by_wa_id[user.wa_id]
+            user.update_whatsapp_info(phone_number, wa_id)
+            if wa_id:
+                self.users_by_wa_id[wa_id] = user
+            self.save_users([user])
 
 
     def is_validated(self, wa_id: str) -> bool:
@@ -73,9 +94,10 @@ class UserService:
 
     def set_validation_code(self, email: str, code: str) -> None:
         """Sets a new validation code for the user and returns it."""
-        self.load_users_from_json()
-        self.users[email].validation_code = code
-        self.save_users()
+        with self.lock:
+            self.reload_if_changed()
+            self.users[email].validation_code = code
+            self.save_users([self.users[email]])
 
     def verify_code(self, email: str, code: str) -> bool:
         """Verifies if the provided code matches the stored validation code."""
@@ -84,7 +106,8 @@ class UserService:
 
     def update_reminder(self, email: str, reminder_time: int) -> None:
         """Updates the reminder time for a user"""
-        self.load_users_from_json()
-        user = self.get_user_by_email(email)
-        self.users[email].reminder = reminder_time
-        self.save_users()
\ No newline at end of file
+        with self.lock:
+            self.reload_if_changed()
+            user = self.get_user_by_email(email)
+            self.users[email].reminder = reminder_time
+            self.save_users([self.users[email]])
\ No newline at end of file
@@ -0,0 +1,249 @@
+import html
+import logging
+import os
+from string import Template
+from typing import Mapping, Tuple
+from app.services.idempotency_service import IdempotencyService
+from app.services.logging_service import TWILIO_STATUS_LOGGER
+from app.services.message_sender import MessageSender
+from app.services.metrics_service import MetricsService
+from app.services.outbox_service import OutboxService
+from app.services.router_service import RouterService
+from app.services.twilio_service import TwilioService
+from app.services.user_service import UserService
+from app.services.validation_service import ValidationService
+from app.routes.routes import configure_routes
+
+# (HTTP status, body, content type)
+Response = Tuple[int, str, str]
+
+TEXT = 'text/plain; charset=utf-8'
+HTML = 'text/html; charset=utf-8'
+
+# HTML template for verification response
+VERIFY_TEMPLATE = Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>What's Academy Better Calendar - Email Verification</title>
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 600px;
+            margin: 20px auto;
+            padding: 20px;
+            text-align: center;
+        }
+        .container {
+            background-color: white;
+            border-radius: 10px;
+            padding: 20px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        .success {
+            color: #2ecc71;
+            font-size: 64px;
+            margin: 0;
+        }
+        .error {
+            color: #e74c3c;
+            font-size: 64px;
+            margin: 0;
+        }
+        h1 {
+            color: #2c3e50;
+            margin-top: 10px;
+        }
+        p {
+            color: #666;
+            font-size: 18px;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+$content
+    </div>
+</body>
+</html>
+""")
+
+VERIFY_SUCCESS = Template("""\
+        <div class="success">✓</div>
+        <h1>Verification Successful!</h1>
+        <p>Welcome $name! Your email has been verified.</p>
+        <p>You can now close this window and continue using Better Calendar in WhatsApp.</p>""")
+
+VERIFY_FAILURE = Template("""\
+        <div class="error">✕</div>
+        <h1>Verification Failed</h1>
+        <p>$error_message</p>
+        <p>Please try again or contact support if the problem persists.</p>""")
+
+
+def render_verify_page(success: bool, name: str = '', error_message: str = '') -> str:
+    """Renders the /verify result page, escaping the given values"""
+    if success:
+        content = VERIFY_SUCCESS.substitute(name=html.escape(name))
+    else:
+        content = VERIFY_FAILURE.substitute(error_message=html.escape(error_message))
+    return VERIFY_TEMPLATE.substitute(content=content)
+
+
+class WebhookService:
+    """
+    Services and request handling shared by the Flask (app.py) and ASGI (asgi.py) entry points
+
+    Handlers take the request parameters (query string and form fields) and
+    return a Response, leaving HTTP and concurrency to the entry point.
+    """
+
+    def __init__(self):
+        # metrics
+        self.metrics = MetricsService()
+        self.stage_seconds = self.metrics.webhook_stage_seconds
+        self.request_seconds = self.metrics.histogram(
+            'webhook_request_seconds', 'Total time spent handling a webhook')
+        self.duplicate_deliveries = self.metrics.counter(
+            'webhook_duplicate_deliveries_total', 'Webhook retries answered from the idempotency cache')
+
+        # services
+        self.twilio = TwilioService(metrics=self.metrics)
+        sender = MessageSender(
+            self.send_with_metrics,
+            self.metrics,
+            dead_letter_path=os.getenv('OUTBOX_DEAD_LETTER_PATH', 'storage/dead_letters.jsonl')
+        )
+        self.outbox = OutboxService(sender, max_workers=int(os.getenv('OUTBOX_WORKERS', '4')), metrics=self.metrics)
+        self.user_service = UserService()
+        self.validation_service = ValidationService()
+        self.idempotency = IdempotencyService(
+            ttl=float(os.getenv('IDEMPOTENCY_TTL', '3600')),
+            max_entries=int(os.getenv('IDEMPOTENCY_MAX_ENTRIES', '10000')),
+            db_path=os.getenv('IDEMPOTENCY_SQLITE_PATH') or None
+        )
+
+        # Routing
+        self.router = configure_routes(RouterService(self.metrics))
+
+        self.twilio_status_log = logging.getLogger(TWILIO_STATUS_LOGGER)
+
+    def send_with_metrics(self, to: str, body: str):
+        with self.stage_seconds.time('twilio_send'):
+            return self.twilio.send(to, body)
+
+    def webhook(self, params: Mapping[str, str]) -> Response:
+        # Twilio retries deliveries it got no timely answer for; those must not be routed again
+        message_sid = params.get('MessageSid', '')
+        if message_sid:
+            first, cached_response = self.idempotency.begin(message_sid)
+            if not first:
+                self.duplicate_deliveries.inc()
+                logging.info("Duplicate delivery of %s", message_sid)
+                return 200, cached_response or "", TEXT
+
+        response = self.handle_webhook(params)
+        if message_sid:
+            self.idempotency.finish(message_sid, response)
+        return 200, response, TEXT
+
+    def handle_webhook(self, params: Mapping[str, str]) -> str:
+        # Get message details
+        incoming_msg = params.get('Body', '')
+        wa_id = params.get('WaId', '')
+        phone_number = params.get('From', '')
+        use_twilio = params.get('use_twilio', 'true').lower() == 'true'
+
+        # Log request details
+        logging.info("Message: %s", incoming_msg,
+                     extra={'wa_id': wa_id, 'phone_number': phone_number, 'use_twilio': use_twilio})
+
+        try:
+            response = self.router.route(incoming_msg, wa_id, phone_number)
+            logging.info("Response: %s", response, extra={'wa_id': wa_id})
+
+            # Only send via Twilio if use_twilio is True (throttled senders may get no reply at all)
+            if use_twilio and response:
+                self.outbox.enqueue(phone_number, response)
+                logging.info("Response queued for Twilio")
+            else:
+                logging.info("Skipping Twilio send")
+
+            return response
+
+        except Exception as e:
+            error_message = f"""🚨 Uhh Ohh, looks like there was an error: {str(e)} """
+            logging.error("Error occurred: %s", error_message, extra={'wa_id': wa_id})
+
+            if use_twilio:
+                self.outbox.enqueue(phone_number, error_message)
+
+            return error_message
+
+    def twilio_status(self, params: Mapping[str, str]) -> Response:
+        # Twilio calls this for every delivery status change of a message we sent
+        sid = params.get('MessageSid', '')
+        status = params.get('MessageStatus', '')
+        if not sid or not status:
+            return 400, "Missing MessageSid or MessageStatus", TEXT
+
+        self.twilio_status_log.info("Status update for %s: %s", sid, status)
+        self.twilio.delivery_status.record(
+            sid,
+            status,
+            error_code=params.get('ErrorCode'),
+            error_message=params.get('ErrorMessage'),
+            to=params.get('To')
+        )
+        return 204, "", TEXT
+
+    def metrics_page(self) -> Response:
+        return 200, self.metrics.render(), MetricsService.CONTENT_TYPE
+
+    def verify(self, params: Mapping[str, str]) -> Response:
+        # Get verification parameters
+        email = params.get('email', '')
+        code = params.get('code', '')
+
+        # Log verification attempt
+        logging.info("Verification attempt for email: %s", email)
+
+        try:
+            # reload users if the file changed
+            self.user_service.reload_if_changed()
+
+            # Validate email format
+            if not self.validation_service.validate_email(email):
+                return 200, render_verify_page(False, error_message="Invalid email format."), HTML
+
+            # Get user and verify code
+            user = self.user_service.users.get(email)
+            if not user:
+                return 200, render_verify_page(False, error_message="Email not found."), HTML
+
+            if user.validation_code != code:
+                logging.info("Invalid verification code for email: %s", email)
+                return 200, render_verify_page(False, error_message="Invalid verification code."), HTML
+
+            # If we have a WhatsApp ID stored, complete the verification
+            if user.wa_id:
+                self.user_service.link_whatsapp(email, user.wa_id, user.phone_number)
+
+            # Send success message through Twilio
+            self.outbox.enqueue(user.phone_number,
+                                "🎉 Your email has been verified! You can now use Better Calendar in WhatsApp.")
+
+            return 200, render_verify_page(True, name=user.first_name), HTML
+
+        except Exception as e:
+            logging.error("Error during verification: %s", e)
+            return 200, render_verify_page(
+                False, error_message="An error occurred during verification. Please try again."), HTML
+
+    def shutdown(self) -> None:
+        """Delivers what is still queued and closes the idempotency store"""
+        self.outbox.shutdown()
+        self.idempotency.close()
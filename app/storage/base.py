@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+from app.models.change_set import ChangeSet
+from app.models.event import Event
+from app.models.user import User
+
+
+class EventStorage(ABC):
+    """Persistence backend for EventService"""
+
+    # Bumped on every load and save, so callers can key caches on it
+    version: int = 0
+
+    @abstractmethod
+    def load(self) -> List[Event]:
+        """Reads all stored events"""
+
+    @abstractmethod
+    def has_changed(self) -> bool:
+        """Checks whether another writer changed the data since the last load or save"""
+
+    @abstractmethod
+    def save(self, events: Iterable[Event], changes: Optional[ChangeSet] = None) -> None:
+        """
+        Persists events
+
+        Args:
+            events: The complete, current events, to be iterated at most once
+                (only backends rewriting everything need them)
+            changes: The rows touched since the last save. None means the whole
+                list should be written.
+        """
+
+
+class UserStorage(ABC):
+    """Persistence backend for UserService"""
+
+    version: int = 0
+
+    @abstractmethod
+    def load(self) -> List[User]:
+        """Reads all stored users"""
+
+    @abstractmethod
+    def has_changed(self) -> bool:
+        """Checks whether another writer changed the data since the last load or save"""
+
+    @abstractmethod
+    def save(self, users: List[User], changed: Optional[List[User]] = None) -> None:
+        """
+        Persists users
+
+        Args:
+            users: The complete, current list of users
+            changed: The users touched since the last save. None means the
+                whole list should be written.
+        """
@@ -0,0 +1,28 @@
+import os
+from app.storage.base import EventStorage, UserStorage
+from app.storage.json_storage import JsonEventStorage, JsonUserStorage
+
+DEFAULT_SQLITE_PATH = 'storage/better_calendar.db'
+
+
+def _backend() -> str:
+    return os.getenv('STORAGE_BACKEND', 'json').lower()
+
+
+def create_event_storage(file_path: str = 'storage/events.json') -> EventStorage:
+    """Creates the event storage selected by STORAGE_BACKEND (json, journal or sqlite)"""
+    if _backend() == 'sqlite':
+        from app.storage.sqlite_storage import SqliteEventStorage
+        return SqliteEventStorage(os.getenv('SQLITE_PATH', DEFAULT_SQLITE_PATH))
+    if _backend() == 'journal':
+        from app.storage.journal_storage import JournalEventStorage
+        return JournalEventStorage(file_path, int(os.getenv('JOURNAL_COMPACT_AFTER', '500')))
+    return JsonEventStorage(file_path)
+
+
+def create_user_storage(file_path: str = 'storage/users.json') -> UserStorage:
+    """Creates the user storage selected by STORAGE_BACKEND (users stay in JSON for the journal backend)"""
+    if _backend() == 'sqlite':
+        from app.storage.sqlite_storage import SqliteUserStorage
+        return SqliteUserStorage(os.getenv('SQLITE_PATH', DEFAULT_SQLITE_PATH))
+    return JsonUserStorage(file_path)
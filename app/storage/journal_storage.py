@@ -0,0 +1,123 @@
+import json
+import logging
+import os
+from typing import Dict, Iterable, List, Optional
+from app.models.change_set import ChangeSet
+from app.models.event import Event
+from app.services.file_watcher import FileWatcher
+from app.storage.base import EventStorage
+from app.storage.json_storage import JsonEventStorage
+
+
+class JournalEventStorage(EventStorage):
+    """
+    Stores events as a JSON snapshot plus an append-only journal of changes
+
+    Every save appends one line per added, updated or removed event to
+    ``<file_path>.journal``, so its cost does not depend on the calendar size.
+    Loading replays the journal on top of the snapshot. Once the journal holds
+    ``compact_after`` entries, a fresh snapshot is written atomically and the
+    journal is truncated.
+
+    Replay is idempotent (entries are keyed by event id), so a crash between
+    writing the snapshot and truncating the journal is harmless. A torn last
+    journal line from a crash mid-append is cut off on the next load; an
+    unreadable line followed by others is corruption, and loading fails with
+    a ValueError instead of dropping the entries after it.
+    """
+
+    def __init__(self, file_path: str = 'storage/events.json', compact_after: int = 500):
+        self.file_path = file_path
+        self.journal_path = f"{file_path}.journal"
+        self.compact_after = compact_after
+        self.snapshot = JsonEventStorage(file_path)
+        self.journal_watcher = FileWatcher(self.journal_path)
+        self.journal_entries = 0
+        self.version = 0
+
+    def load(self) -> List[Event]:
+        events: Dict[str, Event] = {event.id: event for event in self.snapshot.load()}
+
+        signature = self.journal_watcher.signature()
+        self.journal_entries = 0
+        good_bytes = 0
+        torn = False
+        try:
+            with open(self.journal_path, 'rb') as journal:
+                for line in journal:
+                    try:
+                        # Every complete entry ends with a newline; anything else was cut off mid-write
+                        if not line.endswith(b'\n'):
+                            raise ValueError("missing newline")
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Only the last line can be torn by a crash
+                        if next(journal, None) is not None:
+                            raise ValueError(f"Corrupt journal entry in {self.journal_path} at byte {good_bytes}, "
+                                             f"followed by further entries; repair or move the journal aside")
+                        torn = True
+                        break
+                    self._replay(events, entry)
+                    self.journal_entries += 1
+                    good_bytes += len(line)
+        except FileNotFoundError:
+            pass
+
+        if torn:
+            # Cut the torn entry off, so later appends do not end up glued to it
+            logging.warning("Truncating torn journal entry in %s at byte %d", self.journal_path, good_bytes)
+            with open(self.journal_path, 'r+b') as journal:
+                journal.truncate(good_bytes)
+                journal.flush()
+                os.fsync(journal.fileno())
+            signature = self.journal_watcher.signature()
+        self.journal_watcher.mark_synced(signature)
+
+        self.version += 1
+        return list(events.values())
+
+    @staticmethod
+    def _replay(events: Dict[str, Event], entry: dict) -> None:
+        if entry['op'] == 'remove':
+            events.pop(entry['id'], None)
+        else:
+            event = Event.from_dict(entry['event'])
+            events[event.id] = event
+
+    def has_changed(self) -> bool:
+        return self.snapshot.has_changed() or self.journal_watcher.has_changed()
+
+    def save(self, events: Iterable[Event], changes: Optional[ChangeSet] = None) -> None:
+        if changes is None:
+            self.compact(events)
+            return
+
+        lines = [json.dumps({'op': 'add', 'event': event.to_dict()}) for event in changes.added]
+        lines += [json.dumps({'op': 'update', 'event': event.to_dict()}) for event in changes.updated]
+        lines += [json.dumps({'op': 'remove', 'id': event.id}) for event in changes.removed]
+
+        with open(self.journal_path, 'a') as journal:
+            journal.write(''.join(f"{line}\n" for line in lines))
+            journal.flush()
+            os.fsync(journal.fileno())
+        self.journal_watcher.mark_synced()
+        self.journal_entries += len(lines)
+        self.version += 1
+
+        if self.journal_entries >= self.compact_after:
+            self.compact(events)
+
+    def compact(self, events: Iterable[Event]) -> None:
+        """Writes a fresh snapshot atomically and truncates the journal"""
+        temp_path = f"{self.file_path}.tmp"
+        with open(temp_path, 'w') as json_file:
+            json.dump([event.to_dict() for event in events], json_file, indent=4)
+            json_file.flush()
+            os.fsync(json_file.fileno())
+        os.replace(temp_path, self.file_path)
+        self.snapshot.watcher.mark_synced()
+
+        open(self.journal_path, 'w').close()
+        self.journal_watcher.mark_synced()
+        self.journal_entries = 0
+        self.version += 1
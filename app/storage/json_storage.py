@@ -0,0 +1,81 @@
+import json
+from typing import Iterable, List, Optional
+from app.models.change_set import ChangeSet
+from app.models.event import Event
+from app.models.user import User
+from app.services.file_watcher import FileWatcher
+from app.storage.base import EventStorage, UserStorage
+
+
+class JsonEventStorage(EventStorage):
+    """Stores all events as one JSON array, rewritten on every save"""
+
+    def __init__(self, file_path: str = 'storage/events.json'):
+        self.file_path = file_path
+        self.watcher = FileWatcher(file_path)
+
+    @property
+    def version(self) -> int:
+        return self.watcher.version
+
+    def load(self) -> List[Event]:
+        signature = self.watcher.signature()
+        try:
+            with open(self.file_path, 'r') as json_file:
+                events_data = json.load(json_file)
+                # Convert existing events to include new fields
+                for event_data in events_data:
+                    if 'source' not in event_data:
+                        event_data['source'] = 'better-calendar'
+                    if 'source_id' not in event_data:
+                        event_data['source_id'] = event_data.get('id', '')
+
+                events = [Event.from_dict(event_data) for event_data in events_data]
+        except (FileNotFoundError, json.JSONDecodeError):
+            events = []
+        self.watcher.mark_synced(signature)
+        return events
+
+    def has_changed(self) -> bool:
+        return self.watcher.has_changed()
+
+    def save(self, events: Iterable[Event], changes: Optional[ChangeSet] = None) -> None:
+        with open(self.file_path, 'w') as json_file:
+            json.dump([event.to_dict() for event in events], json_file, indent=4)
+        self.watcher.mark_synced()
+
+
+class JsonUserStorage(UserStorage):
+    """Stores all users as one JSON array, rewritten on every save"""
+
+    def __init__(self, file_path: str = 'storage/users.json'):
+        self.file_path = file_path
+        self.watcher = FileWatcher(file_path)
+
+    @property
+    def version(self) -> int:
+        return self.watcher.version
+
+    def load(self) -> List[User]:
+        signature = self.watcher.signature()
+        try:
+            with open(self.file_path, 'r') as file:
+                users = [User.from_dict(user_data) for user_data in json.load(file)]
+        except FileNotFoundError:
+            raise ValueError(f"Error: The file '{self.file_path}' was not found.")
+        except json.JSONDecodeError:
+            raise ValueError(f"Error: The file '{self.file_path}' is not a valid JSON.")
+        self.watcher.mark_synced(signature)
+        return users
+
+    def has_changed(self) -> bool:
+        return self.watcher.has_changed()
+
+    def save(self, users: List[User], changed: Optional[List[User]] = None) -> None:
+        with open(self.file_path, 'w') as file:
+            json.dump(
+                [user.to_dict() for user in users],
+                file,
+                indent=4
+            )
+        self.watcher.mark_synced()
@@ -0,0 +1,209 @@
+import sqlite3
+import threading
+from typing import Iterable, List, Optional
+from app.models.change_set import ChangeSet
+from app.models.event import Event
+from app.models.user import User
+from app.storage.base import EventStorage, UserStorage
+
+EVENT_COLUMNS = ('id', 'name', 'description', 'start_date', 'start_time',
+                 'end_date', 'end_time', 'source', 'source_id')
+
+USER_COLUMNS = ('email', 'first_name', 'last_name', 'phone_number', 'wa_id',
+                'reminder', 'validation_code')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    description TEXT,
+    start_date TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    start_ts INTEGER NOT NULL,
+    end_ts INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    source_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_events_start_ts ON events (start_ts);
+CREATE INDEX IF NOT EXISTS idx_events_source ON events (source, source_id);
+
+CREATE TABLE IF NOT EXISTS users (
+    email TEXT PRIMARY KEY,
+    first_name TEXT,
+    last_name TEXT,
+    phone_number TEXT,
+    wa_id TEXT,
+    reminder INTEGER,
+    validation_code TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_users_wa_id ON users (wa_id);
+
+-- Bumped inside every save, so a write to one table does not make readers of the other reload
+CREATE TABLE IF NOT EXISTS meta (
+    table_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (table_name, version) VALUES ('events', 0), ('users', 0);
+"""
+
+
+def connect(db_path: str, schema: str = SCHEMA) -> sqlite3.Connection:
+    """Opens a connection in WAL mode, so several worker processes can share the database"""
+    connection = sqlite3.connect(db_path, timeout=30, check_same_thread=False, isolation_level=None)
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(schema)
+    return connection
+
+
+class _SqliteStorage:
+    """
+    Shared connection handling and change detection for the SQLite backends
+
+    `PRAGMA data_version` cheaply tells whether another connection committed
+    anything. Only then is the table's row in `meta` read, to tell whether
+    that commit touched this storage's table.
+    """
+
+    TABLE = ''  # set by the subclasses
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.connection = connect(db_path)
+        self.lock = threading.Lock()
+        self.version = 0
+        self._data_version = None
+        self._table_version = None
+
+    def _current_data_version(self) -> int:
+        # Changes whenever another connection commits to the database
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def _current_table_version(self) -> int:
+        return self.connection.execute(
+            "SELECT version FROM meta WHERE table_name = ?", (self.TABLE,)
+        ).fetchone()[0]
+
+    def _bump_table_version(self) -> int:
+        """Marks the table as written; call inside the save transaction"""
+        self.connection.execute("UPDATE meta SET version = version + 1 WHERE table_name = ?", (self.TABLE,))
+        return self._current_table_version()
+
+    def _mark_synced(self, data_version: int, table_version: Optional[int]) -> None:
+        # data_version is read before the transaction, so commits racing with it are checked again.
+        # A None table_version means another connection wrote to the table meanwhile: force a reload.
+        self._data_version = data_version if table_version is not None else None
+        if table_version is not None:
+            self._table_version = table_version
+        self.version += 1
+
+    def has_changed(self) -> bool:
+        with self.lock:
+            data_version = self._current_data_version()
+            if data_version == self._data_version:
+                return False
+            if self._current_table_version() != self._table_version:
+                return True
+            self._data_version = data_version  # only other tables were written
+            return False
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class SqliteEventStorage(_SqliteStorage, EventStorage):
+    """Stores events in SQLite, writing only the rows touched by each change"""
+
+    TABLE = 'events'
+
+    def load(self) -> List[Event]:
+        with self.lock:
+            data_version = self._current_data_version()
+            self.connection.execute("BEGIN")
+            try:
+                table_version = self._current_table_version()
+                rows = self.connection.execute(
+                    f"SELECT {', '.join(EVENT_COLUMNS)} FROM events ORDER BY start_ts"
+                ).fetchall()
+            finally:
+                self.connection.execute("COMMIT")
+            self._mark_synced(data_version, table_version)
+        return [Event.from_dict(dict(row)) for row in rows]
+
+    @staticmethod
+    def _row(event: Event) -> tuple:
+        return (*(getattr(event, column) for column in EVENT_COLUMNS),
+                event.start_timestamp, event.end_timestamp)
+
+    def save(self, events: Iterable[Event], changes: Optional[ChangeSet] = None) -> None:
+        upsert = (f"INSERT OR REPLACE INTO events ({', '.join(EVENT_COLUMNS)}, start_ts, end_ts) "
+                  f"VALUES ({', '.join('?' * (len(EVENT_COLUMNS) + 2))})")
+        with self.lock:
+            data_version = self._current_data_version()
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                # Another connection wrote rows we have not loaded (a full rewrite replaces them anyway)
+                stale = changes is not None and self._current_table_version() != self._table_version
+                if changes is None:
+                    self.connection.execute("DELETE FROM events")
+                    self.connection.executemany(upsert, (self._row(event) for event in events))
+                else:
+                    self.connection.executemany(
+                        "DELETE FROM events WHERE id = ?",
+                        [(event.id,) for event in changes.removed]
+                    )
+                    self.connection.executemany(
+                        upsert,
+                        [self._row(event) for event in changes.added + changes.updated]
+                    )
+                table_version = self._bump_table_version()
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+            self._mark_synced(data_version, None if stale else table_version)
+
+
+class SqliteUserStorage(_SqliteStorage, UserStorage):
+    """Stores users in SQLite, writing only the users touched by each change"""
+
+    TABLE = 'users'
+
+    def load(self) -> List[User]:
+        with self.lock:
+            data_version = self._current_data_version()
+            self.connection.execute("BEGIN")
+            try:
+                table_version = self._current_table_version()
+                rows = self.connection.execute(
+                    f"SELECT {', '.join(USER_COLUMNS)} FROM users"
+                ).fetchall()
+            finally:
+                self.connection.execute("COMMIT")
+            self._mark_synced(data_version, table_version)
+        return [User.from_dict(dict(row)) for row in rows]
+
+    def save(self, users: List[User], changed: Optional[List[User]] = None) -> None:
+        upsert = (f"INSERT OR REPLACE INTO users ({', '.join(USER_COLUMNS)}) "
+                  f"VALUES ({', '.join('?' * len(USER_COLUMNS))})")
+        with self.lock:
+            data_version = self._current_data_version()
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                stale = changed is not None and self._current_table_version() != self._table_version
+                if changed is None:
+                    self.connection.execute("DELETE FROM users")
+                    changed = users
+                self.connection.executemany(
+                    upsert,
+                    [tuple(getattr(user, column) for column in USER_COLUMNS) for user in changed]
+                )
+                table_version = self._bump_table_version()
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+            self._mark_synced(data_version, None if stale else table_version)
@@ -0,0 +1,162 @@
+"""
+asyncio-native entry point for the webhook service
+
+Run with any ASGI server, e.g.:
+
+    uvicorn asgi:app --host 0.0.0.0 --port 5000
+
+Connections are handled on the event loop. Routing and the controllers run on
+a bounded thread pool, so a slow command (e.g. !register sending its email)
+never blocks other conversations. Messages of one conversation are routed one
+after another, in the order they arrived. Replies are delivered by the outbox
+in the background, so requests never wait for Twilio.
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qsl
+from app.services.logging_service import configure_logging
+from app.services.webhook_service import TEXT, Response, WebhookService
+
+MAX_BODY_SIZE = 64 * 1024  # Twilio webhooks are a few KB at most
+
+# Set up logging
+configure_logging('asgi')
+
+# services, routing and metrics shared with app.py
+webhooks = WebhookService()
+routing_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('ASGI_ROUTING_THREADS', '32')),
+    thread_name_prefix='routing'
+)
+
+
+async def run_blocking(func, *args):
+    """Runs func(*args) on the routing pool"""
+    return await asyncio.get_running_loop().run_in_executor(routing_executor, func, *args)
+
+
+class ConversationLocks:
+    """One asyncio.Lock per conversation, dropped again once nobody holds or waits for it"""
+
+    def __init__(self):
+        self.locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
+
+    async def run(self, key: str, func, *args):
+        """Runs func(*args) on the routing pool after earlier calls for the same key finished"""
+        lock, users = self.locks.get(key, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self.locks[key] = (lock, users + 1)
+        try:
+            async with lock:
+                return await run_blocking(func, *args)
+        finally:
+            lock, users = self.locks[key]
+            if users == 1:
+                del self.locks[key]
+            else:
+                self.locks[key] = (lock, users - 1)
+
+
+conversations = ConversationLocks()
+webhooks.metrics.gauge('asgi_active_conversations', 'Conversations with a message being routed',
+                       lambda: len(conversations.locks))
+
+
+async def webhook(params: Dict[str, str]) -> Response:
+    # Messages of one conversation (and retries of them) are handled one after another
+    key = params.get('WaId', '') or params.get('From', '')
+    return await conversations.run(key, webhooks.webhook, params)
+
+
+async def twilio_status(params: Dict[str, str]) -> Response:
+    return webhooks.twilio_status(params)
+
+
+async def metrics_endpoint(params: Dict[str, str]) -> Response:
+    return webhooks.metrics_page()
+
+
+async def verify(params: Dict[str, str]) -> Response:
+    return await run_blocking(webhooks.verify, params)
+
+
+ROUTES = {
+    ('POST', '/webhook'): webhook,
+    ('POST', '/twilio/status'): twilio_status,
+    ('GET', '/metrics'): metrics_endpoint,
+    ('GET', '/verify'): verify,
+}
+
+
+async def _read_body(receive) -> bytes:
+    chunks: List[bytes] = []
+    size = 0
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            break
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > MAX_BODY_SIZE:
+            raise ValueError("Request body too large")
+        chunks.append(chunk)
+        if not message.get('more_body', False):
+            break
+    return b''.join(chunks)
+
+
+async def _respond(send, status: int, body: str, content_type: str) -> None:
+    payload = body.encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', content_type.encode('latin-1')),
+                    (b'content-length', str(len(payload)).encode('latin-1'))],
+    })
+    await send({'type': 'http.response.body', 'body': payload})
+
+
+async def _lifespan(receive, send) -> None:
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            # Deliver what is still queued before the process exits
+            await asyncio.get_running_loop().run_in_executor(None, webhooks.shutdown)
+            routing_executor.shutdown(wait=False)
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        await _lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    handler = ROUTES.get((scope['method'], scope['path']))
+    if handler is None:
+        await _respond(send, 404, "Not Found", TEXT)
+        return
+
+    started = time.perf_counter()
+    try:
+        body = await _read_body(receive)
+    except ValueError as e:
+        await _respond(send, 413, str(e), TEXT)
+        return
+
+    # Like Flask's request.values: query string, overridden by form fields
+    params = dict(parse_qsl(scope.get('query_string', b'').decode('latin-1')))
+    params.update(parse_qsl(body.decode('utf-8', errors='replace')))
+
+    status, text, content_type = await handler(params)
+    await _respond(send, status, text, content_type)
+    if handler is webhook:
+        webhooks.request_seconds.observe(time.perf_counter() - started)
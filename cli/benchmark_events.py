@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+import _strptime
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.event import Event, to_timestamp
+from app.services.columnar_event_index import ColumnarEventIndex
+from app.services.event_index import EventIndex
+
+
+@dataclass
+class LegacyEvent:
+    """The event model before parse-once/slots, re-parsing its strings on every use"""
+    id: str
+    name: str
+    description: str
+    start_date: str
+    start_time: str
+    end_date: str
+    end_time: str
+    source: str
+    source_id: str
+
+    def __post_init__(self):
+        uuid.UUID(self.id)
+
+    @property
+    def day_name(self) -> str:
+        return datetime.strptime(self.start_date, "%d.%m.%Y").strftime("%A")
+
+    def get_status(self) -> str:
+        now = datetime.now()
+        start_datetime = datetime.strptime(f"{self.start_date} {self.start_time}", "%d.%m.%Y %H:%M")
+        end_datetime = datetime.strptime(f"{self.end_date} {self.end_time}", "%d.%m.%Y %H:%M")
+        if now < start_datetime:
+            return "🔜 Upcoming"
+        elif start_datetime <= now <= end_datetime:
+            return "▶️ Ongoing"
+        return "✅ Finished"
+
+
+class StrptimeCounter:
+    """Counts datetime.strptime calls (they all go through _strptime._strptime_datetime)"""
+
+    def __init__(self):
+        self.calls = 0
+        self._original = _strptime._strptime_datetime
+
+    def __enter__(self):
+        def counting(*args, **kwargs):
+            self.calls += 1
+            return self._original(*args, **kwargs)
+        _strptime._strptime_datetime = counting
+        return self
+
+    def __exit__(self, *exc):
+        _strptime._strptime_datetime = self._original
+
+
+def synthetic_json(count: int) -> str:
+    """Events as stored in events.json"""
+    first_day = datetime(2025, 1, 6, 8, 0)
+    rows = []
+    for number in range(count):
+        start = first_day + timedelta(minutes=30 * number)
+        end = start + timedelta(minutes=25)
+        # Names repeat like the sessions of a few cohorts do
+        rows.append(dict(id=str(uuid.uuid4()), name=f"Cohort {number % 12} session", description='Synthetic event',
+                         start_date=start.strftime("%d.%m.%Y"), start_time=start.strftime("%H:%M"),
+                         end_date=end.strftime("%d.%m.%Y"), end_time=end.strftime("%H:%M"),
+                         source='better-calendar', source_id=f"synthetic-{number}"))
+    return json.dumps(rows)
+
+
+def measure(label: str, text: str, build, sort_key, starts_within, week) -> None:
+    with StrptimeCounter() as counter:
+        rows = json.loads(text)
+        started = time.perf_counter()
+        events = [build(row) for row in rows]
+        build_seconds = time.perf_counter() - started
+        build_calls = counter.calls
+
+        # What !events and the reminder/conflict paths do: sort, filter a week, render each listed event
+        started = time.perf_counter()
+        events.sort(key=sort_key)
+        listed = [event for event in events if starts_within(event, *week)]
+        rendered = [f"{event.get_status()} {event.day_name}" for event in listed]
+        query_seconds = time.perf_counter() - started
+        query_calls = counter.calls - build_calls
+    del rows, events
+    gc.collect()
+
+    # Memory: everything kept alive after loading events.json, per event
+    tracemalloc.start()
+    events = [build(row) for row in json.loads(text)]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = len(events)
+    print(f"{label}:")
+    print(f"  memory:   {memory / count:.0f} bytes/event ({memory / 2 ** 20:.1f} MiB)")
+    print(f"  build:    {build_seconds:.2f}s, {build_calls} strptime calls")
+    print(f"  query:    {query_seconds:.2f}s, {query_calls} strptime calls ({len(rendered)} events listed)")
+
+
+def measure_index(label: str, text: str, index_class, week) -> None:
+    """Memory of an index over events.json, and the time of the lookups EventService makes"""
+    gc.collect()
+    tracemalloc.start()
+    index = index_class([Event.from_dict(row) for row in json.loads(text)])
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(1000):
+        listed = index.between(*week)
+    list_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    for _ in range(1000):
+        index.find_conflict(week[0] + 60, week[0] + 3600)
+    conflict_seconds = time.perf_counter() - started
+
+    print(f"{label}:")
+    print(f"  memory:   {memory / len(index):.0f} bytes/event ({memory / 2 ** 20:.1f} MiB)")
+    print(f"  list week x1000:      {list_seconds:.3f}s ({len(listed)} events listed)")
+    print(f"  find conflict x1000:  {conflict_seconds:.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare memory and strptime use of the Event model and the event indexes')
+    parser.add_argument('--events', type=int, default=100_000, help='Number of synthetic events')
+    args = parser.parse_args()
+
+    text = synthetic_json(args.events)
+    week = (datetime(2025, 3, 3), datetime(2025, 3, 10))
+    week_timestamps = tuple(to_timestamp(day) for day in week)
+    legacy_start = lambda event: datetime.strptime(f"{event.start_date} {event.start_time}", "%d.%m.%Y %H:%M")
+    measure("legacy (dataclass, re-parsed strings)", text,
+            lambda row: LegacyEvent(**row),
+            legacy_start,
+            lambda event, first, last: first <= legacy_start(event) < last,
+            week)
+    measure("current (slots, parsed once)", text,
+            Event.from_dict,
+            lambda event: event.start_timestamp,
+            lambda event, first, last: first <= event.start_timestamp < last,
+            week_timestamps)
+    measure_index("sorted event index", text, EventIndex, week_timestamps)
+    measure_index("columnar event index", text, ColumnarEventIndex, week_timestamps)
+
+
+if __name__ == '__main__':
+    main()
@@ -40,7 +40,8 @@ def seed_events(seed_file: str = 'seeds/events_seed.json') -> None:
         added_events = 0
         skipped_events = 0
 
-        # Process each event
+        # Build events from the seed data
+        events = []
         for event_data in seed_data:
             try:
                 # Add source information
@@ -48,20 +49,22 @@ def seed_events(seed_file: str = 'seeds/events_seed.json') -> None:
                 event_data['source_id'] = ''  # Will be replaced with UUID
 
                 # Create event instance
-                event = Event.from_dict(event_data)
+                events.append(Event.from_dict(event_data))
 
-                # Add to storage
-                event_service.add_event(event)
-                added_events += 1
-                logging.info(f"Added event: {event.name}")
-
-            except ValueError as e:
-                skipped_events += 1
-                logging.warning(f"Skipped event due to conflict: {event_data.get('name')} - {str(e)}")
             except Exception as e:
                 skipped_events += 1
                 logging.error(f"Error processing event {event_data.get('name')}: {str(e)}")
 
+        # Add to storage in a single batch
+        report = event_service.add_events(events)
+        for result in report.results:
+            if result.accepted:
+                added_events += 1
+                logging.info(f"Added event: {result.event.name}")
+            else:
+                skipped_events += 1
+                logging.warning(f"Skipped event due to conflict: {result.event.name} - {result.error}")
+
         # Log summary
         logging.info(f"\nSeeding completed:")
         logging.info(f"Total events in seed file: {total_events}")
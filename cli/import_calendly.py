@@ -19,6 +19,8 @@ def main():
     parser.add_argument('--api-key', help='Calendly API key (optional if CALENDLY_API_KEY is set in .env)')
     parser.add_argument('--start-date', help='Start date (YYYY-MM-DD)', default=None)
     parser.add_argument('--end-date', help='End date (YYYY-MM-DD)', default=None)
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore the stored sync cursor and re-sync the whole window')
 
     args = parser.parse_args()
 
@@ -39,7 +41,7 @@ def main():
     else:
         end_date = args.end_date
 
-    result = sync_calendly_events(api_key, start_date, end_date)
+    result = sync_calendly_events(api_key, start_date, end_date, args.full)
     print(result)
 
 
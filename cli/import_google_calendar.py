@@ -20,6 +20,8 @@ def main():
                         help='Path to Google Calendar credentials.json (optional if GOOGLE_CREDENTIALS_PATH is set in .env)')
     parser.add_argument('--start-date', help='Start date (YYYY-MM-DD)', default=None)
     parser.add_argument('--end-date', help='End date (YYYY-MM-DD)', default=None)
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore the stored sync cursor and re-sync the whole window')
 
     args = parser.parse_args()
 
@@ -37,7 +39,7 @@ def main():
     else:
         end_date = args.end_date
 
-    result = sync_google_calendar(credentials_path, start_date, end_date)
+    result = sync_google_calendar(credentials_path, start_date, end_date, args.full)
     print(result)
 
 
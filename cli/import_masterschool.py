@@ -109,24 +109,27 @@ def download_calendar_events(output_file: str = 'storage/masterschool_events.jso
         events_added = 0
         events_skipped = 0
 
+        events = []
         for ms_event in data:
             try:
                 # Convert to our format
                 event_data = convert_ms_event(ms_event)
-                event = Event.from_dict(event_data)
+                events.append(Event.from_dict(event_data))
 
-                # Try to add the event
-                event_service.add_event(event)
-                events_added += 1
-                logging.info(f"Added event: {event.name}")
-
-            except ValueError as e:
-                events_skipped += 1
-                logging.warning(f"Skipped event due to conflict: {ms_event.get('title')} - {str(e)}")
             except Exception as e:
                 events_skipped += 1
                 logging.error(f"Error processing event {ms_event.get('title')}: {str(e)}")
 
+        # Add all events in a single batch
+        report = event_service.add_events(events)
+        for result in report.results:
+            if result.accepted:
+                events_added += 1
+                logging.info(f"Added event: {result.event.name}")
+            else:
+                events_skipped += 1
+                logging.warning(f"Skipped event due to conflict: {result.event.name} - {result.error}")
+
         logging.info(f"\nSync completed:")
         logging.info(f"Events added: {events_added}")
         logging.info(f"Events skipped: {events_skipped}")
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import time
+from typing import List, Tuple
+from urllib.parse import urlencode, urlsplit
+
+
+async def post(host: str, port: int, path: str, fields: dict) -> Tuple[int, float]:
+    """Sends one form POST over a fresh connection, returning (status, seconds)"""
+    body = urlencode(fields).encode('utf-8')
+    request = (
+        f"POST {path} HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\n"
+        "Content-Type: application/x-www-form-urlencoded\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    ).encode('latin-1') + body
+
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(request)
+        await writer.drain()
+        status_line = await reader.readline()
+        await reader.read()  # drain the response until the server closes
+    finally:
+        writer.close()
+    parts = status_line.split()
+    if len(parts) < 2:
+        raise ConnectionError("Connection closed without a response")
+    return int(parts[1]), time.perf_counter() - started
+
+
+async def conversation(host: str, port: int, path: str, number: int, messages: int, message: str,
+                       latencies: List[float], errors: List[str]) -> None:
+    """One simulated WhatsApp user sending `messages` messages, each after the previous reply"""
+    fields = {
+        'Body': message,
+        'WaId': f"load-{number}",
+        'From': f"whatsapp:+1555{number:07d}",
+        'use_twilio': 'false',
+    }
+    for _ in range(messages):
+        try:
+            status, seconds = await post(host, port, path, fields)
+            latencies.append(seconds)
+            if status != 200:
+                errors.append(f"HTTP {status}")
+        except (OSError, ValueError) as e:  # ValueError: malformed status line
+            errors.append(str(e))
+
+
+def percentile(sorted_values: List[float], share: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * share))]
+
+
+async def run(url: str, conversations: int, messages: int, message: str) -> None:
+    parts = urlsplit(url)
+    latencies: List[float] = []
+    errors: List[str] = []
+
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        conversation(parts.hostname, parts.port or 80, parts.path or '/webhook', number, messages, message,
+                     latencies, errors)
+        for number in range(conversations)
+    ))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"{url}: {conversations} conversations x {messages} messages in {elapsed:.2f}s")
+    print(f"  throughput: {len(latencies) / elapsed:.1f} requests/s, errors: {len(errors)}")
+    print(f"  latency p50: {percentile(latencies, 0.5) * 1000:.1f}ms, "
+          f"p95: {percentile(latencies, 0.95) * 1000:.1f}ms, "
+          f"p99: {percentile(latencies, 0.99) * 1000:.1f}ms, "
+          f"max: {(latencies[-1] if latencies else 0) * 1000:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Load test the webhook with many concurrent conversations. '
+                    'Run it once against the Flask app (python app.py) and once against '
+                    'the ASGI app (uvicorn asgi:app --port 5000) to compare them. '
+                    'Replies are not sent through Twilio (use_twilio=false).')
+    parser.add_argument('--url', help='Webhook URL', default='http://localhost:5000/webhook')
+    parser.add_argument('--conversations', help='Concurrent conversations', type=int, default=200)
+    parser.add_argument('--messages', help='Messages per conversation', type=int, default=10)
+    parser.add_argument('--message', help='Message text to send', default='!help')
+
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.conversations, args.messages, args.message))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import sys
+import logging
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.factory import DEFAULT_SQLITE_PATH
+from app.storage.json_storage import JsonEventStorage, JsonUserStorage
+from app.storage.sqlite_storage import SqliteEventStorage, SqliteUserStorage
+
+
+def migrate(events_file: str, users_file: str, db_path: str) -> None:
+    """
+    Copy events and users from the JSON files into a SQLite database
+
+    Existing rows in the database are replaced, so the migration can be re-run.
+    Afterwards, set STORAGE_BACKEND=sqlite (and SQLITE_PATH if not the default).
+    """
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+
+    events = JsonEventStorage(events_file).load()
+    event_storage = SqliteEventStorage(db_path)
+    event_storage.save(events)
+    logging.info(f"Migrated {len(events)} events to {db_path}")
+
+    users = JsonUserStorage(users_file).load()
+    user_storage = SqliteUserStorage(db_path)
+    user_storage.save(users)
+    logging.info(f"Migrated {len(users)} users to {db_path}")
+
+    event_storage.close()
+    user_storage.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Migrate JSON storage to SQLite')
+    parser.add_argument('--events', help='Path to events.json', default='storage/events.json')
+    parser.add_argument('--users', help='Path to users.json', default='storage/users.json')
+    parser.add_argument('--db', help='Path to the SQLite database',
+                        default=os.getenv('SQLITE_PATH', DEFAULT_SQLITE_PATH))
+
+    args = parser.parse_args()
+    migrate(args.events, args.users, args.db)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+import argparse
+import logging
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.event_service import EventService
+from app.services.logging_service import configure_logging
+from app.services.message_sender import MessageSender
+from app.services.metrics_service import MetricsService
+from app.services.reminder_dispatcher import ReminderDispatcher
+from app.services.reminder_scheduler import ReminderScheduler
+from app.services.twilio_service import TwilioService
+from app.services.user_service import UserService
+
+
+def write_metrics(metrics: MetricsService, file_path: str) -> None:
+    """Replaces the metrics file atomically, so the collector never reads a partial one"""
+    temp_path = f"{file_path}.tmp"
+    with open(temp_path, 'w') as metrics_file:
+        metrics_file.write(metrics.render())
+    os.replace(temp_path, file_path)
+
+
+def main():
+    """
+    Long-running worker sending event reminders over WhatsApp
+
+    Run exactly one instance next to the web app. Changes to events and
+    reminder settings are picked up from storage within --poll-interval seconds.
+    Reminders that could not be sent go to the same dead-letter file as the
+    webhook replies; the send metrics are written to --metrics-file after every
+    batch, for Prometheus' textfile collector.
+    """
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description='Send event reminders as they become due')
+    parser.add_argument('--events', help='Path to events.json', default='storage/events.json')
+    parser.add_argument('--users', help='Path to users.json', default='storage/users.json')
+    parser.add_argument('--sent', help='Path to the sent reminders, kept between runs',
+                        default=os.getenv('REMINDER_SENT_PATH', 'storage/sent_reminders.json'))
+    parser.add_argument('--workers', type=int, default=int(os.getenv('REMINDER_WORKERS', '16')),
+                        help='Reminders sent at once')
+    parser.add_argument('--poll-interval', type=float, default=float(os.getenv('REMINDER_POLL_INTERVAL', '60')),
+                        help='Max seconds between checks for changed events and reminder settings')
+    parser.add_argument('--dead-letters', help='File reminders that could not be sent are appended to',
+                        default=os.getenv('OUTBOX_DEAD_LETTER_PATH', 'storage/dead_letters.jsonl'))
+    parser.add_argument('--metrics-file', help='File the metrics are written to (Prometheus text format)',
+                        default=os.getenv('REMINDER_METRICS_PATH'))
+
+    args = parser.parse_args()
+    configure_logging('reminders')
+
+    metrics = MetricsService()
+    sender = MessageSender(TwilioService(metrics=metrics).send, metrics, dead_letter_path=args.dead_letters)
+    dispatcher = ReminderDispatcher(sender, max_workers=args.workers)
+
+    def dispatch(reminders):
+        dispatcher.dispatch(reminders)
+        if args.metrics_file:
+            write_metrics(metrics, args.metrics_file)
+
+    scheduler = ReminderScheduler(EventService(args.events), UserService(args.users), dispatch,
+                                  poll_interval=args.poll_interval, sent_path=args.sent)
+    logging.info("Scheduled %d reminders", len(scheduler))
+    try:
+        scheduler.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        dispatcher.shutdown()
+
+
+if __name__ == '__main__':
+    main()
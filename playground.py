@@ -1,14 +1,10 @@
+from app.services.logging_service import configure_logging
 from app.services.twilio_service import TwilioService
 import logging
 
 
 # Set up logging
-logging.basicConfig(
-    filename=f"logs\\log-playground.log",
-    level=logging.INFO,
-    format='%(asctime)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+configure_logging('playground')
 
 twilio_service = TwilioService()
 
@@ -16,7 +12,7 @@ twilio_service = TwilioService()
 
 def send_message(to: str, message: str):
     result = twilio_service.send(to, message)
-    logging.info(f"Message result: {result}")
+    logging.info("Message result: %s", result)
 
 
 
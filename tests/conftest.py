@@ -0,0 +1,74 @@
+import sys
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.event import Event
+
+# Helpers shared by the tests; import them with `from conftest import ...`
+
+
+def make_event(name, start_time='09:00', end_time='09:30', start_date='10.12.2024', end_date=None,
+               source='better-calendar', source_id='', event_id=None):
+    """An event on 10.12.2024 by default, with a fresh ID unless one is given"""
+    return Event(
+        id=event_id if event_id is not None else str(uuid.uuid4()),
+        name=name,
+        description='',
+        start_date=start_date,
+        start_time=start_time,
+        end_date=end_date or start_date,
+        end_time=end_time,
+        source=source,
+        source_id=source_id
+    )
+
+
+def event_at(name, start: datetime, end: datetime, **fields):
+    """make_event from datetimes"""
+    return make_event(name, start.strftime("%H:%M"), end.strftime("%H:%M"),
+                      start_date=start.strftime("%d.%m.%Y"), end_date=end.strftime("%d.%m.%Y"), **fields)
+
+
+class FakeClock:
+    """A clock that only moves when told to; also usable as `sleep`"""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeSender:
+    """Records sent messages and the peak number of concurrent sends"""
+
+    def __init__(self, delay=0.0, failing=()):
+        self.delay = delay
+        self.failing = set(failing)  # recipients or bodies whose delivery fails
+        self.lock = threading.Lock()
+        self.sent = []
+        self.active = 0
+        self.max_active = 0
+
+    def __call__(self, to, body):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if to in self.failing or body in self.failing:
+                raise RuntimeError("delivery failed")
+            with self.lock:
+                self.sent.append((to, body))
+        finally:
+            with self.lock:
+                self.active -= 1
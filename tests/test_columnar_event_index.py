@@ -0,0 +1,161 @@
+import sys
+import os
+import random
+import uuid
+import pytest
+from datetime import datetime, timedelta
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.event import to_timestamp
+from app.services import columnar_event_index
+from app.services.columnar_event_index import ColumnarEventIndex
+from app.services.event_index import EventIndex, create_event_index
+from app.services.event_service import EventService
+from app.storage.journal_storage import JournalEventStorage
+from conftest import event_at
+
+
+def random_events(count, seed=7):
+    # Overlapping and zero-length events included, like legacy data
+    rng = random.Random(seed)
+    first_day = datetime(2025, 1, 6, 8, 0)
+    events = []
+    for number in range(count):
+        start = first_day + timedelta(minutes=15 * rng.randrange(200))
+        end = start + timedelta(minutes=rng.choice([0, 15, 30, 90]))
+        events.append(event_at(f"Session {number % 5}", start, end,
+                               source_id=f"item-{number}" if number % 3 else ""))
+    return events
+
+
+def ids(events):
+    return [event.id for event in events]
+
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'array'])
+def use_numpy(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(columnar_event_index, 'numpy', None)
+    elif columnar_event_index.numpy is None:
+        pytest.skip("NumPy is not installed")
+
+
+def test_matches_event_index(use_numpy):
+    events = random_events(300)
+    sorted_index = EventIndex(events)
+    columnar = ColumnarEventIndex(events)
+
+    assert ids(columnar.events) == ids(sorted_index.events)
+    assert len(columnar) == len(sorted_index)
+
+    first = to_timestamp(datetime(2025, 1, 6, 7, 0))
+    for step in range(0, 60 * 60 * 60, 37 * 60):
+        for minutes in (0, 20, 120):
+            start, end = first + step, first + step + minutes * 60
+            assert ids(columnar.between(start, end)) == ids(sorted_index.between(start, end))
+            assert columnar.count_overlapping(start, end) == sorted_index.count_overlapping(start, end)
+            expected = sorted_index.find_conflict(start, end)
+            conflict = columnar.find_conflict(start, end)
+            assert (conflict.id if conflict else None) == (expected.id if expected else None)
+
+
+def test_materialized_events_equal_the_originals():
+    events = random_events(50)
+    columnar = ColumnarEventIndex(events)
+
+    for event in events:
+        stored = columnar.get(event.id)
+        assert stored == event
+        assert stored.start_timestamp == event.start_timestamp
+        assert stored.end_timestamp == event.end_timestamp
+        assert stored.to_dict() == event.to_dict()
+    assert columnar.get(str(uuid.uuid4())) is None
+
+
+def test_add_and_remove_keep_columns_in_sync(use_numpy):
+    events = random_events(120)
+    sorted_index = EventIndex()
+    columnar = ColumnarEventIndex()
+    for event in events:
+        sorted_index.add(event)
+        columnar.add(event)
+    for event in events[::2]:
+        sorted_index.remove(event)
+        columnar.remove(event)
+    columnar.remove(events[0])  # already gone
+
+    assert ids(columnar) == ids(sorted_index)
+    for event in events[1::2]:
+        assert columnar.get(event.id) == event
+    for event in events[::2]:
+        assert columnar.get(event.id) is None
+        assert columnar.get_by_source(event.source, event.source_id) is None
+
+
+def test_string_table_stays_bounded_under_churn():
+    columnar = ColumnarEventIndex()
+    kept = event_at('Kept', datetime(2025, 1, 6, 8, 0), datetime(2025, 1, 6, 8, 30))
+    columnar.add(kept)
+    first = datetime(2025, 1, 7, 8, 0)
+    for number in range(5000):
+        start = first + timedelta(days=number)
+        event = event_at(f"Synced {number}", start, start + timedelta(minutes=30))
+        columnar.add(event)
+        columnar.remove(event)
+
+    assert len(columnar._strings) <= 2 * len(columnar_event_index.INTERNED_FIELDS) * len(columnar) + 1024
+    assert columnar.get(kept.id) == kept
+
+
+def test_get_by_source():
+    imported = event_at('Imported', datetime(2025, 1, 6, 9, 0), datetime(2025, 1, 6, 9, 30),
+                        source='google', source_id='abc')
+    columnar = ColumnarEventIndex([imported, event_at('Local', datetime(2025, 1, 6, 10, 0), datetime(2025, 1, 6, 10, 30))])
+
+    assert columnar.get_by_source('google', 'abc') == imported
+    assert columnar.get_by_source('google', 'missing') is None
+    assert columnar.get_by_source('better-calendar', '') is None
+
+
+def test_event_service_with_columnar_index(tmp_path, monkeypatch):
+    monkeypatch.setenv('EVENT_INDEX', 'columnar')
+    assert isinstance(create_event_index(), ColumnarEventIndex)
+
+    event_service = EventService(str(tmp_path / 'events.json'))
+    standup = event_at('Standup', datetime(2024, 12, 10, 9, 0), datetime(2024, 12, 10, 9, 30))
+    event_service.add_event(standup)
+    event_service.add_event(event_at('Lecture', datetime(2024, 12, 10, 10, 0), datetime(2024, 12, 10, 11, 0)))
+
+    with pytest.raises(ValueError, match="Time Conflict: Standup on 10.12.2024 at 09:00 till 09:30"):
+        event_service.add_event(event_at('Overlap', datetime(2024, 12, 10, 8, 30), datetime(2024, 12, 10, 10, 30)))
+
+    event_service.remove_event(standup.id)
+    reloaded = EventService(event_service.file_path)
+    assert isinstance(reloaded.index, ColumnarEventIndex)
+    assert [event.name for event in reloaded.events] == ['Lecture']
+
+
+def test_list_events_only_builds_the_listed_rows(tmp_path):
+    events_file = str(tmp_path / 'events.json')
+    event_service = EventService(events_file, storage=JournalEventStorage(events_file), index=ColumnarEventIndex())
+    today = datetime.combine(datetime.now().date(), datetime.min.time())
+    event_service.add_events([event_at(f"Day {day}", today + timedelta(days=day, hours=9),
+                                        today + timedelta(days=day, hours=9, minutes=30))
+                              for day in range(-50, 50)])
+
+    built = []
+    materialize = event_service.index._materialize
+    event_service.index._materialize = lambda row: built.append(row) or materialize(row)
+
+    assert [event.name for event in event_service.list_events('today')] == ['Day 0']
+    assert len(built) == 1
+
+    # Appending to the journal needs only the change, not all stored events
+    event_service.add_event(event_at('Later', today + timedelta(days=60), today + timedelta(days=60, minutes=30)))
+    assert len(built) == 1
+
+
+if __name__ == '__main__':
+    pytest.main()
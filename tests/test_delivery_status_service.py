@@ -0,0 +1,64 @@
+import sys
+import os
+import pytest
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.delivery_status_service import DeliveryStatusService
+
+
+def test_latest_status_wins_and_is_persisted(tmp_path):
+    status_log = str(tmp_path / 'delivery_status.log')
+    delivery_status = DeliveryStatusService(status_log)
+    delivery_status.record('SM1', 'queued', to='whatsapp:+1')
+    delivery_status.record('SM1', 'delivered')
+    delivery_status.record('SM2', 'undelivered', error_code='63016', error_message='Outside window')
+
+    reloaded = DeliveryStatusService(status_log)
+    assert reloaded.get_status('SM1')['status'] == 'delivered'
+    assert reloaded.get_status('SM1')['to'] == 'whatsapp:+1'
+    assert reloaded.get_status('SM2')['error_code'] == '63016'
+    assert reloaded.get_status('SM3') is None
+
+
+def test_late_callbacks_do_not_move_the_status_back(tmp_path):
+    status_log = str(tmp_path / 'delivery_status.log')
+    delivery_status = DeliveryStatusService(status_log)
+    delivery_status.record('SM1', 'delivered', to='whatsapp:+1')
+    delivery_status.record('SM1', 'sent')
+    delivery_status.record('SM1', 'queued')  # what create() returned, recorded after the callbacks
+    delivery_status.record('SM2', 'failed', error_code='30008')
+    delivery_status.record('SM2', 'delivered')
+    delivery_status.record('SM3', 'delivered')
+    delivery_status.record('SM3', 'read')
+
+    reloaded = DeliveryStatusService(status_log)
+    for service in (delivery_status, reloaded):
+        assert service.get_status('SM1')['status'] == 'delivered'
+        assert service.get_status('SM2')['status'] == 'failed'
+        assert service.get_status('SM3')['status'] == 'read'
+
+
+def test_status_log_is_compacted(tmp_path):
+    status_log = tmp_path / 'delivery_status.log'
+    delivery_status = DeliveryStatusService(str(status_log), max_entries=10)
+    for number in range(3000):
+        delivery_status.record(f'SM{number % 10}', 'sent')
+
+    assert len(status_log.read_text().splitlines()) <= 2 * 1024
+    reloaded = DeliveryStatusService(str(status_log), max_entries=10)
+    assert reloaded.get_status('SM9')['status'] == 'sent'
+
+
+def test_memory_is_bounded():
+    delivery_status = DeliveryStatusService(max_entries=2)
+    for sid in ('SM1', 'SM2', 'SM3'):
+        delivery_status.record(sid, 'sent')
+
+    assert delivery_status.get_status('SM1') is None
+    assert delivery_status.get_status('SM3')['status'] == 'sent'
+
+
+if __name__ == '__main__':
+    pytest.main()
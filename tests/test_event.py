@@ -0,0 +1,56 @@
+import sys
+import os
+import pytest
+from datetime import datetime
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.event import Event, parse_timestamp, to_timestamp
+
+
+def make_row(**overrides):
+    row = {
+        'id': '3f1c9a2e-7d4b-4c1e-9a6f-2b8e5d7c1a90',
+        'name': 'Lecture',
+        'description': '<p>Intro</p>',
+        'start_date': '10.12.2024',
+        'start_time': '10:00',
+        'end_date': '10.12.2024',
+        'end_time': '11:30',
+        'source': 'better-calendar',
+        'source_id': ''
+    }
+    row.update(overrides)
+    return row
+
+
+def test_start_and_end_are_parsed_once_at_construction():
+    event = Event.from_dict(make_row())
+
+    assert event.start_timestamp == to_timestamp(datetime(2024, 12, 10, 10, 0))
+    assert event.end_timestamp == parse_timestamp('10.12.2024', '11:30')
+    assert event.start == datetime(2024, 12, 10, 10, 0)
+    assert event.day_name == 'Tuesday'
+    assert event.get_status() == "✅ Finished"
+
+
+def test_dict_round_trip_is_unchanged():
+    row = make_row()
+    assert Event.from_dict(row).to_dict() == row
+    assert Event.from_dict(row) == Event.from_dict(dict(row))
+
+
+def test_event_has_no_instance_dict():
+    assert not hasattr(Event.from_dict(make_row()), '__dict__')
+
+
+def test_invalid_dates_are_rejected():
+    with pytest.raises(ValueError):
+        Event.from_dict(make_row(start_date='31.02.2024'))
+    with pytest.raises(ValueError):
+        Event.from_dict(make_row(end_time=None))
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,59 @@
+import sys
+import os
+import pytest
+from datetime import datetime, timedelta
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.controllers.event_controller import EventController
+from app.models.event import to_timestamp
+from app.services.event_service import EventService
+from app.services.metrics_service import MetricsService
+from conftest import event_at
+
+
+@pytest.fixture()
+def event_controller(tmp_path):
+    # Skip __init__, which loads the real storage files
+    controller = EventController.__new__(EventController)
+    controller.event_service = EventService(str(tmp_path / 'events.json'))
+    controller._response_cache = {}
+    controller.stage_seconds = MetricsService().webhook_stage_seconds
+    return controller
+
+
+def test_rendered_response_is_cached_until_events_change(event_controller, monkeypatch):
+    far_future = datetime.now() + timedelta(days=400)
+    event_controller.event_service.add_event(event_at('Lecture', far_future, far_future + timedelta(hours=1)))
+
+    rendered = []
+    original = event_controller._render_events
+    monkeypatch.setattr(event_controller, '_render_events',
+                        lambda time_frame: rendered.append(time_frame) or original(time_frame))
+
+    first = event_controller.list_events(['today'], 'wa', 'phone')
+    assert event_controller.list_events(['today'], 'wa', 'phone') == first
+    assert rendered == ['today']
+
+    today = datetime.now().replace(hour=23, minute=0, second=0, microsecond=0)
+    event_controller.event_service.add_event(event_at('Late lecture', today, today + timedelta(minutes=30)))
+
+    assert 'Late lecture' in event_controller.list_events(['today'], 'wa', 'phone')
+    assert rendered == ['today', 'today']
+
+
+def test_status_boundary_is_next_start_or_end():
+    now = datetime(2024, 12, 10, 9, 15)
+    events = [
+        event_at('Finished', datetime(2024, 12, 10, 8, 0), datetime(2024, 12, 10, 9, 0)),
+        event_at('Ongoing', datetime(2024, 12, 10, 9, 0), datetime(2024, 12, 10, 9, 45)),
+        event_at('Upcoming', datetime(2024, 12, 10, 9, 30), datetime(2024, 12, 10, 10, 0)),
+    ]
+
+    assert EventController._status_boundary(events, to_timestamp(now)) == to_timestamp(datetime(2024, 12, 10, 9, 30))
+    assert EventController._status_boundary(events[:1], to_timestamp(now)) == float('inf')
+
+
+if __name__ == '__main__':
+    pytest.main()
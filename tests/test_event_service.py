@@ -0,0 +1,116 @@
+import sys
+import os
+import pytest
+from datetime import datetime, timedelta
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.event_service import EventService
+from conftest import make_event
+
+
+@pytest.fixture()
+def event_service(tmp_path):
+    return EventService(str(tmp_path / 'events.json'))
+
+
+def test_add_event_conflict(event_service):
+    event_service.add_event(make_event('Standup', '09:00', '09:30', '10.12.2024'))
+    event_service.add_event(make_event('Lecture', '10:00', '11:00', '10.12.2024'))
+
+    with pytest.raises(ValueError, match="Time Conflict: Standup on 10.12.2024 at 09:00 till 09:30"):
+        event_service.add_event(make_event('Overlap', '08:30', '10:30', '10.12.2024'))
+
+    with pytest.raises(ValueError, match="Time Conflict: Lecture on 10.12.2024 at 10:00 till 11:00"):
+        event_service.add_event(make_event('Inside', '10:15', '10:45', '10.12.2024'))
+
+
+def test_add_event_adjacent_is_not_a_conflict(event_service):
+    event_service.add_event(make_event('Standup', '09:00', '09:30', '10.12.2024'))
+    event_service.add_event(make_event('Follow-up', '09:30', '10:00', '10.12.2024'))
+    event_service.add_event(make_event('Before', '08:00', '09:00', '10.12.2024'))
+
+    assert [event.name for event in event_service.events] == ['Before', 'Standup', 'Follow-up']
+
+
+def test_remove_event_frees_the_slot(event_service):
+    event = make_event('Standup', '09:00', '09:30', '10.12.2024')
+    event_service.add_event(event)
+    event_service.remove_event(event.id)
+
+    event_service.add_event(make_event('Replacement', '09:00', '09:30', '10.12.2024'))
+    assert [e.name for e in event_service.events] == ['Replacement']
+
+
+def test_conflict_index_survives_reload(event_service):
+    event_service.add_event(make_event('Standup', '09:00', '09:30', '10.12.2024'))
+
+    reloaded = EventService(event_service.file_path)
+    with pytest.raises(ValueError, match="Time Conflict"):
+        reloaded.add_event(make_event('Overlap', '09:15', '09:45', '10.12.2024'))
+
+
+def test_add_events_reports_conflicts_within_batch_and_with_storage(event_service):
+    event_service.add_event(make_event('Standup', '09:00', '09:30', '10.12.2024'))
+
+    report = event_service.add_events([
+        make_event('Lecture', '10:00', '11:00', '10.12.2024'),
+        make_event('Clash with storage', '09:15', '09:45', '10.12.2024'),
+        make_event('Clash with batch', '10:30', '11:30', '10.12.2024'),
+        make_event('Early', '07:00', '08:00', '10.12.2024'),
+    ])
+
+    assert [event.name for event in report.accepted] == ['Lecture', 'Early']
+    assert [result.event.name for result in report.rejected] == ['Clash with storage', 'Clash with batch']
+    assert report.rejected[1].error.startswith("Time Conflict: Lecture")
+
+    reloaded = EventService(event_service.file_path)
+    assert [event.name for event in reloaded.events] == ['Early', 'Standup', 'Lecture']
+
+
+def test_list_events_slices_timeframe(event_service):
+    today = datetime.now()
+    tomorrow = today + timedelta(days=1)
+    event_service.add_events([
+        make_event('Late today', '22:00', '23:00', today.strftime("%d.%m.%Y")),
+        make_event('Tomorrow', '09:00', '10:00', tomorrow.strftime("%d.%m.%Y")),
+        make_event('Early today', '00:00', '01:00', today.strftime("%d.%m.%Y")),
+    ])
+
+    assert [event.name for event in event_service.list_events('today')] == ['Early today', 'Late today']
+    assert [event.name for event in event_service.list_events('tomorrow')] == ['Tomorrow']
+    assert len(event_service.list_events('all')) == 3
+
+
+def test_list_events_reloads_only_when_file_changed(event_service):
+    today = datetime.now().strftime("%d.%m.%Y")
+    event_service.add_event(make_event('Standup', '09:00', '09:30', today))
+    version = event_service.version
+
+    event_service.list_events('today')
+    assert event_service.version == version
+
+    other = EventService(event_service.file_path)
+    other.add_event(make_event('Lecture', '10:00', '11:00', today))
+
+    assert [event.name for event in event_service.list_events('today')] == ['Standup', 'Lecture']
+    assert event_service.version > version
+
+
+def test_lookups_by_id_and_source(event_service):
+    imported = make_event('Office hours', '14:00', '15:00', '10.12.2024', source='calendly', source_id='abc')
+    event_service.add_event(imported)
+
+    assert event_service.get_event_by_id(imported.id) is imported
+    assert event_service.get_event_by_source_id('calendly', 'abc') is imported
+    assert event_service.find_event_by_source_id('google', 'abc') is None
+
+    event_service.remove_event(imported.id)
+    assert event_service.find_event_by_source_id('calendly', 'abc') is None
+    with pytest.raises(ValueError, match="Event not found"):
+        event_service.get_event_by_id(imported.id)
+
+
+if __name__ == '__main__':
+    pytest.main()
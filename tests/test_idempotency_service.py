@@ -0,0 +1,59 @@
+import sys
+import os
+import pytest
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.idempotency_service import IdempotencyService
+from conftest import FakeClock
+
+
+def test_duplicate_gets_recorded_response():
+    service = IdempotencyService()
+
+    assert service.begin('SM1') == (True, None)
+    assert service.begin('SM1') == (False, None)  # first delivery still being handled
+    service.finish('SM1', "pong")
+    assert service.begin('SM1') == (False, "pong")
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock(1000.0)
+    service = IdempotencyService(ttl=60, clock=clock)
+    service.begin('SM1')
+    service.finish('SM1', "pong")
+
+    clock.now += 61
+    assert service.begin('SM1') == (True, None)
+
+
+def test_memory_is_bounded():
+    service = IdempotencyService(max_entries=2)
+    for sid in ('SM1', 'SM2', 'SM3'):
+        service.begin(sid)
+
+    assert len(service.entries) == 2
+    assert service.begin('SM1') == (True, None)
+
+
+def test_sqlite_backing_is_shared_between_instances(tmp_path):
+    db_path = str(tmp_path / 'test.db')
+    clock = FakeClock(1000.0)
+    first = IdempotencyService(ttl=60, db_path=db_path, clock=clock)
+    second = IdempotencyService(ttl=60, db_path=db_path, clock=clock)
+
+    assert first.begin('SM1') == (True, None)
+    assert second.begin('SM1') == (False, None)
+    first.finish('SM1', "pong")
+    assert IdempotencyService(ttl=60, db_path=db_path, clock=clock).begin('SM1') == (False, "pong")
+
+    clock.now += 61
+    assert second.begin('SM1') == (True, None)
+
+    for service in (first, second):
+        service.close()
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,78 @@
+import sys
+import os
+import json
+import pytest
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conftest import make_event
+from app.services.event_service import EventService
+from app.storage.journal_storage import JournalEventStorage
+
+
+@pytest.fixture()
+def events_file(tmp_path):
+    return str(tmp_path / 'events.json')
+
+
+def test_mutations_append_to_journal(events_file):
+    event_service = EventService(events_file, storage=JournalEventStorage(events_file))
+    standup = make_event('Standup', '09:00', '09:30')
+    event_service.add_event(standup)
+    event_service.add_event(make_event('Lecture', '10:00', '11:00'))
+    event_service.remove_event(standup.id)
+
+    assert not os.path.exists(events_file)
+    with open(f"{events_file}.journal") as journal:
+        assert len(journal.readlines()) == 3
+
+    reloaded = EventService(events_file, storage=JournalEventStorage(events_file))
+    assert [event.name for event in reloaded.events] == ['Lecture']
+
+
+def test_compaction_writes_snapshot_and_truncates_journal(events_file):
+    event_service = EventService(events_file, storage=JournalEventStorage(events_file, compact_after=2))
+    event_service.add_event(make_event('Standup', '09:00', '09:30'))
+    event_service.add_event(make_event('Lecture', '10:00', '11:00'))
+
+    with open(events_file) as snapshot:
+        assert [event['name'] for event in json.load(snapshot)] == ['Standup', 'Lecture']
+    assert os.path.getsize(f"{events_file}.journal") == 0
+
+    reloaded = EventService(events_file, storage=JournalEventStorage(events_file))
+    assert [event.name for event in reloaded.events] == ['Standup', 'Lecture']
+
+
+def test_torn_journal_line_is_ignored(events_file):
+    event_service = EventService(events_file, storage=JournalEventStorage(events_file))
+    event_service.add_event(make_event('Standup', '09:00', '09:30'))
+
+    with open(f"{events_file}.journal", 'a') as journal:
+        journal.write('{"op": "add", "event": {"id": "')
+
+    reloaded = EventService(events_file, storage=JournalEventStorage(events_file))
+    assert [event.name for event in reloaded.events] == ['Standup']
+
+    # Entries written after the crash must not be glued to the torn line
+    reloaded.add_event(make_event('Lecture', '10:00', '11:00'))
+    reloaded.add_event(make_event('Lab', '11:00', '12:00'))
+    again = EventService(events_file, storage=JournalEventStorage(events_file))
+    assert [event.name for event in again.events] == ['Standup', 'Lecture', 'Lab']
+
+
+def test_corrupt_entry_before_others_fails_loading(events_file):
+    event_service = EventService(events_file, storage=JournalEventStorage(events_file))
+    event_service.add_event(make_event('Standup', '09:00', '09:30'))
+    with open(f"{events_file}.journal", 'a') as journal:
+        journal.write('{"op": "add", "event": {"id": "\n')
+        journal.write(json.dumps({'op': 'add', 'event': make_event('Lecture', '10:00', '11:00').to_dict()}) + "\n")
+    size = os.path.getsize(f"{events_file}.journal")
+
+    with pytest.raises(ValueError, match="Corrupt journal entry"):
+        EventService(events_file, storage=JournalEventStorage(events_file))
+    assert os.path.getsize(f"{events_file}.journal") == size
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,63 @@
+import sys
+import os
+import atexit
+import json
+import logging
+import pytest
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.logging_service import (
+    JsonFormatter, SamplingFilter, TWILIO_STATUS_LOGGER, configure_logging
+)
+
+
+def make_record(name='app', msg='Hello %s', args=('Jane',), **extra):
+    record = logging.LogRecord(name, logging.INFO, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_includes_message_and_extra_fields():
+    entry = json.loads(JsonFormatter().format(make_record(wa_id='123')))
+
+    assert entry['message'] == 'Hello Jane'
+    assert entry['level'] == 'INFO'
+    assert entry['wa_id'] == '123'
+    assert 'args' not in entry
+
+
+def test_sampling_filter_only_samples_its_logger():
+    sampler = SamplingFilter(TWILIO_STATUS_LOGGER, 0.25)
+
+    kept = sum(sampler.filter(make_record(name=TWILIO_STATUS_LOGGER)) for _ in range(100))
+    assert kept == 25
+    assert all(sampler.filter(make_record(name='app')) for _ in range(10))
+
+
+def test_configure_logging_writes_json_lines(tmp_path):
+    root = logging.getLogger()
+    previous_handlers, previous_level = list(root.handlers), root.level
+    try:
+        listener = configure_logging('test', log_dir=str(tmp_path), level='INFO', twilio_status_sample_rate=0)
+        logging.info("Routing command: %s", '!help', extra={'wa_id': '123'})
+        logging.getLogger(TWILIO_STATUS_LOGGER).info("Status update for %s", 'SM1')
+        listener.stop()
+        atexit.unregister(listener.stop)
+
+        lines = (tmp_path / 'test.log').read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 1
+        entry = json.loads(lines[0])
+        assert entry['message'] == 'Routing command: !help'
+        assert entry['wa_id'] == '123'
+    finally:
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        for handler in previous_handlers:
+            root.addHandler(handler)
+        root.setLevel(previous_level)
+
+
+if __name__ == '__main__':
+    pytest.main()
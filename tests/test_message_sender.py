@@ -0,0 +1,56 @@
+import sys
+import os
+import json
+import pytest
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.reminder import Reminder
+from app.models.user import User
+from app.services.message_sender import MessageSender
+from app.services.metrics_service import MetricsService
+from app.services.outbox_service import OutboxService
+from app.services.reminder_dispatcher import ReminderDispatcher
+from conftest import FakeSender, make_event
+
+
+def test_failures_are_dead_lettered_and_reraised(tmp_path):
+    dead_letter_path = str(tmp_path / 'dead_letters.jsonl')
+    metrics = MetricsService()
+    sender = MessageSender(FakeSender(failing={"boom"}), metrics, dead_letter_path=dead_letter_path)
+
+    sender("user", "fine")
+    with pytest.raises(RuntimeError, match="delivery failed"):
+        sender("user", "boom")
+
+    with open(dead_letter_path) as dead_letters:
+        entries = [json.loads(line) for line in dead_letters]
+    assert [(entry['to'], entry['body'], entry['error']) for entry in entries] == [("user", "boom", "delivery failed")]
+
+    output = metrics.render()
+    assert 'messages_total{outcome="sent"} 1' in output
+    assert 'messages_total{outcome="failed"} 1' in output
+    assert 'message_send_seconds_count 2' in output
+
+
+def test_outbox_and_reminders_share_dead_letters(tmp_path):
+    dead_letter_path = str(tmp_path / 'dead_letters.jsonl')
+    sender = MessageSender(FakeSender(failing={"whatsapp:+1", "whatsapp:+2"}), dead_letter_path=dead_letter_path)
+
+    outbox = OutboxService(sender, max_workers=1)
+    outbox.enqueue("whatsapp:+1", "reply")
+    outbox.shutdown(wait=True)
+    dispatcher = ReminderDispatcher(sender, max_workers=1)
+    reminder = Reminder(0, User("jane@example.com", 'Jane', 'Smith', "whatsapp:+2", '2', 10),
+                        make_event('Lecture', '11:00', '12:00'), 10)
+    report = dispatcher.dispatch([reminder])
+    dispatcher.shutdown()
+
+    assert len(report.failed) == 1
+    with open(dead_letter_path) as dead_letters:
+        assert [json.loads(line)['to'] for line in dead_letters] == ["whatsapp:+1", "whatsapp:+2"]
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,77 @@
+import sys
+import os
+import pytest
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.metrics_service import MetricsService
+from app.services.router_service import RouterService
+
+
+def test_counter_renders_per_label():
+    metrics = MetricsService()
+    counter = metrics.counter('outcomes_total', 'Outcomes', ['outcome'])
+    counter.inc('ok')
+    counter.inc('ok')
+    counter.inc('handler_error')
+
+    output = metrics.render()
+    assert '# TYPE outcomes_total counter' in output
+    assert 'outcomes_total{outcome="ok"} 2' in output
+    assert 'outcomes_total{outcome="handler_error"} 1' in output
+
+
+def test_histogram_buckets_are_cumulative():
+    metrics = MetricsService()
+    histogram = metrics.histogram('latency_seconds', 'Latency', ['stage'], buckets=[0.1, 1.0])
+    histogram.observe(0.05, 'parse')
+    histogram.observe(0.5, 'parse')
+    histogram.observe(5.0, 'parse')
+
+    output = metrics.render()
+    assert 'latency_seconds_bucket{stage="parse",le="0.1"} 1' in output
+    assert 'latency_seconds_bucket{stage="parse",le="1.0"} 2' in output
+    assert 'latency_seconds_bucket{stage="parse",le="+Inf"} 3' in output
+    assert 'latency_seconds_count{stage="parse"} 3' in output
+    assert 'latency_seconds_sum{stage="parse"} 5.55' in output
+
+
+def test_same_name_returns_same_metric():
+    metrics = MetricsService()
+    assert metrics.counter('a_total', 'A') is metrics.counter('a_total', 'A')
+
+
+def test_gauge_reads_callback_at_render():
+    metrics = MetricsService()
+    depth = [3]
+    metrics.gauge('queue_depth', 'Depth', lambda: depth[0])
+    depth[0] = 7
+
+    assert 'queue_depth 7' in metrics.render()
+
+
+def test_router_records_stages_and_outcomes():
+    metrics = MetricsService()
+    router = RouterService(metrics)
+
+    def failing(args, wa_id, phone_number):
+        raise ValueError("boom")
+
+    router.register_command("!fail", failing, min_args=0, max_args=0, help_text="Fail")
+    router.public_commands.append("!fail")
+
+    router.route("!nope", '', '')
+    router.route("!help", '', '')
+    router.route("!fail", '', '')
+
+    output = metrics.render()
+    assert 'router_outcomes_total{outcome="unknown_command"} 1' in output
+    assert 'router_outcomes_total{outcome="handler_error"} 1' in output
+    assert 'router_outcomes_total{outcome="ok"} 1' in output
+    assert 'webhook_stage_seconds_count{stage="parse"} 3' in output
+    assert 'command_handler_seconds_count{command="!help"} 1' in output
+
+
+if __name__ == '__main__':
+    pytest.main()
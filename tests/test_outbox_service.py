@@ -0,0 +1,66 @@
+import sys
+import os
+import time
+import pytest
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.metrics_service import MetricsService
+from app.services.outbox_service import OutboxService
+from conftest import FakeSender
+
+
+def test_enqueue_returns_before_delivery_and_keeps_order_per_recipient():
+    sender = FakeSender(delay=0.01)
+    outbox = OutboxService(sender, max_workers=3)
+
+    started = time.monotonic()
+    messages = [outbox.enqueue(f"user-{i % 3}", f"message {i}") for i in range(12)]
+    assert time.monotonic() - started < 0.05
+
+    outbox.shutdown(wait=True)
+    assert all(message.status == "sent" for message in messages)
+    for recipient in range(3):
+        bodies = [body for to, body in sender.sent if to == f"user-{recipient}"]
+        assert bodies == [f"message {i}" for i in range(recipient, 12, 3)]
+    assert sender.max_active <= 3
+
+
+def test_failed_delivery_is_tracked():
+    sender = FakeSender(failing={"boom"})
+    outbox = OutboxService(sender, max_workers=1)
+
+    failed = outbox.enqueue("user", "boom")
+    delivered = outbox.enqueue("user", "fine")
+    outbox.shutdown(wait=True)
+
+    assert outbox.get_message(failed.id).status == "failed"
+    assert outbox.get_message(failed.id).error == "delivery failed"
+    assert delivered.status == "sent"
+    assert outbox.pending_count() == 0
+
+
+def test_failures_are_counted_and_metrics_exported():
+    metrics = MetricsService()
+    outbox = OutboxService(FakeSender(failing={"boom"}), max_workers=2, metrics=metrics)
+
+    outbox.enqueue("user", "boom")
+    outbox.enqueue("other", "fine")
+    outbox.shutdown(wait=True)
+
+    stats = outbox.stats()
+    assert stats['queued'] == 2
+    assert stats['sent'] == 1
+    assert stats['failed'] == 1
+    assert stats['queue_depth'] == 0
+    assert stats['in_flight'] == 0
+
+    output = metrics.render()
+    assert 'outbox_delivery_seconds_count 1' in output
+    assert 'outbox_queue_depth 0' in output
+    assert 'outbox_in_flight 0' in output
+
+
+if __name__ == '__main__':
+    pytest.main()
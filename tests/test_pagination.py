@@ -0,0 +1,44 @@
+import sys
+import os
+import time
+import pytest
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.pagination import prefetch
+
+
+def test_prefetch_yields_pages_in_order():
+    assert list(prefetch(iter([[1, 2], [3], []]))) == [[1, 2], [3], []]
+
+
+def test_prefetch_bounds_pages_in_flight():
+    fetched = []
+
+    def pages():
+        for number in range(10):
+            fetched.append(number)
+            yield [number]
+
+    stream = prefetch(pages(), max_in_flight=2)
+    assert next(stream) == [0]
+    time.sleep(0.3)
+    # One page handed out, two buffered, one blocked waiting for space
+    assert len(fetched) <= 4
+    assert list(stream) == [[number] for number in range(1, 10)]
+
+
+def test_prefetch_reraises_fetch_errors():
+    def pages():
+        yield [1]
+        raise ValueError("page 2 failed")
+
+    stream = prefetch(pages())
+    assert next(stream) == [1]
+    with pytest.raises(ValueError, match="page 2 failed"):
+        next(stream)
+
+
+if __name__ == '__main__':
+    pytest.main()
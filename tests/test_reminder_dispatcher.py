@@ -0,0 +1,52 @@
+import sys
+import os
+import pytest
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.reminder import Reminder
+from app.models.user import User
+from app.services.reminder_dispatcher import ReminderDispatcher
+from conftest import FakeSender, make_event
+
+
+def make_reminders(event_name, count, offset=10):
+    event = make_event(event_name, '11:00', '12:00')
+    return [Reminder(0, User(f"user{i}@example.com", 'Jane', 'Smith', f"whatsapp:+{i}", str(i), offset), event, offset)
+            for i in range(count)]
+
+
+def test_renders_once_per_event_and_offset(monkeypatch):
+    renders = []
+    original_render = Reminder.render
+    monkeypatch.setattr(Reminder, 'render', lambda self: renders.append(self) or original_render(self))
+    sender = FakeSender()
+    dispatcher = ReminderDispatcher(sender, max_workers=4)
+
+    report = dispatcher.dispatch(make_reminders('Lecture', 50) + make_reminders('Workshop', 30, offset=5))
+    dispatcher.shutdown()
+
+    assert len(renders) == 2
+    assert report.groups == 2
+    assert report.sent == 80
+    assert {body for _, body in sender.sent} == {renders[0].render(), renders[1].render()}
+
+
+def test_fans_out_in_parallel_with_bounded_concurrency():
+    sender = FakeSender(delay=0.01, failing={'whatsapp:+3'})
+    dispatcher = ReminderDispatcher(sender, max_workers=8)
+
+    report = dispatcher.dispatch(make_reminders('Lecture', 200))
+    dispatcher.shutdown()
+
+    assert sender.max_active <= 8
+    assert report.sent == 199
+    assert [result.reminder.user.phone_number for result in report.failed] == ['whatsapp:+3']
+    assert report.elapsed < 200 * 0.01 / 2
+    assert 0 < report.latency_percentile(0.95) <= report.latency_percentile(0.99) <= report.elapsed
+    assert report.throughput > 0
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,134 @@
+import sys
+import os
+import json
+import threading
+import pytest
+from dataclasses import replace
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.change_set import ChangeSet
+from app.models.event import parse_timestamp
+from app.services.event_service import EventService
+from app.services.reminder_scheduler import ReminderScheduler
+from app.services.user_service import UserService
+from conftest import FakeClock, make_event
+
+
+@pytest.fixture()
+def services(tmp_path):
+    users_file = tmp_path / 'users.json'
+    users_file.write_text(json.dumps([
+        {"email": "jane@example.com", "first_name": "Jane", "last_name": "Smith",
+         "phone_number": "whatsapp:+123", "wa_id": "123", "reminder": 10},
+        {"email": "john@example.com", "first_name": "John", "last_name": "Doe",
+         "phone_number": "whatsapp:+456", "wa_id": "456", "reminder": None},
+    ]))
+    event_service = EventService(str(tmp_path / 'events.json'))
+    event_service.add_events([make_event('Standup', '09:00', '09:30'), make_event('Lecture', '11:00', '12:00')])
+    return event_service, UserService(str(users_file))
+
+
+def test_builds_reminders_for_upcoming_events(services):
+    clock = FakeClock(parse_timestamp('10.12.2024', '10:00'))
+    scheduler = ReminderScheduler(*services, dispatch=lambda reminders: None, clock=clock)
+
+    assert len(scheduler) == 1  # the Standup already started, John has no reminder
+    assert scheduler.next_due() == parse_timestamp('10.12.2024', '10:50')
+    assert scheduler.pop_due(parse_timestamp('10.12.2024', '10:49')) == []
+
+    reminder, = scheduler.pop_due(parse_timestamp('10.12.2024', '10:50'))
+    assert (reminder.user.first_name, reminder.event.name, reminder.offset) == ('Jane', 'Lecture', 10)
+    assert len(scheduler) == 0
+
+
+def test_follows_event_and_reminder_changes(services):
+    event_service, user_service = services
+    clock = FakeClock(parse_timestamp('10.12.2024', '08:00'))
+    scheduler = ReminderScheduler(event_service, user_service, dispatch=lambda reminders: None, clock=clock)
+    assert len(scheduler) == 2
+
+    user_service.update_reminder('john@example.com', 5)
+    assert len(scheduler) == 4
+
+    user_service.update_reminder('jane@example.com', 15)
+    assert scheduler.next_due() == parse_timestamp('10.12.2024', '08:45')
+
+    event_service.add_event(make_event('Workshop', '14:00', '15:00'))
+    assert len(scheduler) == 6
+
+    standup = event_service.events[0]
+    event_service.remove_event(standup.id)
+    assert len(scheduler) == 4
+    assert scheduler.next_due() == parse_timestamp('10.12.2024', '10:45')
+
+
+def test_reload_without_changes_keeps_schedule(services):
+    event_service, user_service = services
+    clock = FakeClock(parse_timestamp('10.12.2024', '08:00'))
+    scheduler = ReminderScheduler(event_service, user_service, dispatch=lambda reminders: None, clock=clock)
+    heap_size = len(scheduler._heap)
+
+    event_service.load_events()
+    user_service.load_users_from_json()
+
+    assert len(scheduler) == 2
+    assert len(scheduler._heap) == heap_size
+
+
+def test_sent_reminders_are_not_requeued_by_unrelated_changes(services):
+    event_service, user_service = services
+    clock = FakeClock(parse_timestamp('10.12.2024', '10:55'))
+    scheduler = ReminderScheduler(event_service, user_service, dispatch=lambda reminders: None, clock=clock)
+    reminder, = scheduler.pop_due()
+
+    lecture = event_service.get_event_by_id(reminder.event.id)
+    event_service.apply_changes(ChangeSet(updated=[replace(lecture, description='Resynced')]))
+    user_service.link_whatsapp('jane@example.com', '789', 'whatsapp:+789')
+    assert scheduler.pop_due() == []
+
+    # A moved event gets a reminder for its new start
+    event_service.apply_changes(ChangeSet(updated=[replace(lecture, start_time='11:05', end_time='12:00')]))
+    reminder, = scheduler.pop_due()
+    assert reminder.event.start_time == '11:05'
+
+
+def test_restarted_scheduler_does_not_resend(services, tmp_path):
+    sent_path = str(tmp_path / 'sent_reminders.json')
+    clock = FakeClock(parse_timestamp('10.12.2024', '10:55'))
+    scheduler = ReminderScheduler(*services, dispatch=lambda reminders: None, clock=clock, sent_path=sent_path)
+    reminder, = scheduler.pop_due()
+
+    restarted = ReminderScheduler(*services, dispatch=lambda reminders: None, clock=clock, sent_path=sent_path)
+    assert len(restarted) == 0
+    assert restarted.pop_due() == []
+
+    # Once the event started its entry is no longer needed
+    clock.now = reminder.event.start_timestamp + 60
+    restarted.sync_events(None)
+    with open(sent_path) as sent_file:
+        assert json.load(sent_file) == []
+
+
+def test_worker_dispatches_due_reminders(services):
+    clock = FakeClock(parse_timestamp('10.12.2024', '10:55'))
+    dispatched = []
+    done = threading.Event()
+
+    def dispatch(reminders):
+        dispatched.extend(reminders)
+        done.set()
+
+    scheduler = ReminderScheduler(*services, dispatch=dispatch, poll_interval=0.1, clock=clock)
+    scheduler.start()
+    try:
+        assert done.wait(2)
+    finally:
+        scheduler.stop()
+
+    assert [reminder.event.name for reminder in dispatched] == ['Lecture']
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,82 @@
+import sys
+import os
+import pytest
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.user import User
+from app.services.router_service import RouterService
+
+
+class CountingUserService:
+    def __init__(self, users):
+        self.users = users
+        self.lookups = 0
+
+    def get_user_by_wa_id(self, wa_id):
+        self.lookups += 1
+        return self.users.get(wa_id)
+
+
+@pytest.fixture()
+def router():
+    router = RouterService()
+    router.user_service = CountingUserService({
+        '123': User(email='jane@example.com', first_name='Jane', last_name='Smith',
+                    phone_number='whatsapp:+123', wa_id='123')
+    })
+    return router
+
+
+def test_user_is_resolved_once_and_passed_to_context_handlers(router):
+    received = {}
+
+    def handler(args, wa_id, phone_number, context=None):
+        received['context'] = context
+        return "ok"
+
+    router.register_command("!whoami", handler, min_args=0, max_args=0, help_text="Who am I")
+
+    assert router.route("!whoami", '123', 'whatsapp:+123') == "ok"
+    assert received['context'].user.first_name == 'Jane'
+    assert received['context'].command == '!whoami'
+    assert router.user_service.lookups == 1
+
+
+def test_legacy_handlers_keep_working(router):
+    router.register_command("!ping", lambda args, wa_id, phone_number: f"pong {wa_id}",
+                            min_args=0, max_args=0, help_text="Ping")
+
+    assert router.route("!ping", '123', 'whatsapp:+123') == "pong 123"
+
+
+def test_help_reuses_resolved_user(router):
+    response = router.route("!help", '123', 'whatsapp:+123')
+
+    assert "User Commands" in response
+    assert router.user_service.lookups == 1
+
+
+def test_unregistered_user_is_rejected(router):
+    router.register_command("!ping", lambda args, wa_id, phone_number: "pong",
+                            min_args=0, max_args=0, help_text="Ping")
+
+    assert "Registration Required" in router.route("!ping", '999', 'whatsapp:+999')
+
+
+
+def test_flooding_sender_is_throttled_before_user_lookup(router):
+    router.register_command("!ping", lambda args, wa_id, phone_number: "pong",
+                            min_args=0, max_args=0, help_text="Ping", rate_limit=(2, 60))
+
+    responses = [router.route("!ping", '123', 'whatsapp:+123') for _ in range(4)]
+
+    assert responses[:2] == ["pong", "pong"]
+    assert responses[2] == RouterService.RATE_LIMITED_REPLY
+    assert responses[3] == ""
+    assert router.user_service.lookups == 2
+    assert router.route("!help", '123', 'whatsapp:+123') != RouterService.RATE_LIMITED_REPLY
+
+if __name__ == '__main__':
+    pytest.main()
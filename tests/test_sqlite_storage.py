@@ -0,0 +1,82 @@
+import sys
+import os
+import pytest
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conftest import make_event
+from app.models.user import User
+from app.services.event_service import EventService
+from app.services.user_service import UserService
+from app.storage.sqlite_storage import SqliteEventStorage, SqliteUserStorage
+
+
+@pytest.fixture()
+def db_path(tmp_path):
+    return str(tmp_path / 'calendar.db')
+
+
+def test_events_round_trip(db_path):
+    event_service = EventService(storage=SqliteEventStorage(db_path))
+    first = make_event('Standup', '09:00', '09:30')
+    event_service.add_events([make_event('Lecture', '10:00', '11:00', source='calendly', source_id='lecture'), first])
+    event_service.remove_event(first.id)
+
+    reloaded = EventService(storage=SqliteEventStorage(db_path))
+    assert [event.name for event in reloaded.events] == ['Lecture']
+    assert reloaded.get_event_by_source_id('calendly', 'lecture').name == 'Lecture'
+    with pytest.raises(ValueError, match="Time Conflict: Lecture"):
+        reloaded.add_event(make_event('Overlap', '10:30', '11:30'))
+
+
+def test_events_reload_on_write_from_other_connection(db_path):
+    event_service = EventService(storage=SqliteEventStorage(db_path))
+    assert not event_service.storage.has_changed()
+
+    other = EventService(storage=SqliteEventStorage(db_path))
+    other.add_event(make_event('Lecture', '10:00', '11:00'))
+
+    assert event_service.storage.has_changed()
+    assert [event.name for event in event_service.list_events('all')] == ['Lecture']
+    assert not event_service.storage.has_changed()
+
+
+def test_users_round_trip(db_path):
+    storage = SqliteUserStorage(db_path)
+    storage.save([User(email='jane@example.com', first_name='Jane', last_name='Smith')])
+
+    user_service = UserService(storage=storage)
+    user_service.link_whatsapp('jane@example.com', '123', 'whatsapp:+123')
+    user_service.update_reminder('jane@example.com', 10)
+
+    reloaded = UserService(storage=SqliteUserStorage(db_path))
+    user = reloaded.get_user_by_wa_id('123')
+    assert user.email == 'jane@example.com'
+    assert user.reminder == 10
+
+
+def test_writes_to_one_table_do_not_reload_the_other(db_path):
+    event_service = EventService(storage=SqliteEventStorage(db_path))
+    storage = SqliteUserStorage(db_path)
+    storage.save([User(email='jane@example.com', first_name='Jane', last_name='Smith')])
+    user_service = UserService(storage=storage)
+    event_version, user_version = event_service.version, user_service.version
+
+    user_service.link_whatsapp('jane@example.com', '123', 'whatsapp:+123')
+    event_service.add_event(make_event('Lecture', '10:00', '11:00'))
+
+    assert not event_service.storage.has_changed()
+    assert not user_service.storage.has_changed()
+    assert event_service.version == event_version + 1
+    assert user_service.version == user_version + 1
+
+    # A write by another connection to the same table is still noticed
+    other = EventService(storage=SqliteEventStorage(db_path))
+    other.add_event(make_event('Standup', '09:00', '09:30'))
+    assert event_service.storage.has_changed()
+    assert not user_service.storage.has_changed()
+
+
+if __name__ == '__main__':
+    pytest.main()
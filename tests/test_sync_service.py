@@ -0,0 +1,78 @@
+import sys
+import os
+import pytest
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.event_service import EventService
+from app.services.sync_service import SyncService
+from app.services.sync_state_service import SyncStateService
+from conftest import make_event
+
+
+def calendly_event(source_id, name, start_time='09:00', end_time='09:30'):
+    return make_event(name, start_time, end_time, source='calendly', source_id=source_id)
+
+
+@pytest.fixture()
+def event_service(tmp_path):
+    return EventService(str(tmp_path / 'events.json'))
+
+
+def test_resync_of_unchanged_window_writes_nothing(event_service):
+    sync_service = SyncService(event_service)
+    sync_service.sync('calendly', [calendly_event('a', 'Intro call'), calendly_event('b', 'Review', '10:00', '10:30')])
+    version = event_service.version
+
+    report = sync_service.sync('calendly', [calendly_event('a', 'Intro call'), calendly_event('b', 'Review', '10:00', '10:30')])
+
+    assert not report.applied
+    assert report.unchanged == 2
+    assert event_service.version == version
+
+
+def test_sync_updates_in_place_and_removes_cancelled(event_service):
+    sync_service = SyncService(event_service)
+    sync_service.sync('calendly', [calendly_event('a', 'Intro call'), calendly_event('b', 'Review', '10:00', '10:30')])
+    original_id = event_service.get_event_by_source_id('calendly', 'a').id
+
+    # Moving an event onto its own old slot must not count as a conflict
+    report = sync_service.sync('calendly', [calendly_event('a', 'Intro call', '09:15', '09:45')], cancelled_ids=['b'])
+
+    assert [event.source_id for event in report.applied.updated] == ['a']
+    assert [event.source_id for event in report.applied.removed] == ['b']
+    assert not report.applied.added
+    updated = event_service.get_event_by_source_id('calendly', 'a')
+    assert updated.id == original_id
+    assert updated.start_time == '09:15'
+    assert len(EventService(event_service.file_path).events) == 1
+
+
+def test_conflicting_update_keeps_stored_event(event_service):
+    sync_service = SyncService(event_service)
+    sync_service.sync('calendly', [calendly_event('a', 'Intro call'), calendly_event('b', 'Review', '10:00', '10:30')])
+
+    report = sync_service.sync('calendly', [calendly_event('a', 'Intro call', '09:45', '10:15')])
+
+    assert report.rejected[0].error.startswith("Time Conflict: Review")
+    assert event_service.get_event_by_source_id('calendly', 'a').start_time == '09:00'
+
+
+def test_sync_state_persists_cursors(tmp_path):
+    state_file = str(tmp_path / 'sync_state.json')
+    sync_state = SyncStateService(state_file)
+    assert sync_state.get('google') == {}
+
+    sync_state.update('google', sync_token='token-1', window_end='2024-12-31')
+    sync_state.update('google', sync_token='token-2')
+
+    reloaded = SyncStateService(state_file)
+    assert reloaded.get('google') == {'sync_token': 'token-2', 'window_end': '2024-12-31'}
+
+    reloaded.reset('google')
+    assert SyncStateService(state_file).get('google') == {}
+
+
+if __name__ == '__main__':
+    pytest.main()
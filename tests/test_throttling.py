@@ -0,0 +1,57 @@
+import sys
+import os
+import pytest
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.throttling import SlidingWindowLimiter, TokenBucket
+from conftest import FakeClock
+
+
+def test_token_bucket_allows_burst_then_paces():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_token_bucket_try_acquire_refills_over_time():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, capacity=1, clock=clock, sleep=clock.sleep)
+
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    clock.now += 1
+    assert bucket.try_acquire()
+
+
+
+def test_sliding_window_limits_per_key():
+    clock = FakeClock()
+    limiter = SlidingWindowLimiter(clock=clock)
+
+    assert [limiter.check('123', 2, 10) for _ in range(4)] == [0, 0, 1, 2]
+    assert limiter.check('456', 2, 10) == 0
+
+    clock.now += 10
+    assert limiter.check('123', 2, 10) == 0
+
+
+def test_sliding_window_evicts_idle_keys():
+    clock = FakeClock()
+    limiter = SlidingWindowLimiter(max_keys=3, clock=clock)
+    for key in ('a', 'b', 'c', 'd'):
+        limiter.check(key, 1, 10)
+    assert len(limiter) == 3
+
+    clock.now += 11
+    limiter.check('e', 1, 10)
+    assert len(limiter) == 1
+
+if __name__ == '__main__':
+    pytest.main()
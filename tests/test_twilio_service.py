@@ -0,0 +1,88 @@
+import sys
+import os
+import pytest
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("twilio")
+pytest.importorskip("dotenv")
+
+from twilio.base.exceptions import TwilioRestException
+from app.services.delivery_status_service import DeliveryStatusService
+from app.services.twilio_service import TwilioService
+
+
+class FakeMessage:
+    def __init__(self, sid, status='queued'):
+        self.sid = sid
+        self.status = status
+
+
+class FakeMessages:
+    """Local stand-in for client.messages that records create() calls"""
+
+    def __init__(self):
+        self.created = []
+        self.errors = []  # statuses to fail the next create() calls with
+
+    def create(self, **params):
+        if self.errors:
+            raise TwilioRestException(self.errors.pop(0), '/Messages', 'Fake error')
+        self.created.append(params)
+        return FakeMessage(f"SM{len(self.created)}")
+
+
+class FakeClient:
+    def __init__(self):
+        self.messages = FakeMessages()
+
+
+@pytest.fixture()
+def twilio_service(monkeypatch):
+    monkeypatch.setenv('TWILIO_ACCOUNT_SID', 'AC123')
+    monkeypatch.setenv('TWILIO_AUTH_TOKEN', 'token')
+    monkeypatch.setenv('TWILIO_PHONE_NUMBER', 'whatsapp:+100')
+    monkeypatch.setenv('TWILIO_STATUS_CALLBACK_URL', 'https://example.com/twilio/status')
+    return TwilioService(client=FakeClient(), delivery_status=DeliveryStatusService())
+
+
+def test_send_registers_status_callback_without_polling(twilio_service):
+    messages = twilio_service.send('whatsapp:+200', 'Hello')
+
+    created = twilio_service.client.messages.created
+    assert len(created) == 1
+    assert created[0]['status_callback'] == 'https://example.com/twilio/status'
+    assert twilio_service.delivery_status.get_status(messages[0].sid)['status'] == 'queued'
+
+
+def test_send_retries_rate_limited_and_server_errors(twilio_service, monkeypatch):
+    monkeypatch.setattr('app.services.twilio_service.time.sleep', lambda seconds: None)
+    twilio_service.client.messages.errors = [429, 503]
+
+    twilio_service.send('whatsapp:+200', 'Hello')
+
+    assert len(twilio_service.client.messages.created) == 1
+    assert twilio_service.retries.value() == 2
+
+
+def test_send_does_not_retry_client_errors(twilio_service):
+    twilio_service.client.messages.errors = [400]
+
+    with pytest.raises(TwilioRestException):
+        twilio_service.send('whatsapp:+200', 'Hello')
+    assert twilio_service.retries.value() == 0
+    assert twilio_service.failures.value() == 1
+
+
+def test_long_message_segments_are_numbered_and_returned_in_order(twilio_service):
+    messages = twilio_service.send('whatsapp:+200', ' '.join(['word'] * 1000))
+
+    bodies = sorted(params['body'] for params in twilio_service.client.messages.created)
+    assert len(messages) == len(bodies) == 4
+    assert [body[:5] for body in bodies] == ['(1/4)', '(2/4)', '(3/4)', '(4/4)']
+    assert all(len(body) <= TwilioService.MESSAGE_LIMIT for body in bodies)
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -1,5 +1,6 @@
 import sys
 import os
+import json
 import pytest
 
 # Add the project root directory to Python path
@@ -30,5 +31,29 @@ def test_get_user_by_wa_id_invalid(user_service):
     assert user_service.get_user_by_wa_id('00') is None, "Fail"
     assert user_service.get_user_by_wa_id(12) is None, "Fail"
 
+def test_reload_only_when_file_changed(tmp_path):
+    users_file = tmp_path / 'users.json'
+    users_file.write_text(json.dumps([
+        {"email": "jane@example.com", "first_name": "Jane", "last_name": "Smith", "wa_id": "123"}
+    ]))
+    user_service = UserService(str(users_file))
+    version = user_service.version
+
+    assert user_service.get_user_by_wa_id('123').first_name == 'Jane'
+    assert user_service.version == version
+
+    users_file.write_text(json.dumps([
+        {"email": "jane@example.com", "first_name": "Janet", "last_name": "Smith", "wa_id": "123"}
+    ]))
+    assert user_service.get_user_by_wa_id('123').first_name == 'Janet'
+    assert user_service.version > version
+
+    # Our own writes do not trigger a reload
+    user_service.update_reminder('jane@example.com', 10)
+    user = user_service.get_user_by_wa_id('123')
+    version = user_service.version
+    assert user_service.get_user_by_wa_id('123') is user
+    assert user_service.version == version
+
 if __name__ == '__main__':
     pytest.main()